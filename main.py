@@ -1,32 +1,55 @@
+# Imported first so the startup trace covers every other import
+from utils.profiler import startup_trace, frame_profiler, format_report, DEFAULT_TRACE_FILE
 import pygame
 import sys
-import random
-import math
 import asyncio
 from settings import *
+from utils.fonts import render_text, text_cache_stats, font_manager
+from ui.overlays import draw_overlay, draw_panel, overlay_cache_stats
+from ui.debug_overlay import draw_frame_profile
+from utils.rng import rng_service
+from utils.sprite_cache import sprite_cache
+from utils.lifecycle import lifecycle
 from sprites.bird import Bird
 from sprites.pipe import Pipe
 from sprites.background import Background, Ground
-from sprites.particles import ParticleSystem
+from sprites.particles import ParticleSystem, particle_atlas
 from sprites.collectibles import Coin, PowerUp
 from managers.score_manager import ScoreManager, GameDataManager
-from ui.menus import MainMenu, SettingsMenu, GameOverScreen, PauseScreen
-from ui.shop import ShopMenu
-from ui.minigames import MiniGameMenu, TimeAttackMode, ZenMode, DailyChallenge, LiXiHuntMode
+from managers.simulation import ClassicSimulation, TICK_MS
+from managers.replay import Replay, ReplayRecorder, ReplayPlayer, ReplayError, verify_replay
+from ui.menus import MainMenu
+from ui.dirty import DirtyRectTracker
+from ui.render_queue import RenderQueue, LAYER_WORLD, LAYER_PICKUPS
+from utils.registry import LazyRegistry, LazyAttribute
 
-
-from minigames.bird_battle import BirdBattle
-from minigames.dodge_master import DodgeMaster
-from minigames.memory_flight import MemoryFlight
-from minigames.boss_rush import BossRush
-from minigames.treasure_hunt import TreasureHunt
+startup_trace.mark("imports")
 
 class Game:
+    # Built on first use through self.registry
+    settings_menu = LazyAttribute()
+    game_over_screen = LazyAttribute()
+    pause_screen = LazyAttribute()
+    shop_menu = LazyAttribute()
+    minigame_menu = LazyAttribute()
+    time_attack = LazyAttribute()
+    zen_mode = LazyAttribute()
+    daily_challenge = LazyAttribute()
+    bird_battle = LazyAttribute()
+    dodge_master = LazyAttribute()
+    memory_flight = LazyAttribute()
+    boss_rush = LazyAttribute()
+    treasure_hunt = LazyAttribute()
+    lixi_hunt = LazyAttribute()
+    
     def __init__(self):
-        pygame.init()
+        with startup_trace.phase("pygame.init"):
+            pygame.init()
         pygame.display.set_caption(TITLE)
         
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        with startup_trace.phase("display"):
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.render_queue = RenderQueue(self.screen)
         self.clock = pygame.time.Clock()
         
 
@@ -37,102 +60,104 @@ class Game:
         self.game_mode = "classic"
         
 
-        self.score_manager = ScoreManager()
-        self.game_data = GameDataManager()
-        self.particle_system = ParticleSystem()
+        with startup_trace.phase("managers"):
+            self.score_manager = ScoreManager()
+            self.game_data = GameDataManager()
+            self.particle_system = ParticleSystem()
         
 
-        self.all_sprites = pygame.sprite.Group()
-        self.pipes = pygame.sprite.Group()
-        self.coins = pygame.sprite.Group()
-        self.powerups = pygame.sprite.Group()
+        self.sim = None
+        self.sim_accumulator = 0
+        self.jump_queued = False
+        self.recorder = None
+        self.playback = None
+        self.playback_replay = None
+        self.playback_speed = 1
         
 
-        self.background = Background(self.difficulty)
-        self.ground = Ground(self.difficulty)
+        with startup_trace.phase("background"):
+            self.background = Background(self.difficulty)
+            self.ground = Ground(self.difficulty)
         
 
         self.bird = None
         
 
-        self.init_ui()
-        
-
-        self.init_minigames()
+        self.registry = LazyRegistry()
+        self.menu_idle_time = 0
+        with startup_trace.phase("init_ui"):
+            self.init_ui()
         
 
-        from ui.menus import ScoreDisplay
-        self.score_display = ScoreDisplay(SCREEN_WIDTH // 2, 50)
-        self.hud_font = get_vn_font(28)
+        with startup_trace.phase("init_minigames"):
+            self.init_minigames()
         
 
-        self.last_pipe_spawn = 0
-        self.last_coin_spawn = 0
+        with startup_trace.phase("hud"):
+            from ui.menus import ScoreDisplay
+            self.score_display = ScoreDisplay(SCREEN_WIDTH // 2, 50)
+            self.hud_font = get_vn_font(28)
         
 
         self.coins_this_game = 0
         self.lixi_this_game = 0
         self.combo_count = 0
-        self.score_multiplier = 1.0
-        
-
-        self.has_coin_magnet = False
-        self.magnet_timer = 0
-        self.has_slow_motion = False
-        self.slow_timer = 0
-        self.has_score_boost = False
-        self.score_boost_timer = 0
-        self.has_lixi_magnet = False
-        self.lixi_magnet_timer = 0
         
 
         self.get_ready = False
         self.get_ready_timer = 0
         
+        self.dirty_tracker = DirtyRectTracker()
+        self.profile_output = None
+        
+
+        sprite_cache.save()
+        
     def init_ui(self):
         self.main_menu = MainMenu(self.screen, self.score_manager.get_high_score(self.difficulty), self.game_data.coins)
-        self.settings_menu = SettingsMenu(self.screen, self.difficulty)
-        self.game_over_screen = GameOverScreen(self.screen)
-        self.pause_screen = PauseScreen(self.screen)
-        self.shop_menu = ShopMenu(self.screen, self.game_data)
-        self.minigame_menu = MiniGameMenu(self.screen)
+        self.registry.register("minigame_menu", "ui.minigames:MiniGameMenu", self.screen)
+        self.registry.register("settings_menu", "ui.menus:SettingsMenu", self.screen, self.difficulty)
+        self.registry.register("shop_menu", "ui.shop:ShopMenu", self.screen, self.game_data)
+        self.registry.register("pause_screen", "ui.menus:PauseScreen", self.screen)
+        self.registry.register("game_over_screen", "ui.menus:GameOverScreen", self.screen)
         
     def init_minigames(self):
-        """Initialize all mini-games"""
-        self.time_attack = TimeAttackMode(self.screen, self.difficulty)
-        self.zen_mode = ZenMode(self.screen)
-        self.daily_challenge = DailyChallenge(self.screen)
+        """Register all mini-games; each is built when first entered or prewarmed"""
+        self.registry.register("time_attack", "ui.minigames:TimeAttackMode", self.screen, self.difficulty)
+        self.registry.register("zen_mode", "ui.minigames:ZenMode", self.screen)
+        self.registry.register("daily_challenge", "ui.minigames:DailyChallenge", self.screen)
         
 
-        self.bird_battle = BirdBattle(self.screen, self.difficulty)
-        self.dodge_master = DodgeMaster(self.screen, self.difficulty)
-        self.memory_flight = MemoryFlight(self.screen, self.difficulty)
-        self.boss_rush = BossRush(self.screen, self.difficulty)
-        self.treasure_hunt = TreasureHunt(self.screen, self.difficulty)
+        self.registry.register("bird_battle", "minigames.bird_battle:BirdBattle", self.screen, self.difficulty)
+        self.registry.register("dodge_master", "minigames.dodge_master:DodgeMaster", self.screen, self.difficulty)
+        self.registry.register("memory_flight", "minigames.memory_flight:MemoryFlight", self.screen, self.difficulty)
+        self.registry.register("boss_rush", "minigames.boss_rush:BossRush", self.screen, self.difficulty)
+        self.registry.register("treasure_hunt", "minigames.treasure_hunt:TreasureHunt", self.screen, self.difficulty)
         
 
         if TET_MODE:
-            self.lixi_hunt = LiXiHuntMode(self.screen, self.difficulty)
+            self.registry.register("lixi_hunt", "ui.minigames:LiXiHuntMode", self.screen, self.difficulty)
         
-    def new_game(self):
-        """Start new game based on mode"""
+    def prewarm_idle(self):
+        """Build one pending menu or mode per frame once the menu has been idle a while"""
+        self.menu_idle_time += self.dt
+        if LAZY_PREWARM and self.menu_idle_time >= PREWARM_DELAY:
+            self.registry.prewarm_step()
+        
+    def new_game(self, seed=None):
+        """Start new game based on mode; seed fixes the run's random streams"""
 
-        self.all_sprites.empty()
-        self.pipes.empty()
-        self.coins.empty()
-        self.powerups.empty()
+        self.sim = None
+        self.recorder = None
+        self.playback = None
         self.particle_system.clear()
+        rng_service.reseed(seed)
         
 
         self.score_manager.reset_current_score()
         self.coins_this_game = 0
         self.lixi_this_game = 0
         self.combo_count = 0
-        self.score_multiplier = 1.0
-        self.has_coin_magnet = False
-        self.has_slow_motion = False
-        self.has_score_boost = False
-        self.has_lixi_magnet = False
         
         skin = self.game_data.current_skin
         
@@ -160,20 +185,23 @@ class Game:
         elif self.game_mode == "lixi_hunt" and TET_MODE:
             self.lixi_hunt.start()
             self.bird = Bird(self.difficulty, skin)
-            self.all_sprites.add(self.bird)
-            self.apply_skin_abilities(skin)
+            if SKINS.get(skin, {}).get("ability") == "shield":
+                self.bird.activate_shield(3000)
             self.state = "minigame_lixi"
             self.get_ready = True
             self.get_ready_timer = 1000
             return
         
 
-        self.bird = Bird(self.difficulty, skin)
-        self.all_sprites.add(self.bird)
-        self.apply_skin_abilities(skin)
-        
-        self.last_pipe_spawn = pygame.time.get_ticks()
-        self.last_coin_spawn = pygame.time.get_ticks()
+        if self.playback_replay:
+            self.playback = ReplayPlayer(self.playback_replay)
+            self.sim = self.playback.sim
+        else:
+            self.sim = ClassicSimulation(self.difficulty, skin, self.game_mode, seed=rng_service.seed)
+            self.recorder = ReplayRecorder(self.sim)
+        self.bird = self.sim.bird
+        self.sim_accumulator = 0
+        self.jump_queued = False
         
         if self.game_mode == "time_attack":
             self.time_attack.start()
@@ -184,172 +212,56 @@ class Game:
         self.get_ready_timer = 1000
         self.state = STATE_PLAYING
         
-    def apply_skin_abilities(self, skin_id):
-        skin = SKINS.get(skin_id, {})
-        ability = skin.get("ability")
-        
-        if ability == "shield":
-            self.bird.activate_shield(3000)
-        elif ability == "double_coins":
-            self.score_multiplier = 2.0
-        elif ability == "coin_magnet":
-            self.has_coin_magnet = True
-            self.magnet_timer = pygame.time.get_ticks() + 10000
-        elif ability == "slow_time":
-            self.has_slow_motion = True
-            self.slow_timer = pygame.time.get_ticks() + 5000
-        elif ability == "score_boost":
-            self.has_score_boost = True
-            self.score_boost_timer = pygame.time.get_ticks() + 15000
-
-        elif ability == "lixi_magnet":
-            self.has_lixi_magnet = True
-            self.lixi_magnet_timer = pygame.time.get_ticks() + 20000
-        elif ability == "double_lixi":
-            self.score_multiplier = 2.0
-        elif ability == "fortune_boost":
-            self.score_multiplier = 1.88
-        
-    def spawn_pipe(self):
-        if self.game_mode == "zen":
-            self.spawn_zen_coins()
-            return
-            
-        now = pygame.time.get_ticks()
-        diff = DIFFICULTIES[self.difficulty]
-        freq = diff["pipe_frequency"]
-        if self.has_slow_motion:
-            freq = int(freq * 1.5)
-        
-        if now - self.last_pipe_spawn > freq:
-            self.last_pipe_spawn = now
-            pipe_gap = diff["pipe_gap"]
-            min_y = GROUND_HEIGHT + pipe_gap // 2 + 60
-            max_y = SCREEN_HEIGHT - GROUND_HEIGHT - pipe_gap // 2 - 60
-            gap_y = random.randint(min_y, max_y)
-            
-            top = Pipe((SCREEN_WIDTH, gap_y - pipe_gap // 2), True, self.difficulty)
-            bottom = Pipe((SCREEN_WIDTH, gap_y + pipe_gap // 2), False, self.difficulty)
-            self.pipes.add(top, bottom)
-            self.all_sprites.add(top, bottom)
-            
-            if random.random() < 0.6:
-                self.coins.add(Coin(SCREEN_WIDTH + 30, gap_y, self.difficulty))
-            if random.random() < 0.05:
-                self.powerups.add(PowerUp(SCREEN_WIDTH + 60, gap_y, random.choice(list(POWERUPS.keys())), self.difficulty))
-                
-    def spawn_zen_coins(self):
-        now = pygame.time.get_ticks()
-        if now - self.last_coin_spawn > 800:
-            self.last_coin_spawn = now
-            y = random.randint(100, SCREEN_HEIGHT - GROUND_HEIGHT - 100)
-            self.coins.add(Coin(SCREEN_WIDTH + 20, y, self.difficulty))
-            
-    def check_collisions(self):
-        if not self.bird or not self.bird.alive:
-            return
+    def step_simulation(self):
+        """Advance the classic simulation in fixed ticks for the elapsed frame time"""
+        if self.playback:
+            speed = self.playback_speed
+            self.sim_accumulator = min(self.sim_accumulator + self.dt * speed, MAX_FRAME_TIME * speed)
+        else:
+            self.sim_accumulator = min(self.sim_accumulator + self.dt, MAX_FRAME_TIME)
+        while self.sim_accumulator >= TICK_MS and not self.sim.is_over:
+            if self.playback:
+                self.playback.step()
+            else:
+                if self.jump_queued:
+                    self.recorder.record_jump()
+                self.sim.step(self.jump_queued)
+            self.jump_queued = False
+            self.sim_accumulator -= TICK_MS
+        
+        self.coins_this_game = self.sim.coins_collected
+        self.combo_count = self.sim.combo_count
+        if self.game_mode == "time_attack":
+            self.time_attack.remaining_time = self.sim.remaining_time
         
-        for coin in list(self.coins):
-            if self.bird.rect.colliderect(coin.rect):
-                coin.kill()
-                self.coins_this_game += int(COIN_VALUE * self.score_multiplier)
-                self.particle_system.emit_score(coin.rect.centerx, coin.rect.centery)
+        for event in self.sim.drain_events():
+            kind = event[0]
+            if kind == "coin":
+                self.particle_system.emit_score(event[1], event[2])
                 if self.game_mode == "zen":
                     self.zen_mode.add_coin()
-                
-        for powerup in list(self.powerups):
-            if self.bird.rect.colliderect(powerup.rect):
-                self.activate_powerup(powerup.power_type)
-                powerup.kill()
-        
-        if self.has_coin_magnet:
-            for coin in self.coins:
-                dx = coin.rect.centerx - self.bird.rect.centerx
-                dy = coin.rect.centery - self.bird.rect.centery
-                if dx*dx + dy*dy < 22500:
-                    coin.attract_to(self.bird)
-        
-        if self.game_mode == "zen":
-            if self.bird.rect.bottom >= SCREEN_HEIGHT - GROUND_HEIGHT:
-                self.bird.rect.bottom = SCREEN_HEIGHT - GROUND_HEIGHT
-                self.game_over()
-            if self.bird.rect.top <= 0:
-                self.bird.rect.top = 0
-            return
-            
-        if not self.bird.is_protected():
-            for pipe in self.pipes:
-                if self.bird.rect.colliderect(pipe.rect):
-                    if self.bird.get_mask().overlap(pipe.get_mask(), (pipe.rect.x - self.bird.rect.x, pipe.rect.y - self.bird.rect.y)):
-                        self.game_over()
-                        return
-        
-        if self.bird.rect.bottom >= SCREEN_HEIGHT - GROUND_HEIGHT:
-            self.bird.rect.bottom = SCREEN_HEIGHT - GROUND_HEIGHT
-            self.game_over()
-        elif self.bird.rect.top <= 0:
-            self.bird.rect.top = 0
-            if not self.bird.is_protected():
-                self.game_over()
-                
-    def activate_powerup(self, ptype):
-        now = pygame.time.get_ticks()
-        dur = POWERUPS.get(ptype, {}).get("duration", 5000)
-        if ptype == "shield":
-            self.bird.activate_shield(dur)
-        elif ptype == "coin_magnet":
-            self.has_coin_magnet = True
-            self.magnet_timer = now + dur
-        elif ptype == "slow_time":
-            self.has_slow_motion = True
-            self.slow_timer = now + dur
-        elif ptype == "score_boost":
-            self.has_score_boost = True
-            self.score_boost_timer = now + dur
-            self.score_multiplier = 2.0
-
-        elif ptype == "lixi_magnet":
-            self.has_lixi_magnet = True
-            self.lixi_magnet_timer = now + dur
-        elif ptype == "firework_burst":
-            self.particle_system.emit_firework(self.bird.rect.centerx, self.bird.rect.centery)
-            
-    def update_powerups(self):
-        now = pygame.time.get_ticks()
-        if self.has_coin_magnet and now > self.magnet_timer:
-            self.has_coin_magnet = False
-        if self.has_slow_motion and now > self.slow_timer:
-            self.has_slow_motion = False
-        if self.has_score_boost and now > self.score_boost_timer:
-            self.has_score_boost = False
-            self.score_multiplier = 1.0
-        if self.has_lixi_magnet and now > self.lixi_magnet_timer:
-            self.has_lixi_magnet = False
-            
-    def check_score(self):
-        if not self.bird or self.game_mode == "zen":
-            return
-        for pipe in self.pipes:
-            if not pipe.is_top and pipe.rect.right < self.bird.rect.left and not pipe.scored:
-                pipe.scored = True
-                for o in self.pipes:
-                    if o.is_top and abs(o.rect.x - pipe.rect.x) < 10:
-                        o.scored = True
-                pts = 2 if self.has_score_boost else 1
-                self.combo_count += 1
-                if self.combo_count >= COMBO_THRESHOLD:
-                    pts = int(pts * COMBO_MULTIPLIER)
-                self.score_manager.increment_score(pts)
-                self.particle_system.emit_score(self.bird.rect.centerx, self.bird.rect.top - 20)
+            elif kind == "score":
+                self.score_manager.increment_score(event[3])
+                self.particle_system.emit_score(event[1], event[2])
                 if self.game_mode == "time_attack":
-                    self.time_attack.add_score(pts)
+                    self.time_attack.add_score(event[3])
+            elif kind == "firework":
+                self.particle_system.emit_firework(event[1], event[2])
+            elif kind == "game_over":
+                self.game_over()
                     
     def game_over(self):
-        self.bird.die()
         self.particle_system.emit_death(self.bird.rect.centerx, self.bird.rect.centery)
+        if self.playback:
+            score = self.score_manager.current_score
+            self.game_over_screen.set_scores(score, self.score_manager.get_high_score(self.difficulty), False, self.score_manager.get_medal(), self.coins_this_game, 0)
+            self.state = STATE_GAME_OVER
+            return
+        
+        replay = self.recorder.finish() if self.recorder else None
         self.game_data.add_coins(self.coins_this_game)
         self.game_data.record_game(self.score_manager.current_score)
-        is_new = self.score_manager.update_score(self.score_manager.current_score, self.difficulty)
+        is_new = self.score_manager.update_score(self.score_manager.current_score, self.difficulty, replay)
         if is_new:
             self.particle_system.emit_new_highscore(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
         medal = self.score_manager.get_medal()
@@ -371,6 +283,17 @@ class Game:
                 self.running = False
                 return
             
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                frame_profiler.toggle()
+                self.dirty_tracker.invalidate()
+                continue
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F4 and frame_profiler.frames:
+                try:
+                    print(f"frame profile written to {frame_profiler.export(FRAME_PROFILE_FILE)}")
+                except OSError as e:
+                    print(f"frame profile not written: {e}")
+                continue
+            
             if self.state == STATE_MENU:
                 action = self.main_menu.handle_event(event)
                 if action == "play":
@@ -407,11 +330,11 @@ class Game:
             elif self.state == STATE_PLAYING:
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_SPACE and self.bird and self.bird.alive:
-                        self.bird.jump()
+                        self.jump_queued = True
                     elif event.key in (pygame.K_p, pygame.K_ESCAPE):
                         self.state = STATE_PAUSED
                 elif event.type == pygame.MOUSEBUTTONDOWN and self.bird and self.bird.alive:
-                    self.bird.jump()
+                    self.jump_queued = True
                     
             elif self.state == STATE_PAUSED:
                 action = self.pause_screen.handle_event(event)
@@ -420,6 +343,7 @@ class Game:
                 elif action == "restart":
                     self.new_game()
                 elif action == "menu":
+                    self.playback_replay = None
                     self.state = STATE_MENU
                     self.main_menu.coins = self.game_data.coins
                     
@@ -428,6 +352,7 @@ class Game:
                 if action == "retry":
                     self.new_game()
                 elif action == "menu":
+                    self.playback_replay = None
                     self.state = STATE_MENU
                     self.main_menu.coins = self.game_data.coins
                     self.main_menu.high_score = self.score_manager.get_high_score(self.difficulty)
@@ -501,8 +426,10 @@ class Game:
             self.main_menu.update(mouse_pos)
             self.background.update()
             self.ground.update()
+            self.prewarm_idle()
         elif self.state == "modes":
             self.minigame_menu.update(mouse_pos)
+            self.prewarm_idle()
         elif self.state == STATE_SETTINGS:
             self.settings_menu.update(mouse_pos)
         elif self.state == STATE_SHOP:
@@ -513,26 +440,20 @@ class Game:
                 if self.get_ready_timer <= 0:
                     self.get_ready = False
                 return
-            self.all_sprites.update()
-            self.coins.update()
-            self.powerups.update()
             self.background.update()
             self.ground.update()
-            self.update_powerups()
-            self.spawn_pipe()
-            self.check_collisions()
-            self.check_score()
-            self.particle_system.update(self.dt)
+            self.step_simulation()
+            with frame_profiler.section("update.particles"):
+                self.particle_system.update(self.dt)
             self.score_display.score = self.score_manager.current_score
-            if self.game_mode == "time_attack" and self.time_attack.update():
-                self.game_over()
-            elif self.game_mode == "zen":
+            if self.game_mode == "zen":
                 self.zen_mode.update(self.dt)
         elif self.state == STATE_PAUSED:
             self.pause_screen.update(mouse_pos)
         elif self.state == STATE_GAME_OVER:
             self.game_over_screen.update(mouse_pos)
-            self.particle_system.update(self.dt)
+            with frame_profiler.section("update.particles"):
+                self.particle_system.update(self.dt)
 
         elif self.state == "minigame_battle":
             self.bird_battle.update(self.dt)
@@ -562,7 +483,69 @@ class Game:
             self.ground.update()
             self.lixi_hunt.update(self.dt, self.bird.rect if self.bird else pygame.Rect(0, 0, 0, 0))
             
+    def static_view(self):
+        """Dirty-rect description of the current screen, None if it animates"""
+        if self.state == STATE_SETTINGS:
+            return self.settings_menu.dirty_regions()
+        if self.state == STATE_SHOP:
+            return self.shop_menu.dirty_regions()
+        if self.state == STATE_PAUSED:
+            return self.pause_screen.dirty_regions()
+        if self.state == STATE_GAME_OVER:
+            # live particles move every frame, so repaint everything until they are gone
+            if self.particle_system.count or self.particle_system.score_particles:
+                return None
+            if self.game_over_screen.is_animating():
+                return None
+            return self.game_over_screen.dirty_regions()
+        return None
+        
     def draw(self):
+        view = self.static_view() if DIRTY_RECTS and not frame_profiler.visible else None
+        if view is None:
+            self.dirty_tracker.invalidate()
+            with frame_profiler.section("draw"):
+                self.draw_scene()
+                if frame_profiler.visible:
+                    draw_frame_profile(self.screen, frame_profiler)
+            with frame_profiler.section("flip"):
+                pygame.display.flip()
+            return
+        
+        dirty = self.dirty_tracker.collect(self.state, *view)
+        if dirty is None:
+            with frame_profiler.section("draw"):
+                self.draw_scene()
+            with frame_profiler.section("flip"):
+                pygame.display.flip()
+        elif dirty:
+            with frame_profiler.section("draw"):
+                self.screen.set_clip(dirty[0].unionall(dirty[1:]))
+                self.draw_scene()
+                self.screen.set_clip(None)
+            with frame_profiler.section("flip"):
+                pygame.display.update(dirty)
+        
+    def frame_counters(self):
+        """Entity counts and cache hit rates for the frame profiler"""
+        counters = {
+            "particles": self.particle_system.count + len(self.particle_system.score_particles),
+            "fireworks": sum(len(fw.particles) for fw in self.background.fireworks),
+            "culled": lifecycle.total(),
+            "text_hits": text_cache_stats()["hit_rate"],
+            "overlay_hits": overlay_cache_stats()["hit_rate"],
+            "atlas_hits": particle_atlas.circles.hit_rate(),
+            "sprite_hits": sprite_cache.hit_rate(),
+            "font_hits": font_manager.stats()["hit_rate"],
+        }
+        if self.sim:
+            counters["pipes"] = len(self.sim.pipes)
+            counters["coins"] = len(self.sim.coins)
+            counters["powerups"] = len(self.sim.powerups)
+            counters["sprites"] = len(self.sim.all_sprites)
+        return counters
+        
+    def draw_scene(self):
         if self.state == STATE_MENU:
             self.main_menu.draw(self.background, self.ground)
         elif self.state == "modes":
@@ -573,12 +556,11 @@ class Game:
             self.shop_menu.draw(self.background, self.ground)
         elif self.state == STATE_PLAYING:
             self.background.draw(self.screen)
-            for p in self.pipes:
-                self.screen.blit(p.image, p.rect)
-            for c in self.coins:
-                self.screen.blit(c.image, c.rect)
-            for p in self.powerups:
-                self.screen.blit(p.image, p.rect)
+            queue = self.render_queue
+            queue.add_sprites(self.sim.pipes, LAYER_WORLD)
+            queue.add_sprites(self.sim.coins, LAYER_PICKUPS)
+            queue.add_sprites(self.sim.powerups, LAYER_PICKUPS)
+            queue.flush()
             self.ground.draw(self.screen)
             if self.bird:
                 self.bird.draw_effects(self.screen)
@@ -617,48 +599,44 @@ class Game:
                 self.draw_get_ready()
             if self.lixi_hunt.is_over:
                 self.draw_lixi_results()
-            
-        pygame.display.flip()
     
     def draw_lixi_results(self):
         """Draw Li Xi Hunt results screen"""
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        self.screen.blit(overlay, (0, 0))
+        draw_overlay(self.screen, BLACK, 180)
         
         results = self.lixi_hunt.get_results()
         
 
         panel_rect = pygame.Rect(40, 150, SCREEN_WIDTH - 80, 280)
-        pygame.draw.rect(self.screen, PANEL_COLOR, panel_rect, border_radius=20)
-        pygame.draw.rect(self.screen, TET_GOLD, panel_rect, 3, border_radius=20)
+        draw_panel(self.screen, panel_rect, PANEL_COLOR, TET_GOLD, 3, 20)
         
 
         title_font = get_vn_font(48)
-        title = title_font.render("🧧 KẾT QUẢ 🧧", True, TET_GOLD)
+        title = render_text(title_font, "🧧 KẾT QUẢ 🧧", TET_GOLD)
         self.screen.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, 170))
         
 
         stats_font = get_vn_font(32)
         
-        lixi_text = stats_font.render(f"Lì Xì thu thập: {results['lixi_collected']}", True, WHITE)
+        lixi_text = render_text(stats_font, f"Lì Xì thu thập: {results['lixi_collected']}", WHITE)
         self.screen.blit(lixi_text, (70, 230))
         
-        value_text = stats_font.render(f"Tổng giá trị: {results['total_value']}", True, TET_GOLD)
+        value_text = render_text(stats_font, f"Tổng giá trị: {results['total_value']}", TET_GOLD)
         self.screen.blit(value_text, (70, 270))
         
-        bonus_text = stats_font.render(f"Xu bonus: +{results['bonus_coins']}", True, COIN_COLOR)
+        bonus_text = render_text(stats_font, f"Xu bonus: +{results['bonus_coins']}", COIN_COLOR)
         self.screen.blit(bonus_text, (70, 310))
         
 
         cont_font = get_vn_font(24)
-        cont_text = cont_font.render("Nhấn chuột để tiếp tục", True, (180, 180, 180))
+        cont_text = render_text(cont_font, "Nhấn chuột để tiếp tục", (180, 180, 180))
         self.screen.blit(cont_text, (SCREEN_WIDTH // 2 - cont_text.get_width() // 2, 380))
         
     def draw_game_state(self):
         self.background.draw(self.screen)
-        for p in self.pipes:
-            self.screen.blit(p.image, p.rect)
+        if self.sim:
+            self.render_queue.add_sprites(self.sim.pipes, LAYER_WORLD)
+            self.render_queue.flush()
         self.ground.draw(self.screen)
         if self.bird:
             self.screen.blit(self.bird.image, self.bird.rect)
@@ -667,7 +645,7 @@ class Game:
         if self.game_mode != "zen":
             self.score_display.draw(self.screen)
         coin_text = f"{self.coins_this_game}"
-        coin_surf = self.hud_font.render(coin_text, True, COIN_COLOR)
+        coin_surf = render_text(self.hud_font, coin_text, COIN_COLOR)
         self.screen.blit(coin_surf, (SCREEN_WIDTH - 50, 15))
         pygame.draw.circle(self.screen, COIN_COLOR, (SCREEN_WIDTH - 65, 23), 8)
         if self.game_mode == "time_attack":
@@ -676,7 +654,7 @@ class Game:
             self.zen_mode.draw_hud()
         if self.combo_count >= COMBO_THRESHOLD:
             combo_text = "COMBO" if not TET_MODE else "LIÊN HOÀN"
-            combo = self.hud_font.render(f"{combo_text} x{self.combo_count}!", True, PRIMARY_COLOR)
+            combo = render_text(self.hud_font, f"{combo_text} x{self.combo_count}!", PRIMARY_COLOR)
             self.screen.blit(combo, (SCREEN_WIDTH // 2 - combo.get_width() // 2, 85))
             
     def draw_get_ready(self):
@@ -688,25 +666,102 @@ class Game:
             text_str = "Get Ready!"
             tap_str = "Tap or SPACE to fly!"
         
-        shadow = font.render(text_str, True, TEXT_SHADOW)
+        shadow = render_text(font, text_str, TEXT_SHADOW)
         self.screen.blit(shadow, (SCREEN_WIDTH // 2 - shadow.get_width() // 2 + 2, SCREEN_HEIGHT // 2 + 2))
-        text = font.render(text_str, True, WHITE)
+        text = render_text(font, text_str, WHITE)
         self.screen.blit(text, (SCREEN_WIDTH // 2 - text.get_width() // 2, SCREEN_HEIGHT // 2))
         small = get_vn_font(26)
-        tap = small.render(tap_str, True, (200, 200, 200))
+        tap = render_text(small, tap_str, (200, 200, 200))
         self.screen.blit(tap, (SCREEN_WIDTH // 2 - tap.get_width() // 2, SCREEN_HEIGHT // 2 + 45))
         
+    def start_playback(self, replay, speed=1):
+        """Watch a recorded run, fast-forwarded by speed"""
+        self.playback_replay = replay
+        self.playback_speed = speed
+        self.game_mode = replay.game_mode
+        self.difficulty = replay.difficulty
+        self.new_game()
+        
+    def finish_startup_trace(self):
+        """Close the startup trace once the first frame is on screen"""
+        startup_trace.mark("first_frame")
+        report = startup_trace.finish()
+        if report:
+            print(format_report(report))
+        
     async def run(self):
         while self.running:
             self.dt = self.clock.tick(FPS)
-            self.handle_events()
-            self.update()
+            frame_profiler.begin_frame()
+            with frame_profiler.section("events"):
+                self.handle_events()
+            with frame_profiler.section("update"):
+                self.update()
             self.draw()
+            if frame_profiler.enabled:
+                frame_profiler.end_frame(self.frame_counters())
+            if not startup_trace.finished:
+                self.finish_startup_trace()
             await asyncio.sleep(0)
+        if self.profile_output and frame_profiler.frames:
+            frame_profiler.export(self.profile_output)
+        sprite_cache.save()
         pygame.quit()
         sys.exit()
 
 
+def parse_args(argv):
+    import argparse
+    parser = argparse.ArgumentParser(description=TITLE)
+    parser.add_argument("--replay", help="play back a recorded run")
+    parser.add_argument("--speed", type=float, default=1, help="playback speed multiplier")
+    parser.add_argument("--headless", action="store_true", help="re-simulate the replay without a window and check its score")
+    parser.add_argument("--verify-highscores", action="store_true", help="check the recorded replay of every high score")
+    parser.add_argument("--profile-startup", nargs="?", const=DEFAULT_TRACE_FILE, metavar="PATH",
+                        help="write a JSON trace of start-up phases up to the first frame")
+    parser.add_argument("--profile-frames", nargs="?", const=FRAME_PROFILE_FILE, metavar="PATH",
+                        help="record per-frame timings and write them (.csv or .json) on quit")
+    return parser.parse_known_args(argv)[0]
+
+
+def verify_high_scores():
+    """Re-simulate the replay stored with each high score"""
+    score_manager = ScoreManager()
+    ok = True
+    for difficulty, score in score_manager.high_scores.items():
+        path = score_manager.get_replay_path(difficulty)
+        if not path:
+            print(f"{difficulty}: {score} (no replay)")
+            continue
+        try:
+            replay = Replay.load(path)
+            valid = replay.score == score and verify_replay(replay)
+        except (OSError, ReplayError) as e:
+            print(f"{difficulty}: {score} unreadable replay: {e}")
+            ok = False
+            continue
+        print(f"{difficulty}: {score} {'verified' if valid else 'MISMATCH'}")
+        ok = ok and valid
+    return ok
+
+
 if __name__ == "__main__":
+    args = parse_args(sys.argv[1:])
+    if args.profile_startup:
+        startup_trace.enable(args.profile_startup)
+    if args.verify_highscores:
+        sys.exit(0 if verify_high_scores() else 1)
+    if args.replay and args.headless:
+        replay = Replay.load(args.replay)
+        score = ReplayPlayer(replay).run()
+        print(f"{replay.game_mode}/{replay.difficulty} seed={replay.seed} ticks={replay.ticks} "
+              f"score={score} recorded={replay.score} {'OK' if score == replay.score else 'MISMATCH'}")
+        sys.exit(0 if score == replay.score else 1)
+    
     game = Game()
+    if args.profile_frames:
+        frame_profiler.recording = True
+        game.profile_output = args.profile_frames
+    if args.replay:
+        game.start_playback(Replay.load(args.replay), args.speed)
     asyncio.run(game.run())
@@ -0,0 +1,147 @@
+import os
+import struct
+import time
+from settings import *
+from managers.simulation import ClassicSimulation
+
+# Replay files for classic, time attack and zen runs
+# A run is fully determined by its seed, mode, difficulty, skin and the
+# ticks at which the player jumped, so that is all a replay stores:
+#
+#   header  <4sHIII   magic, version, seed, score, ticks
+#   3 x     <B + utf8 game mode, difficulty, skin id
+#   count   <I        number of input events
+#   events  <IB       (tick, input) pairs
+
+REPLAY_MAGIC = b"FBRP"
+REPLAY_VERSION = 1
+REPLAY_EXTENSION = ".fbr"
+
+INPUT_JUMP = 1
+
+_HEADER = struct.Struct("<4sHIII")
+_COUNT = struct.Struct("<I")
+_EVENT = struct.Struct("<IB")
+
+
+class ReplayError(Exception):
+    pass
+
+
+class Replay:
+    """Seed, settings and input log of one simulated run"""
+
+    def __init__(self, seed, game_mode="classic", difficulty="medium", skin_id="default", events=None, score=0, ticks=0):
+        self.seed = seed
+        self.game_mode = game_mode
+        self.difficulty = difficulty
+        self.skin_id = skin_id
+        self.events = events if events is not None else []
+        self.score = score
+        self.ticks = ticks
+
+    def record(self, tick, input_type=INPUT_JUMP):
+        self.events.append((tick, input_type))
+
+    def jump_ticks(self):
+        return {tick for tick, input_type in self.events if input_type == INPUT_JUMP}
+
+    def to_bytes(self):
+        parts = [_HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, self.seed, self.score, self.ticks)]
+        for text in (self.game_mode, self.difficulty, self.skin_id):
+            encoded = text.encode("utf-8")
+            parts.append(struct.pack("<B", len(encoded)) + encoded)
+        parts.append(_COUNT.pack(len(self.events)))
+        parts.extend(_EVENT.pack(tick, input_type) for tick, input_type in self.events)
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data):
+        try:
+            magic, version, seed, score, ticks = _HEADER.unpack_from(data, 0)
+            if magic != REPLAY_MAGIC:
+                raise ReplayError("not a replay file")
+            if version != REPLAY_VERSION:
+                raise ReplayError(f"unsupported replay version {version}")
+            offset = _HEADER.size
+
+            texts = []
+            for _ in range(3):
+                length = data[offset]
+                texts.append(data[offset + 1:offset + 1 + length].decode("utf-8"))
+                offset += 1 + length
+
+            (count,) = _COUNT.unpack_from(data, offset)
+            offset += _COUNT.size
+            events = [_EVENT.unpack_from(data, offset + i * _EVENT.size) for i in range(count)]
+        except (struct.error, IndexError, UnicodeDecodeError) as e:
+            raise ReplayError(f"corrupt replay: {e}")
+
+        game_mode, difficulty, skin_id = texts
+        return cls(seed, game_mode, difficulty, skin_id, events, score, ticks)
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+        return path
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+
+class ReplayRecorder:
+    """Records the inputs fed into a ClassicSimulation"""
+
+    def __init__(self, sim):
+        self.sim = sim
+        self.replay = Replay(sim.seed, sim.game_mode, sim.difficulty, sim.skin_id)
+
+    def record_jump(self):
+        """Log a jump applied on the simulation's next step"""
+        self.replay.record(self.sim.tick, INPUT_JUMP)
+
+    def finish(self):
+        self.replay.score = self.sim.score
+        self.replay.ticks = self.sim.tick
+        return self.replay
+
+
+class ReplayPlayer:
+    """Feeds a replay's inputs back into a fresh simulation"""
+
+    def __init__(self, replay, clock=None):
+        self.replay = replay
+        self.jumps = replay.jump_ticks()
+        self.sim = ClassicSimulation(replay.difficulty, replay.skin_id, replay.game_mode, seed=replay.seed, clock=clock)
+
+    def next_input(self):
+        """Jump flag for the simulation's next step"""
+        return self.sim.tick in self.jumps
+
+    def step(self):
+        self.sim.step(self.next_input())
+
+    @property
+    def finished(self):
+        return self.sim.is_over or self.sim.tick >= self.replay.ticks
+
+    def run(self):
+        """Play the whole replay at maximum speed and return the final score"""
+        while not self.finished:
+            self.step()
+        return self.sim.score
+
+
+def save_replay(replay, directory=None):
+    """Write a replay into the replay directory and return its path"""
+    directory = directory or REPLAY_DIR
+    os.makedirs(directory, exist_ok=True)
+    name = f"{replay.game_mode}_{replay.difficulty}_{replay.score}_{int(time.time() * 1000)}{REPLAY_EXTENSION}"
+    return replay.save(os.path.join(directory, name))
+
+
+def verify_replay(replay):
+    """Re-simulate a replay headless; True if it reproduces the stored score"""
+    return ReplayPlayer(replay).run() == replay.score
@@ -1,6 +1,7 @@
 import json
 import os
 from settings import SCORE_FILE, DATA_FILE, MEDAL_THRESHOLDS, SKINS
+from managers.replay import save_replay
 
 class ScoreManager:
     def __init__(self):
@@ -9,6 +10,7 @@ class ScoreManager:
             "medium": 0,
             "hard": 0
         }
+        self.replays = {}
         self.current_score = 0
         self.is_new_high_score = False
         self.load_scores()
@@ -20,6 +22,7 @@ class ScoreManager:
                 with open(SCORE_FILE, 'r') as f:
                     data = json.load(f)
                     self.high_scores = data.get("high_scores", self.high_scores)
+                    self.replays = data.get("replays", self.replays)
         except (json.JSONDecodeError, IOError):
             pass
     
@@ -27,15 +30,22 @@ class ScoreManager:
         """Save high scores to file"""
         try:
             with open(SCORE_FILE, 'w') as f:
-                json.dump({"high_scores": self.high_scores}, f, indent=2)
+                json.dump({"high_scores": self.high_scores, "replays": self.replays}, f, indent=2)
         except IOError:
             pass
     
-    def update_score(self, score, difficulty="medium"):
-        """Update current score and check for new high score"""
+    def update_score(self, score, difficulty="medium", replay=None):
+        """Update current score and check for new high score; only a high score's replay is written"""
         self.current_score = score
         if score > self.high_scores.get(difficulty, 0):
             self.high_scores[difficulty] = score
+            replay_path = None
+            if replay is not None:
+                try:
+                    replay_path = save_replay(replay)
+                except OSError:
+                    pass
+            self.set_replay_path(difficulty, replay_path)
             self.is_new_high_score = True
             self.save_scores()
             return True
@@ -44,6 +54,21 @@ class ScoreManager:
     def get_high_score(self, difficulty="medium"):
         return self.high_scores.get(difficulty, 0)
     
+    def get_replay_path(self, difficulty="medium"):
+        """Replay file of the high score, if it was recorded"""
+        return self.replays.get(difficulty)
+    
+    def set_replay_path(self, difficulty, path):
+        """Point difficulty at a new replay file, deleting the one it replaces"""
+        old = self.replays.pop(difficulty, None)
+        if path:
+            self.replays[difficulty] = path
+        if old and old != path:
+            try:
+                os.remove(old)
+            except OSError:
+                pass
+    
     def reset_current_score(self):
         self.current_score = 0
         self.is_new_high_score = False
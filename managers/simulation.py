@@ -0,0 +1,287 @@
+import time
+import pygame
+from settings import *
+from sprites.bird import Bird
+from sprites.pipe import Pipe, pipe_gap_range
+from sprites.collectibles import Coin, PowerUp
+from sprites.collision import bird_hits_pipe
+from utils.clock import FixedStepClock
+from utils.rng import RNGService
+from utils.profiler import frame_profiler
+
+# One simulation tick matches one frame of the original 60 FPS game loop
+TICK_MS = 1000 / FPS
+
+
+class ClassicSimulation:
+    """Headless classic, time attack and zen rules advanced in fixed ticks.
+
+    Nothing here draws or reads input; the caller feeds a jump flag into
+    step() and reads the sprite groups and drained events to render.
+    """
+
+    def __init__(self, difficulty="medium", skin_id="default", game_mode="classic", seed=None, clock=None):
+        # Power-up sprites render their labels with the default font
+        if not pygame.font.get_init():
+            pygame.font.init()
+
+        self.difficulty = difficulty
+        self.skin_id = skin_id
+        self.game_mode = game_mode
+        self.clock = clock or FixedStepClock()
+        self.rngs = RNGService(seed)
+        self.seed = self.rngs.seed
+        self.rng = self.rngs.stream("spawn")
+        self.coin_rng = self.rngs.stream("coins")
+
+        self.tick = 0
+        self.is_over = False
+        self.events = []
+
+        self.all_sprites = pygame.sprite.Group()
+        self.pipes = pygame.sprite.Group()
+        self.coins = pygame.sprite.Group()
+        self.powerups = pygame.sprite.Group()
+
+        self.score = 0
+        self.coins_collected = 0
+        self.combo_count = 0
+        self.score_multiplier = 1.0
+
+        self.has_coin_magnet = False
+        self.magnet_timer = 0
+        self.has_slow_motion = False
+        self.slow_timer = 0
+        self.has_score_boost = False
+        self.score_boost_timer = 0
+        self.has_lixi_magnet = False
+        self.lixi_magnet_timer = 0
+
+        if game_mode != "zen":
+            Pipe.prewarm(difficulty)
+
+        self.bird = Bird(difficulty, skin_id, clock=self.clock)
+        self.all_sprites.add(self.bird)
+        self.apply_skin_abilities(skin_id)
+
+        now = self.clock.get_ticks()
+        self.start_time = now
+        self.last_pipe_spawn = now
+        self.last_coin_spawn = now
+        self.time_limit = TIME_ATTACK_LIMIT if game_mode == "time_attack" else None
+
+    @property
+    def remaining_time(self):
+        """Milliseconds left in time attack, None for untimed modes"""
+        if self.time_limit is None:
+            return None
+        return max(0, self.time_limit - (self.clock.get_ticks() - self.start_time))
+
+    def apply_skin_abilities(self, skin_id):
+        skin = SKINS.get(skin_id, {})
+        ability = skin.get("ability")
+        now = self.clock.get_ticks()
+
+        if ability == "shield":
+            self.bird.activate_shield(3000)
+        elif ability == "double_coins":
+            self.score_multiplier = 2.0
+        elif ability == "coin_magnet":
+            self.has_coin_magnet = True
+            self.magnet_timer = now + 10000
+        elif ability == "slow_time":
+            self.has_slow_motion = True
+            self.slow_timer = now + 5000
+        elif ability == "score_boost":
+            self.has_score_boost = True
+            self.score_boost_timer = now + 15000
+
+        elif ability == "lixi_magnet":
+            self.has_lixi_magnet = True
+            self.lixi_magnet_timer = now + 20000
+        elif ability == "double_lixi":
+            self.score_multiplier = 2.0
+        elif ability == "fortune_boost":
+            self.score_multiplier = 1.88
+
+    def step(self, jump=False):
+        """Advance the game by one fixed tick"""
+        if self.is_over:
+            return
+
+        self.clock.advance(TICK_MS)
+        self.tick += 1
+
+        if jump:
+            self.bird.jump()
+
+        # Sub-timers for the frame profiler; one flag check per tick when it is off
+        timed = frame_profiler.enabled
+        start = time.perf_counter() if timed else 0
+        self.all_sprites.update()
+        self.coins.update()
+        self.powerups.update()
+        self.update_powerups()
+        if timed:
+            start = frame_profiler.lap("update.sprites", start)
+        self.spawn_pipe()
+        if timed:
+            start = frame_profiler.lap("update.spawn_pipe", start)
+        self.check_collisions()
+        if timed:
+            start = frame_profiler.lap("update.check_collisions", start)
+        if self.is_over:
+            return
+        self.check_score()
+        if timed:
+            frame_profiler.lap("update.check_score", start)
+
+        if self.time_limit is not None and self.remaining_time <= 0:
+            self.end()
+
+    def run(self, policy=None, max_ticks=None):
+        """Play until game over; policy(sim) returns True to jump"""
+        while not self.is_over and (max_ticks is None or self.tick < max_ticks):
+            self.step(policy(self) if policy else False)
+        return self.score
+
+    def drain_events(self):
+        """Return and clear the events emitted since the last drain"""
+        events = self.events
+        self.events = []
+        return events
+
+    def spawn_pipe(self):
+        if self.game_mode == "zen":
+            self.spawn_zen_coins()
+            return
+
+        now = self.clock.get_ticks()
+        freq = DIFFICULTIES[self.difficulty]["pipe_frequency"]
+        if self.has_slow_motion:
+            freq = int(freq * 1.5)
+
+        if now - self.last_pipe_spawn > freq:
+            self.last_pipe_spawn = now
+            pipe_gap, min_y, max_y = pipe_gap_range(self.difficulty)
+            gap_y = self.rng.randint(min_y, max_y)
+
+            top = Pipe((SCREEN_WIDTH, gap_y - pipe_gap // 2), True, self.difficulty)
+            bottom = Pipe((SCREEN_WIDTH, gap_y + pipe_gap // 2), False, self.difficulty)
+            self.pipes.add(top, bottom)
+            self.all_sprites.add(top, bottom)
+
+            if self.rng.random() < 0.6:
+                self.coins.add(Coin.acquire(SCREEN_WIDTH + 30, gap_y, self.difficulty, clock=self.clock, rng=self.coin_rng))
+            if self.rng.random() < 0.05:
+                power_type = self.rng.choice(list(POWERUPS.keys()))
+                self.powerups.add(PowerUp(SCREEN_WIDTH + 60, gap_y, power_type, self.difficulty, clock=self.clock))
+
+    def spawn_zen_coins(self):
+        now = self.clock.get_ticks()
+        if now - self.last_coin_spawn > 800:
+            self.last_coin_spawn = now
+            y = self.rng.randint(100, SCREEN_HEIGHT - GROUND_HEIGHT - 100)
+            self.coins.add(Coin.acquire(SCREEN_WIDTH + 20, y, self.difficulty, clock=self.clock, rng=self.coin_rng))
+
+    def check_collisions(self):
+        if not self.bird.alive:
+            return
+
+        for coin in list(self.coins):
+            if self.bird.rect.colliderect(coin.rect):
+                coin.kill()
+                self.coins_collected += int(COIN_VALUE * self.score_multiplier)
+                self.events.append(("coin", coin.rect.centerx, coin.rect.centery))
+
+        for powerup in list(self.powerups):
+            if self.bird.rect.colliderect(powerup.rect):
+                self.activate_powerup(powerup.power_type)
+                powerup.kill()
+
+        if self.has_coin_magnet:
+            for coin in self.coins:
+                dx = coin.rect.centerx - self.bird.rect.centerx
+                dy = coin.rect.centery - self.bird.rect.centery
+                if dx*dx + dy*dy < 22500:
+                    coin.attract_to(self.bird)
+
+        if self.game_mode == "zen":
+            if self.bird.rect.bottom >= SCREEN_HEIGHT - GROUND_HEIGHT:
+                self.bird.rect.bottom = SCREEN_HEIGHT - GROUND_HEIGHT
+                self.end()
+            if self.bird.rect.top <= 0:
+                self.bird.rect.top = 0
+            return
+
+        if not self.bird.is_protected():
+            for pipe in self.pipes:
+                if self.bird.rect.colliderect(pipe.rect) and bird_hits_pipe(self.bird, pipe):
+                    self.end()
+                    return
+
+        if self.bird.rect.bottom >= SCREEN_HEIGHT - GROUND_HEIGHT:
+            self.bird.rect.bottom = SCREEN_HEIGHT - GROUND_HEIGHT
+            self.end()
+        elif self.bird.rect.top <= 0:
+            self.bird.rect.top = 0
+            if not self.bird.is_protected():
+                self.end()
+
+    def activate_powerup(self, ptype):
+        now = self.clock.get_ticks()
+        dur = POWERUPS.get(ptype, {}).get("duration", 5000)
+        if ptype == "shield":
+            self.bird.activate_shield(dur)
+        elif ptype == "coin_magnet":
+            self.has_coin_magnet = True
+            self.magnet_timer = now + dur
+        elif ptype == "slow_time":
+            self.has_slow_motion = True
+            self.slow_timer = now + dur
+        elif ptype == "score_boost":
+            self.has_score_boost = True
+            self.score_boost_timer = now + dur
+            self.score_multiplier = 2.0
+
+        elif ptype == "lixi_magnet":
+            self.has_lixi_magnet = True
+            self.lixi_magnet_timer = now + dur
+        elif ptype == "firework_burst":
+            self.events.append(("firework", self.bird.rect.centerx, self.bird.rect.centery))
+
+    def update_powerups(self):
+        now = self.clock.get_ticks()
+        if self.has_coin_magnet and now > self.magnet_timer:
+            self.has_coin_magnet = False
+        if self.has_slow_motion and now > self.slow_timer:
+            self.has_slow_motion = False
+        if self.has_score_boost and now > self.score_boost_timer:
+            self.has_score_boost = False
+            self.score_multiplier = 1.0
+        if self.has_lixi_magnet and now > self.lixi_magnet_timer:
+            self.has_lixi_magnet = False
+
+    def check_score(self):
+        if self.game_mode == "zen":
+            return
+        for pipe in self.pipes:
+            if not pipe.is_top and pipe.rect.right < self.bird.rect.left and not pipe.scored:
+                pipe.scored = True
+                for o in self.pipes:
+                    if o.is_top and abs(o.rect.x - pipe.rect.x) < 10:
+                        o.scored = True
+                pts = 2 if self.has_score_boost else 1
+                self.combo_count += 1
+                if self.combo_count >= COMBO_THRESHOLD:
+                    pts = int(pts * COMBO_MULTIPLIER)
+                self.score += pts
+                self.events.append(("score", self.bird.rect.centerx, self.bird.rect.top - 20, pts))
+
+    def end(self):
+        """Finish the run and kill the bird"""
+        if self.is_over:
+            return
+        self.is_over = True
+        self.bird.die()
+        self.events.append(("game_over", self.bird.rect.centerx, self.bird.rect.centery))
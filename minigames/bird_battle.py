@@ -1,16 +1,24 @@
 import pygame
-import random
 import math
 from settings import *
+from utils.fonts import render_text
+from ui.overlays import draw_overlay
 from sprites.bird import Bird
 from sprites.enemy import EnemyBird
 from sprites.projectile import Bullet
+from sprites.particles import particle_atlas
+from utils.rng import rng_service
+from utils.sprite_cache import sprite_cache
+from ui.render_queue import RenderQueue, LAYER_PICKUPS, LAYER_PROJECTILES
+
+rng = rng_service.stream("bird_battle")
 
 class BirdBattle:
     """Enhanced PvP Bird Battle mini-game"""
     
     def __init__(self, screen, difficulty="medium"):
         self.screen = screen
+        self.render_queue = RenderQueue(screen)
         self.difficulty = difficulty
         
         # Game state
@@ -122,8 +130,8 @@ class BirdBattle:
         if self.shake_amount > 0:
             self.shake_amount *= 0.85
             self.shake_offset = (
-                random.randint(-int(self.shake_amount), int(self.shake_amount)),
-                random.randint(-int(self.shake_amount), int(self.shake_amount))
+                rng.randint(-int(self.shake_amount), int(self.shake_amount)),
+                rng.randint(-int(self.shake_amount), int(self.shake_amount))
             )
         else:
             self.shake_offset = (0, 0)
@@ -237,17 +245,17 @@ class BirdBattle:
     def spawn_hit_particles(self, x, y, color):
         """Spawn hit effect particles"""
         for _ in range(8):
-            angle = random.uniform(0, math.pi * 2)
-            speed = random.uniform(2, 6)
+            angle = rng.uniform(0, math.pi * 2)
+            speed = rng.uniform(2, 6)
             self.particles.append(HitParticle(x, y, angle, speed, color))
                 
     def spawn_powerup(self):
         """Spawn a random powerup"""
         types = ["rapid", "shield", "heal", "special"]
-        ptype = random.choice(types)
+        ptype = rng.choice(types)
         
-        x = SCREEN_WIDTH // 2 + random.randint(-50, 50)
-        y = random.randint(100, SCREEN_HEIGHT - GROUND_HEIGHT - 100)
+        x = SCREEN_WIDTH // 2 + rng.randint(-50, 50)
+        y = rng.randint(100, SCREEN_HEIGHT - GROUND_HEIGHT - 100)
         
         powerup = BattlePowerUp(x, y, ptype)
         self.powerups.add(powerup)
@@ -280,7 +288,7 @@ class BirdBattle:
         # Fire burst of bullets
         for angle in range(-30, 31, 10):
             rad = math.radians(angle)
-            bullet = Bullet(
+            bullet = Bullet.acquire(
                 self.player.rect.right,
                 self.player.rect.centery,
                 direction=1,
@@ -320,7 +328,7 @@ class BirdBattle:
         if now - self.last_shot >= self.shoot_cooldown:
             self.last_shot = now
             
-            bullet = Bullet(
+            bullet = Bullet.acquire(
                 self.player.rect.right,
                 self.player.rect.centery,
                 direction=1,
@@ -343,18 +351,11 @@ class BirdBattle:
         pygame.draw.line(self.screen, (100, 100, 120, 50), 
                         (SCREEN_WIDTH // 2, 0), (SCREEN_WIDTH // 2, SCREEN_HEIGHT - GROUND_HEIGHT), 2)
         
-        # Powerups
-        for powerup in self.powerups:
-            pos = (powerup.rect.x + offset[0], powerup.rect.y + offset[1])
-            self.screen.blit(powerup.image, pos)
-            
-        # Bullets
-        for bullet in self.player_bullets:
-            pos = (bullet.rect.x + offset[0], bullet.rect.y + offset[1])
-            self.screen.blit(bullet.image, pos)
-        for bullet in self.enemy_bullets:
-            pos = (bullet.rect.x + offset[0], bullet.rect.y + offset[1])
-            self.screen.blit(bullet.image, pos)
+        # Powerups and bullets
+        self.render_queue.add_sprites(self.powerups, LAYER_PICKUPS, offset)
+        self.render_queue.add_sprites(self.player_bullets, LAYER_PROJECTILES, offset)
+        self.render_queue.add_sprites(self.enemy_bullets, LAYER_PROJECTILES, offset)
+        self.render_queue.flush()
             
         # Particles
         for particle in self.particles:
@@ -411,16 +412,16 @@ class BirdBattle:
                 ])
                 
         # Round indicator
-        round_text = self.font.render(f"Round {self.round}", True, WHITE)
+        round_text = render_text(self.font, f"Round {self.round}", WHITE)
         self.screen.blit(round_text, (SCREEN_WIDTH // 2 - round_text.get_width() // 2, 15))
         
         # Score
-        score_text = self.small_font.render(f"{self.player_wins} - {self.enemy_wins}", True, WHITE)
+        score_text = render_text(self.small_font, f"{self.player_wins} - {self.enemy_wins}", WHITE)
         self.screen.blit(score_text, (SCREEN_WIDTH // 2 - score_text.get_width() // 2, 45))
         
         # Combo
         if self.combo >= 2:
-            combo_text = self.font.render(f"COMBO x{self.combo}!", True, (255, 200, 50))
+            combo_text = render_text(self.font, f"COMBO x{self.combo}!", (255, 200, 50))
             self.screen.blit(combo_text, (20, 60))
             
         # Special meter
@@ -442,35 +443,31 @@ class BirdBattle:
         # Label
         special_label = "SPECIAL READY!" if self.special_ready else "SPECIAL"
         label_color = (255, 200, 50) if self.special_ready else WHITE
-        label = self.small_font.render(special_label, True, label_color)
+        label = render_text(self.small_font, special_label, label_color)
         self.screen.blit(label, (meter_x + meter_width + 10, meter_y + 2))
         
         # Rapid fire indicator
         if self.rapid_fire:
-            rapid = self.small_font.render("RAPID FIRE!", True, (255, 150, 50))
+            rapid = render_text(self.small_font, "RAPID FIRE!", (255, 150, 50))
             self.screen.blit(rapid, (20, 90))
             
         # Controls hint
-        controls = self.small_font.render("SPACE: Jump | X: Shoot | C: Special", True, (150, 150, 160))
+        controls = render_text(self.small_font, "SPACE: Jump | X: Shoot | C: Special", (150, 150, 160))
         self.screen.blit(controls, (SCREEN_WIDTH // 2 - controls.get_width() // 2, SCREEN_HEIGHT - 25))
         
     def draw_round_transition(self):
         """Draw round start screen"""
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))
-        self.screen.blit(overlay, (0, 0))
+        draw_overlay(self.screen, BLACK, 150)
         
-        round_text = self.big_font.render(f"ROUND {self.round}", True, WHITE)
+        round_text = render_text(self.big_font, f"ROUND {self.round}", WHITE)
         self.screen.blit(round_text, (SCREEN_WIDTH // 2 - round_text.get_width() // 2, SCREEN_HEIGHT // 2 - 40))
         
-        fight_text = self.font.render("GET READY!", True, ACCENT_COLOR)
+        fight_text = render_text(self.font, "GET READY!", ACCENT_COLOR)
         self.screen.blit(fight_text, (SCREEN_WIDTH // 2 - fight_text.get_width() // 2, SCREEN_HEIGHT // 2 + 20))
         
     def draw_game_over(self):
         """Draw game over screen"""
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 200))
-        self.screen.blit(overlay, (0, 0))
+        draw_overlay(self.screen, BLACK, 200)
         
         if self.winner == "player":
             text = "VICTORY!"
@@ -481,13 +478,13 @@ class BirdBattle:
             color = (255, 100, 100)
             subtext = f"Enemy won {self.enemy_wins}-{self.player_wins}"
             
-        title = self.big_font.render(text, True, color)
+        title = render_text(self.big_font, text, color)
         self.screen.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, 180))
         
-        sub = self.font.render(subtext, True, WHITE)
+        sub = render_text(self.font, subtext, WHITE)
         self.screen.blit(sub, (SCREEN_WIDTH // 2 - sub.get_width() // 2, 260))
         
-        hint = self.font.render("Press SPACE to continue", True, (180, 180, 180))
+        hint = render_text(self.font, "Press SPACE to continue", (180, 180, 180))
         self.screen.blit(hint, (SCREEN_WIDTH // 2 - hint.get_width() // 2, 340))
         
     def handle_event(self, event):
@@ -525,7 +522,7 @@ class HitParticle:
         self.vy = math.sin(angle) * speed
         self.color = color
         self.life = 1.0
-        self.size = random.randint(3, 6)
+        self.size = rng.randint(3, 6)
         
     def update(self):
         self.x += self.vx
@@ -536,11 +533,11 @@ class HitParticle:
         
     def draw(self, screen, offset=(0, 0)):
         if self.life > 0:
-            alpha = int(255 * self.life)
             size = int(self.size * self.life)
             if size > 0:
-                pygame.draw.circle(screen, self.color, 
-                                 (int(self.x + offset[0]), int(self.y + offset[1])), size)
+                # opaque atlas circle, the same pixels as pygame.draw.circle
+                screen.blit(particle_atlas.circle(self.color, size, 255),
+                            (int(self.x + offset[0]) - size, int(self.y + offset[1]) - size))
 
 
 class BattlePowerUp(pygame.sprite.Sprite):
@@ -558,6 +555,9 @@ class BattlePowerUp(pygame.sprite.Sprite):
         self.lifetime = 10000
         
     def create_sprite(self):
+        self.image = sprite_cache.get("battle_powerup", (self.powerup_type,), self.draw_sprite)
+        
+    def draw_sprite(self):
         size = 36
         self.image = pygame.Surface((size, size), pygame.SRCALPHA)
         
@@ -607,6 +607,8 @@ class BattlePowerUp(pygame.sprite.Sprite):
                 points.append((center + int(4 * math.cos(angle)), center + int(4 * math.sin(angle))))
             pygame.draw.polygon(self.image, WHITE, points)
             
+        return self.image
+            
     def update(self):
         now = pygame.time.get_ticks()
         
@@ -2,15 +2,20 @@ from settings import get_vn_font
 import pygame
 import random
 from settings import *
+from utils.fonts import render_text
+from ui.overlays import draw_overlay
 from sprites.bird import Bird
 from sprites.enemy import Boss
 from sprites.projectile import Bullet
+from utils.lifecycle import lifecycle
+from ui.render_queue import RenderQueue, LAYER_PROJECTILES, LAYER_ACTORS
 
 class BossRush:
     """Boss Rush mini-game - fight the Giant Raven"""
     
     def __init__(self, screen, difficulty="medium"):
         self.screen = screen
+        self.render_queue = RenderQueue(screen)
         self.difficulty = difficulty
         
         # Game state
@@ -105,6 +110,11 @@ class BossRush:
             self.is_over = True
             self.victory = False
             
+        # Bullets stop updating once the fight is over, so drop them now
+        if self.is_over:
+            lifecycle.despawn_all("bullets", self.player_bullets)
+            lifecycle.despawn_all("bullets", self.boss_bullets)
+            
     def check_collisions(self):
         """Check bullet collisions"""
         # Player bullets hitting boss
@@ -136,7 +146,7 @@ class BossRush:
         if now - self.last_shot >= self.shoot_cooldown:
             self.last_shot = now
             
-            bullet = Bullet(
+            bullet = Bullet.acquire(
                 self.player.rect.right,
                 self.player.rect.centery,
                 direction=1,
@@ -149,17 +159,15 @@ class BossRush:
         """Draw boss fight"""
         background.draw(self.screen)
         
-        # Bullets
-        for bullet in self.player_bullets:
-            self.screen.blit(bullet.image, bullet.rect)
-        for bullet in self.boss_bullets:
-            self.screen.blit(bullet.image, bullet.rect)
-            
-        # Boss
+        # Bullets, then the boss over them
+        self.render_queue.add_sprites(self.player_bullets, LAYER_PROJECTILES)
+        self.render_queue.add_sprites(self.boss_bullets, LAYER_PROJECTILES)
         if self.boss and self.boss.alive:
-            self.screen.blit(self.boss.image, self.boss.rect)
+            self.render_queue.add(self.boss.image, self.boss.rect, LAYER_ACTORS)
+        self.render_queue.flush()
             
-            # Draw weak point indicator when vulnerable
+        # Draw weak point indicator when vulnerable
+        if self.boss and self.boss.alive:
             if self.boss.state == "vulnerable":
                 weak_rect = self.boss.get_weak_point_rect()
                 pygame.draw.rect(self.screen, (255, 255, 0), weak_rect, 2)
@@ -192,21 +200,19 @@ class BossRush:
             
         # Phase indicator
         if self.boss:
-            phase = self.font.render(f"Phase {self.boss.phase}", True, PRIMARY_COLOR)
+            phase = render_text(self.font, f"Phase {self.boss.phase}", PRIMARY_COLOR)
             self.screen.blit(phase, (20, 60))
             
         # Controls
-        ctrl = get_vn_font(20).render("SPACE: Jump | X: Shoot", True, (180, 180, 180))
+        ctrl = render_text(get_vn_font(20), "SPACE: Jump | X: Shoot", (180, 180, 180))
         self.screen.blit(ctrl, (SCREEN_WIDTH // 2 - ctrl.get_width() // 2, SCREEN_HEIGHT - 25))
         
     def draw_game_over(self):
         """Draw game over"""
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        self.screen.blit(overlay, (0, 0))
+        draw_overlay(self.screen, BLACK, 180)
         
         if self.victory:
-            title = self.big_font.render("VICTORY!", True, (100, 255, 100))
+            title = render_text(self.big_font, "VICTORY!", (100, 255, 100))
             
             # Rank
             if self.hits_taken == 0:
@@ -226,10 +232,10 @@ class BossRush:
                 rank_color = (150, 150, 150)
                 reward = 25
                 
-            rank_text = self.big_font.render(f"Rank: {rank}", True, rank_color)
-            reward_text = self.font.render(f"+{reward} coins!", True, COIN_COLOR)
+            rank_text = render_text(self.big_font, f"Rank: {rank}", rank_color)
+            reward_text = render_text(self.font, f"+{reward} coins!", COIN_COLOR)
         else:
-            title = self.big_font.render("DEFEATED", True, ACCENT_COLOR)
+            title = render_text(self.big_font, "DEFEATED", ACCENT_COLOR)
             rank_text = None
             reward_text = None
             
@@ -240,7 +246,7 @@ class BossRush:
         if reward_text:
             self.screen.blit(reward_text, (SCREEN_WIDTH // 2 - reward_text.get_width() // 2, 320))
             
-        hint = self.font.render("Press SPACE to continue", True, (180, 180, 180))
+        hint = render_text(self.font, "Press SPACE to continue", (180, 180, 180))
         self.screen.blit(hint, (SCREEN_WIDTH // 2 - hint.get_width() // 2, 400))
         
     def handle_event(self, event):
@@ -1,16 +1,22 @@
 from settings import get_vn_font
 import pygame
-import random
 import math
 from settings import *
+from utils.fonts import render_text
+from ui.overlays import draw_overlay
 from sprites.bird import Bird
 from sprites.projectile import FallingObstacle, Laser, BombFragment
+from utils.rng import rng_service
+from ui.render_queue import RenderQueue, LAYER_WORLD, LAYER_PROJECTILES
+
+rng = rng_service.stream("dodge_master")
 
 class DodgeMaster:
     """Dodge Master survival mini-game"""
     
     def __init__(self, screen, difficulty="medium"):
         self.screen = screen
+        self.render_queue = RenderQueue(screen)
         self.difficulty = difficulty
         
         # Game state
@@ -106,7 +112,7 @@ class DodgeMaster:
             
         # Boss waves - lasers
         if self.wave >= 5 and self.wave % 5 == 0:
-            if random.random() < 0.01:  # 1% chance per frame
+            if rng.random() < 0.01:  # 1% chance per frame
                 self.spawn_laser()
                 
         # Update obstacles
@@ -126,7 +132,7 @@ class DodgeMaster:
             
     def spawn_obstacle(self):
         """Spawn random obstacle"""
-        x = random.randint(30, SCREEN_WIDTH - 30)
+        x = rng.randint(30, SCREEN_WIDTH - 30)
         
         # Obstacle type based on wave
         if self.wave < 3:
@@ -138,24 +144,24 @@ class DodgeMaster:
         else:
             types = ["rock", "missile", "missile", "bomb"]
             
-        obstacle_type = random.choice(types)
+        obstacle_type = rng.choice(types)
         
         # Speed increases with wave
         speed = 3 + self.wave * 0.5
         
-        obstacle = FallingObstacle(x, obstacle_type, speed)
+        obstacle = FallingObstacle.acquire(x, obstacle_type, speed)
         self.obstacles.add(obstacle)
         
         # Missiles move horizontally
         if obstacle_type == "missile":
             obstacle.horizontal = True
-            obstacle.hspeed = random.choice([-3, 3])
+            obstacle.hspeed = rng.choice([-3, 3])
             obstacle.rect.left = 0 if obstacle.hspeed > 0 else SCREEN_WIDTH
-            obstacle.rect.centery = random.randint(100, SCREEN_HEIGHT - GROUND_HEIGHT - 100)
+            obstacle.rect.centery = rng.randint(100, SCREEN_HEIGHT - GROUND_HEIGHT - 100)
             
     def spawn_laser(self):
         """Spawn horizontal laser"""
-        y = random.randint(100, SCREEN_HEIGHT - GROUND_HEIGHT - 50)
+        y = rng.randint(100, SCREEN_HEIGHT - GROUND_HEIGHT - 50)
         laser = Laser(y)
         self.lasers.add(laser)
         
@@ -167,7 +173,7 @@ class DodgeMaster:
                     # Explode!
                     cx, cy = obstacle.rect.center
                     for angle in range(0, 360, 30):
-                        frag = BombFragment(cx, cy, angle)
+                        frag = BombFragment.acquire(cx, cy, angle)
                         self.fragments.add(frag)
                     obstacle.kill()
                     
@@ -230,17 +236,11 @@ class DodgeMaster:
         """Draw game"""
         background.draw(self.screen)
         
-        # Obstacles
-        for obstacle in self.obstacles:
-            self.screen.blit(obstacle.image, obstacle.rect)
-            
-        # Lasers
-        for laser in self.lasers:
-            self.screen.blit(laser.image, laser.rect)
-            
-        # Fragments
-        for frag in self.fragments:
-            self.screen.blit(frag.image, frag.rect)
+        # Obstacles, lasers, then fragments on top
+        self.render_queue.add_sprites(self.obstacles, LAYER_WORLD)
+        self.render_queue.add_sprites(self.lasers, LAYER_WORLD)
+        self.render_queue.add_sprites(self.fragments, LAYER_PROJECTILES)
+        self.render_queue.flush()
             
         ground.draw(self.screen)
         
@@ -257,41 +257,39 @@ class DodgeMaster:
     def draw_hud(self):
         """Draw HUD"""
         # Score
-        score_text = self.font.render(f"Score: {self.score}", True, WHITE)
+        score_text = render_text(self.font, f"Score: {self.score}", WHITE)
         self.screen.blit(score_text, (20, 20))
         
         # Wave
-        wave_text = self.font.render(f"Wave {self.wave}", True, PRIMARY_COLOR)
+        wave_text = render_text(self.font, f"Wave {self.wave}", PRIMARY_COLOR)
         self.screen.blit(wave_text, (SCREEN_WIDTH - 120, 20))
         
         # Dash indicator
         if self.dash_ready:
-            dash_text = get_vn_font(24).render("DASH READY [SPACE]", True, (100, 255, 100))
+            dash_text = render_text(get_vn_font(24), "DASH READY [SPACE]", (100, 255, 100))
         else:
             remaining = max(0, self.dash_cooldown - (pygame.time.get_ticks() - self.last_dash))
-            dash_text = get_vn_font(24).render(f"Dash: {remaining // 1000 + 1}s", True, (150, 150, 150))
+            dash_text = render_text(get_vn_font(24), f"Dash: {remaining // 1000 + 1}s", (150, 150, 150))
         self.screen.blit(dash_text, (SCREEN_WIDTH // 2 - dash_text.get_width() // 2, SCREEN_HEIGHT - 30))
         
         # Controls hint
-        hint = get_vn_font(20).render("← → to move", True, (180, 180, 180))
+        hint = render_text(get_vn_font(20), "← → to move", (180, 180, 180))
         self.screen.blit(hint, (SCREEN_WIDTH // 2 - hint.get_width() // 2, SCREEN_HEIGHT - 50))
         
     def draw_game_over(self):
         """Draw game over"""
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        self.screen.blit(overlay, (0, 0))
+        draw_overlay(self.screen, BLACK, 180)
         
-        title = self.big_font.render("GAME OVER", True, ACCENT_COLOR)
+        title = render_text(self.big_font, "GAME OVER", ACCENT_COLOR)
         self.screen.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, 180))
         
-        score = self.font.render(f"Final Score: {self.score}", True, WHITE)
+        score = render_text(self.font, f"Final Score: {self.score}", WHITE)
         self.screen.blit(score, (SCREEN_WIDTH // 2 - score.get_width() // 2, 270))
         
-        wave = self.font.render(f"Reached Wave: {self.wave}", True, PRIMARY_COLOR)
+        wave = render_text(self.font, f"Reached Wave: {self.wave}", PRIMARY_COLOR)
         self.screen.blit(wave, (SCREEN_WIDTH // 2 - wave.get_width() // 2, 310))
         
-        hint = self.font.render("Press SPACE to continue", True, (180, 180, 180))
+        hint = render_text(self.font, "Press SPACE to continue", (180, 180, 180))
         self.screen.blit(hint, (SCREEN_WIDTH // 2 - hint.get_width() // 2, 380))
         
     def handle_event(self, event):
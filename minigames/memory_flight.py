@@ -1,15 +1,21 @@
 from settings import get_vn_font
 import pygame
-import random
 from settings import *
+from utils.fonts import render_text
+from ui.overlays import draw_overlay
 from sprites.bird import Bird
 from sprites.projectile import ColorGate
+from utils.rng import rng_service
+from ui.render_queue import RenderQueue, LAYER_WORLD
+
+rng = rng_service.stream("memory_flight")
 
 class MemoryFlight:
     """Memory Flight puzzle mini-game - Simon Says style"""
     
     def __init__(self, screen, difficulty="medium"):
         self.screen = screen
+        self.render_queue = RenderQueue(screen)
         self.difficulty = difficulty
         
         # Game state
@@ -70,7 +76,7 @@ class MemoryFlight:
         
     def add_to_sequence(self):
         """Add random color to sequence"""
-        self.sequence.append(random.choice(self.colors))
+        self.sequence.append(rng.choice(self.colors))
         
     def start_showing(self):
         """Start showing sequence"""
@@ -201,8 +207,8 @@ class MemoryFlight:
         background.draw(self.screen)
         
         # Gates
-        for gate in self.gates:
-            self.screen.blit(gate.image, gate.rect)
+        self.render_queue.add_sprites(self.gates, LAYER_WORLD)
+        self.render_queue.flush()
             
         ground.draw(self.screen)
         
@@ -219,11 +225,11 @@ class MemoryFlight:
     def draw_hud(self):
         """Draw HUD"""
         # Score (sequence length)
-        score = self.font.render(f"Level: {self.score + 1}", True, WHITE)
+        score = render_text(self.font, f"Level: {self.score + 1}", WHITE)
         self.screen.blit(score, (20, 20))
         
         # Sequence length
-        seq = self.font.render(f"Sequence: {len(self.sequence)}", True, PRIMARY_COLOR)
+        seq = render_text(self.font, f"Sequence: {len(self.sequence)}", PRIMARY_COLOR)
         self.screen.blit(seq, (SCREEN_WIDTH - 180, 20))
         
         # State indicator
@@ -238,22 +244,20 @@ class MemoryFlight:
             color = WHITE
             
         if text:
-            state = self.font.render(text, True, color)
+            state = render_text(self.font, text, color)
             self.screen.blit(state, (SCREEN_WIDTH // 2 - state.get_width() // 2, 60))
             
     def draw_game_over(self):
         """Draw game over"""
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        self.screen.blit(overlay, (0, 0))
+        draw_overlay(self.screen, BLACK, 180)
         
-        title = self.big_font.render("GAME OVER", True, ACCENT_COLOR)
+        title = render_text(self.big_font, "GAME OVER", ACCENT_COLOR)
         self.screen.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, 180))
         
-        score = self.font.render(f"You remembered {self.score} sequences!", True, WHITE)
+        score = render_text(self.font, f"You remembered {self.score} sequences!", WHITE)
         self.screen.blit(score, (SCREEN_WIDTH // 2 - score.get_width() // 2, 280))
         
-        hint = self.font.render("Press SPACE to continue", True, (180, 180, 180))
+        hint = render_text(self.font, "Press SPACE to continue", (180, 180, 180))
         self.screen.blit(hint, (SCREEN_WIDTH // 2 - hint.get_width() // 2, 360))
         
     def handle_event(self, event):
@@ -2,6 +2,8 @@ from settings import get_vn_font
 import pygame
 import random
 from settings import *
+from utils.fonts import render_text
+from ui.overlays import draw_overlay
 
 class TreasureHunt:
     """Treasure Hunt maze adventure mini-game"""
@@ -281,12 +283,12 @@ class TreasureHunt:
             
         # Treasures
         treasure_text = f"Treasures: {self.treasures_collected}/{self.treasures_total}"
-        treasure = self.font.render(treasure_text, True, COIN_COLOR)
+        treasure = render_text(self.font, treasure_text, COIN_COLOR)
         self.screen.blit(treasure, (100, 12))
         
         # Key indicator
         if self.has_key:
-            key_text = self.font.render("KEY", True, (255, 215, 0))
+            key_text = render_text(self.font, "KEY", (255, 215, 0))
             self.screen.blit(key_text, (260, 12))
             
         # Timer
@@ -295,27 +297,25 @@ class TreasureHunt:
         seconds = remaining // 1000
         
         timer_color = ACCENT_COLOR if seconds <= 20 else WHITE
-        timer_text = self.font.render(f"Time: {seconds}s", True, timer_color)
+        timer_text = render_text(self.font, f"Time: {seconds}s", timer_color)
         self.screen.blit(timer_text, (SCREEN_WIDTH - 100, 12))
         
     def draw_game_over(self):
         """Draw game over"""
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        self.screen.blit(overlay, (0, 0))
+        draw_overlay(self.screen, BLACK, 180)
         
         if self.victory:
-            title = self.big_font.render("TREASURE FOUND!", True, COIN_COLOR)
+            title = render_text(self.big_font, "TREASURE FOUND!", COIN_COLOR)
             elapsed = pygame.time.get_ticks() - self.start_time
-            time_text = self.font.render(f"Time: {elapsed // 1000}s", True, WHITE)
+            time_text = render_text(self.font, f"Time: {elapsed // 1000}s", WHITE)
         else:
-            title = self.big_font.render("GAME OVER", True, ACCENT_COLOR)
-            time_text = self.font.render(f"Treasures: {self.treasures_collected}/{self.treasures_total}", True, WHITE)
+            title = render_text(self.big_font, "GAME OVER", ACCENT_COLOR)
+            time_text = render_text(self.font, f"Treasures: {self.treasures_collected}/{self.treasures_total}", WHITE)
             
         self.screen.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, 200))
         self.screen.blit(time_text, (SCREEN_WIDTH // 2 - time_text.get_width() // 2, 280))
         
-        hint = self.font.render("Press SPACE to continue", True, (180, 180, 180))
+        hint = render_text(self.font, "Press SPACE to continue", (180, 180, 180))
         self.screen.blit(hint, (SCREEN_WIDTH // 2 - hint.get_width() // 2, 350))
         
     def handle_event(self, event):
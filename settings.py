@@ -1,6 +1,7 @@
 import pygame
 import os
 from datetime import datetime
+from utils.fonts import get_vn_font
 
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -8,31 +9,6 @@ ASSETS_DIR = os.path.join(BASE_DIR, "assets", "images")
 SKINS_DIR = os.path.join(ASSETS_DIR, "skins")
 
 
-_font_cache = {}
-
-def get_vn_font(size):
-    """Get a system font that supports Vietnamese characters"""
-    if size in _font_cache:
-        return _font_cache[size]
-    
-    try:
-
-        for font_name in ['segoeui', 'arial', 'tahoma', 'msyh', 'dejavusans']:
-            font = pygame.font.SysFont(font_name, size)
-            if font:
-                _font_cache[size] = font
-                return font
-    except:
-        pass
-    
-
-    font = pygame.font.Font(None, size)
-    _font_cache[size] = font
-    return font
-
-
-
-
 def is_tet_season():
     now = datetime.now()
     month = now.month
@@ -45,6 +21,11 @@ TET_MODE = is_tet_season()
 SCREEN_WIDTH = 400
 SCREEN_HEIGHT = 600
 FPS = 60
+MAX_FRAME_TIME = 250  # ms of simulation catch-up allowed per frame
+DIRTY_RECTS = True  # repaint only changed areas on static screens
+VIEWPORT_MARGIN = 0  # px past the screen edges before off-screen entities despawn
+LAZY_PREWARM = True  # build remaining menus and modes while idling in the menu
+PREWARM_DELAY = 1000  # ms of menu time before prewarming starts
 TITLE = "Flappy Bird - Tết Nguyên Đán 2026 🧧" if TET_MODE else "Flappy Bird - Ultimate Edition v2.0"
 VERSION = "3.0 - Tet Edition" if TET_MODE else "2.0"
 
@@ -145,6 +126,7 @@ DIFFICULTIES = {
 
 
 CURRENT_DIFFICULTY = "medium"
+TIME_ATTACK_LIMIT = 60000  # ms per time attack run
 
 
 GRAVITY = 0.25
@@ -188,6 +170,10 @@ POWERUP_DURATION = 5000
 
 PARTICLE_COUNT = 15
 PARTICLE_LIFETIME = 500
+MAX_PARTICLES = 512
+PARTICLE_ALPHA_LEVELS = 16
+PARTICLE_ATLAS_SIZE = 2048
+PETAL_ROTATION_STEP = 10
 FIREWORK_PARTICLE_COUNT = 50 if TET_MODE else 0
 
 
@@ -206,8 +192,12 @@ FADE_SPEED = 8
 TRANSITION_SPEED = 15
 
 
-SCORE_FILE = os.path.join(BASE_DIR, "highscore.json")
-DATA_FILE = os.path.join(BASE_DIR, "gamedata.json")
+# FLAPPY_DATA_DIR keeps saves and replays elsewhere, e.g. for benchmarks
+DATA_DIR = os.environ.get("FLAPPY_DATA_DIR") or BASE_DIR
+SCORE_FILE = os.path.join(DATA_DIR, "highscore.json")
+DATA_FILE = os.path.join(DATA_DIR, "gamedata.json")
+REPLAY_DIR = os.path.join(DATA_DIR, "replays")
+FRAME_PROFILE_FILE = os.path.join(BASE_DIR, "frame_profile.csv")
 
 
 
@@ -2,4 +2,4 @@
 from sprites.bird import Bird
 from sprites.pipe import Pipe
 from sprites.background import Background, Ground
-from sprites.particles import ParticleSystem, Particle, ScoreParticle
+from sprites.particles import ParticleSystem, ScoreParticle
@@ -2,6 +2,36 @@ import pygame
 import random
 import math
 from settings import *
+from sprites.particles import particle_atlas
+from utils.rng import rng_service
+from utils.lifecycle import lifecycle
+from utils.disk_cache import cached_surface, surface_key
+
+# Cosmetic decorations draw from their own stream; baked textures use fixed seeds
+rng = rng_service.stream("background")
+
+# Bump when a baked texture changes so stale cached PNGs are ignored
+TEXTURE_VERSION = 1
+SKY_SIZE = (SCREEN_WIDTH, SCREEN_HEIGHT - GROUND_HEIGHT)
+GROUND_SIZE = (SCREEN_WIDTH, GROUND_HEIGHT)
+
+
+def vertical_gradient(width, height, top, bottom):
+    """Top-to-bottom gradient built as a 1px column and stretched sideways"""
+    column = pygame.Surface((1, height))
+    for y in range(height):
+        ratio = y / height
+        column.set_at((0, y), (
+            int(top[0] + (bottom[0] - top[0]) * ratio),
+            int(top[1] + (bottom[1] - top[1]) * ratio),
+            int(top[2] + (bottom[2] - top[2]) * ratio)
+        ))
+    return pygame.transform.scale(column, (width, height))
+
+
+def baked_texture(name, theme, size, factory):
+    """Procedural texture loaded from the disk cache when available"""
+    return cached_surface(surface_key(name, theme, size, TEXTURE_VERSION), factory)
 
 class Background:
     """Optimized Tet-themed background with fireworks and lanterns"""
@@ -23,12 +53,12 @@ class Background:
 
         if TET_MODE:
             if Background._tet_cached is None:
-                Background._tet_cached = self.create_tet_background()
+                Background._tet_cached = baked_texture("background", "tet", SKY_SIZE, self.create_tet_background)
             self.image = Background._tet_cached
             self.init_tet_effects()
         else:
             if Background._cached_surface is None:
-                Background._cached_surface = self.create_background()
+                Background._cached_surface = baked_texture("background", "default", SKY_SIZE, self.create_background)
             self.image = Background._cached_surface
         
     def init_tet_effects(self):
@@ -36,44 +66,36 @@ class Background:
 
         for i in range(5):
             self.lanterns.append({
-                'x': random.randint(30, SCREEN_WIDTH - 30),
-                'y': random.randint(20, 100),
-                'swing': random.uniform(0, math.pi * 2),
-                'size': random.randint(20, 35),
-                'color': random.choice([LANTERN_RED, LANTERN_GOLD])
+                'x': rng.randint(30, SCREEN_WIDTH - 30),
+                'y': rng.randint(20, 100),
+                'swing': rng.uniform(0, math.pi * 2),
+                'size': rng.randint(20, 35),
+                'color': rng.choice([LANTERN_RED, LANTERN_GOLD])
             })
         
 
         for _ in range(15):
             self.petals.append({
-                'x': random.randint(0, SCREEN_WIDTH),
-                'y': random.randint(0, SCREEN_HEIGHT),
-                'vx': random.uniform(-0.5, -0.2),
-                'vy': random.uniform(0.5, 1.5),
-                'size': random.randint(3, 8),
-                'rotation': random.uniform(0, 360),
-                'color': random.choice([TET_PINK, TET_YELLOW, (255, 200, 200)])
+                'x': rng.randint(0, SCREEN_WIDTH),
+                'y': rng.randint(0, SCREEN_HEIGHT),
+                'vx': rng.uniform(-0.5, -0.2),
+                'vy': rng.uniform(0.5, 1.5),
+                'size': rng.randint(3, 8),
+                'rotation': rng.uniform(0, 360),
+                'color': rng.choice([TET_PINK, TET_YELLOW, (255, 200, 200)])
             })
     
     def create_tet_background(self):
         """Create beautiful Tet night sky background"""
-        surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT - GROUND_HEIGHT))
+        surf = vertical_gradient(SCREEN_WIDTH, SCREEN_HEIGHT - GROUND_HEIGHT, SKY_TOP, SKY_BOTTOM)
         
 
-        for y in range(SCREEN_HEIGHT - GROUND_HEIGHT):
-            ratio = y / (SCREEN_HEIGHT - GROUND_HEIGHT)
-            r = int(SKY_TOP[0] + (SKY_BOTTOM[0] - SKY_TOP[0]) * ratio)
-            g = int(SKY_TOP[1] + (SKY_BOTTOM[1] - SKY_TOP[1]) * ratio)
-            b = int(SKY_TOP[2] + (SKY_BOTTOM[2] - SKY_TOP[2]) * ratio)
-            pygame.draw.line(surf, (r, g, b), (0, y), (SCREEN_WIDTH, y))
-        
-
-        random.seed(2026)
+        texture_rng = random.Random(2026)
         for _ in range(80):
-            x = random.randint(0, SCREEN_WIDTH)
-            y = random.randint(0, int((SCREEN_HEIGHT - GROUND_HEIGHT) * 0.7))
-            brightness = random.randint(150, 255)
-            size = random.randint(1, 3)
+            x = texture_rng.randint(0, SCREEN_WIDTH)
+            y = texture_rng.randint(0, int((SCREEN_HEIGHT - GROUND_HEIGHT) * 0.7))
+            brightness = texture_rng.randint(150, 255)
+            size = texture_rng.randint(1, 3)
             pygame.draw.circle(surf, (brightness, brightness, brightness), (x, y), size)
         
 
@@ -100,21 +122,14 @@ class Background:
             ])
             for wy in range(city_y - h + 58, city_y + 40, 12):
                 for wx in range(x + 5, x + w - 5, 10):
-                    if random.random() > 0.3:
-                        pygame.draw.rect(surf, (255, 200, 100, 150), (wx, wy, 5, 6))
+                    if texture_rng.random() > 0.3:
+                        surf.fill((255, 200, 100), (wx, wy, 5, 6))
         
         return surf
         
     def create_background(self):
         """Create default sky background"""
-        surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT - GROUND_HEIGHT))
-        
-        for y in range(SCREEN_HEIGHT - GROUND_HEIGHT):
-            ratio = y / (SCREEN_HEIGHT - GROUND_HEIGHT)
-            r = int(135 + (176 - 135) * ratio)
-            g = int(206 + (224 - 206) * ratio)
-            b = int(250 + (230 - 250) * ratio)
-            pygame.draw.line(surf, (r, g, b), (0, y), (SCREEN_WIDTH, y))
+        surf = vertical_gradient(SCREEN_WIDTH, SCREEN_HEIGHT - GROUND_HEIGHT, (135, 206, 250), (176, 224, 230))
         
         cloud_data = [(40, 50), (150, 80), (280, 40), (60, 150), (220, 170), (350, 100)]
         for cx, cy in cloud_data:
@@ -137,7 +152,7 @@ class Background:
             pygame.draw.rect(surf, city_color, (x, city_y - h + 40, 22, h))
             for wy in range(city_y - h + 45, city_y + 35, 8):
                 for wx in range(x + 3, x + 19, 6):
-                    pygame.draw.rect(surf, (180, 180, 150), (wx, wy, 3, 4))
+                    surf.fill((180, 180, 150), (wx, wy, 3, 4))
         
         return surf
     
@@ -145,7 +160,7 @@ class Background:
         """Spawn a new firework"""
         if len(self.fireworks) < 3:
             self.fireworks.append(Firework(
-                random.randint(50, SCREEN_WIDTH - 50),
+                rng.randint(50, SCREEN_WIDTH - 50),
                 SCREEN_HEIGHT - GROUND_HEIGHT
             ))
     
@@ -170,7 +185,7 @@ class Background:
 
                 if petal['y'] > SCREEN_HEIGHT - GROUND_HEIGHT:
                     petal['y'] = -10
-                    petal['x'] = random.randint(0, SCREEN_WIDTH)
+                    petal['x'] = rng.randint(0, SCREEN_WIDTH)
                 if petal['x'] < -10:
                     petal['x'] = SCREEN_WIDTH + 10
             
@@ -181,7 +196,7 @@ class Background:
                     self.fireworks.remove(fw)
             
 
-            if random.random() < 0.01:
+            if rng.random() < 0.01:
                 self.spawn_firework()
             
     def draw(self, screen):
@@ -204,14 +219,7 @@ class Background:
     def draw_petal(self, screen, petal):
         """Draw a falling petal"""
         x, y = int(petal['x']), int(petal['y'])
-        size = petal['size']
-        
-
-        surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-        pygame.draw.ellipse(surf, petal['color'], (0, size // 2, size * 2, size))
-        
-
-        rotated = pygame.transform.rotate(surf, petal['rotation'])
+        rotated = particle_atlas.petal(petal['color'], petal['size'], petal['rotation'])
         rect = rotated.get_rect(center=(x, y))
         screen.blit(rotated, rect)
     
@@ -249,12 +257,12 @@ class Firework:
     def __init__(self, x, y):
         self.x = x
         self.y = y
-        self.target_y = random.randint(80, 200)
-        self.vy = -random.uniform(8, 12)
+        self.target_y = rng.randint(80, 200)
+        self.vy = -rng.uniform(8, 12)
         self.phase = "rising"
         self.particles = []
         self.done = False
-        self.color = random.choice(FIREWORK_COLORS)
+        self.color = rng.choice(FIREWORK_COLORS)
         
     def update(self):
         if self.phase == "rising":
@@ -267,7 +275,7 @@ class Firework:
                 
         elif self.phase == "exploding" or self.phase == "fading":
             self.phase = "fading"
-            all_done = True
+            live = []
             
             for p in self.particles:
                 p['x'] += p['vx']
@@ -276,18 +284,24 @@ class Firework:
                 p['life'] -= 0.02
                 
                 if p['life'] > 0:
-                    all_done = False
+                    # particles fall back in from above, so only the bottom
+                    # and the side they drift towards count as leaving
+                    size = p['size']
+                    bounds = pygame.Rect(int(p['x']) - size, int(p['y']) - size, size * 2, size * 2)
+                    if not lifecycle.despawn("firework_particles", bounds, p['vx'], 1):
+                        live.append(p)
             
-            if all_done:
+            self.particles = live
+            if not live:
                 self.done = True
     
     def explode(self):
         """Create explosion particles"""
-        num_particles = random.randint(30, 50)
+        num_particles = rng.randint(30, 50)
         
         for _ in range(num_particles):
-            angle = random.uniform(0, math.pi * 2)
-            speed = random.uniform(2, 6)
+            angle = rng.uniform(0, math.pi * 2)
+            speed = rng.uniform(2, 6)
             
             self.particles.append({
                 'x': self.x,
@@ -296,7 +310,7 @@ class Firework:
                 'vy': math.sin(angle) * speed,
                 'life': 1.0,
                 'color': self.color,
-                'size': random.randint(2, 4)
+                'size': rng.randint(2, 4)
             })
     
     def draw(self, screen):
@@ -334,11 +348,11 @@ class Ground(pygame.sprite.Sprite):
         
         if TET_MODE:
             if Ground._tet_cached is None:
-                Ground._tet_cached = self.create_tet_ground()
+                Ground._tet_cached = baked_texture("ground", "tet", GROUND_SIZE, self.create_tet_ground)
             self.image = Ground._tet_cached
         else:
             if Ground._cached_surface is None:
-                Ground._cached_surface = self.create_ground()
+                Ground._cached_surface = baked_texture("ground", "default", GROUND_SIZE, self.create_ground)
             self.image = Ground._cached_surface
             
         self.rect = pygame.Rect(0, SCREEN_HEIGHT - GROUND_HEIGHT, SCREEN_WIDTH, GROUND_HEIGHT)
@@ -355,7 +369,7 @@ class Ground(pygame.sprite.Sprite):
         pygame.draw.rect(surf, (200, 160, 0), (0, 8, SCREEN_WIDTH, 4))
         
 
-        random.seed(88)
+        texture_rng = random.Random(88)
         for x in range(0, SCREEN_WIDTH, 40):
 
             pygame.draw.circle(surf, TET_RED, (x + 20, 25), 8)
@@ -363,8 +377,8 @@ class Ground(pygame.sprite.Sprite):
         
 
         for _ in range(30):
-            x = random.randint(0, SCREEN_WIDTH)
-            y = random.randint(35, GROUND_HEIGHT - 5)
+            x = texture_rng.randint(0, SCREEN_WIDTH)
+            y = texture_rng.randint(35, GROUND_HEIGHT - 5)
             pygame.draw.circle(surf, (120, 60, 20), (x, y), 2)
         
         return surf
@@ -380,10 +394,10 @@ class Ground(pygame.sprite.Sprite):
         
         pygame.draw.rect(surf, (139, 90, 43), (0, 18, SCREEN_WIDTH, GROUND_HEIGHT - 18))
         
-        random.seed(42)
+        texture_rng = random.Random(42)
         for _ in range(40):
-            x = random.randint(0, SCREEN_WIDTH)
-            y = random.randint(22, GROUND_HEIGHT - 5)
+            x = texture_rng.randint(0, SCREEN_WIDTH)
+            y = texture_rng.randint(22, GROUND_HEIGHT - 5)
             pygame.draw.circle(surf, (160, 110, 60), (x, y), 2)
             
         return surf
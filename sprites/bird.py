@@ -2,11 +2,18 @@ import pygame
 import math
 import os
 from settings import *
+from utils.clock import system_clock
+from sprites.rotation import RotatedFrames
+from utils.sprite_cache import sprite_cache
 
 class Bird(pygame.sprite.Sprite):
-    def __init__(self, difficulty="medium", skin_id="default"):
+    _rotation_cache = {}
+    
+    def __init__(self, difficulty="medium", skin_id="default", clock=None):
         super().__init__()
         
+        self.clock = clock or system_clock
+        
 
         diff_settings = DIFFICULTIES.get(difficulty, DIFFICULTIES["medium"])
         self.gravity = diff_settings["gravity"]
@@ -17,6 +24,9 @@ class Bird(pygame.sprite.Sprite):
 
         self.skin_id = skin_id
         self.create_sprite()
+        self.frames = Bird._rotation_cache.get(skin_id)
+        if self.frames is None:
+            self.frames = Bird._rotation_cache[skin_id] = RotatedFrames(self.base_image)
         
 
         self.rect = self.image.get_rect()
@@ -26,10 +36,11 @@ class Bird(pygame.sprite.Sprite):
         self.velocity = 0
         self.angle = 0
         self.target_angle = 0
+        self.frame_index = self.frames.index(0)
         
 
         self.animation_frame = 0
-        self.last_animation_time = pygame.time.get_ticks()
+        self.last_animation_time = self.clock.get_ticks()
         self.animation_speed = BIRD_ANIMATION_SPEED
         
 
@@ -44,6 +55,11 @@ class Bird(pygame.sprite.Sprite):
         self.glow_direction = 5
     
     def create_sprite(self):
+        """Bird sprite for the current skin, shared through the sprite cache"""
+        self.base_image = sprite_cache.get("bird", (self.skin_id, BIRD_WIDTH, BIRD_HEIGHT), self.draw_sprite)
+        self.image = self.base_image.copy()
+        
+    def draw_sprite(self):
         """Create bird sprite programmatically based on skin"""
         self.base_image = pygame.Surface((BIRD_WIDTH, BIRD_HEIGHT), pygame.SRCALPHA)
         
@@ -83,7 +99,7 @@ class Bird(pygame.sprite.Sprite):
 
         self.add_skin_effects()
         
-        self.image = self.base_image.copy()
+        return self.base_image
         
     def get_skin_colors(self):
         """Get colors for each skin type"""
@@ -125,7 +141,7 @@ class Bird(pygame.sprite.Sprite):
         if not self.alive:
             return
         
-        now = pygame.time.get_ticks()
+        now = self.clock.get_ticks()
         
         if self.has_shield and now > self.shield_timer:
             self.has_shield = False
@@ -146,7 +162,8 @@ class Bird(pygame.sprite.Sprite):
         self.angle += angle_diff * 0.2
         
 
-        self.image = pygame.transform.rotate(self.base_image, self.angle)
+        self.frame_index = self.frames.index(self.angle)
+        self.image = self.frames.images[self.frame_index]
         
 
         old_center = self.rect.center
@@ -169,11 +186,11 @@ class Bird(pygame.sprite.Sprite):
         
     def activate_shield(self, duration=5000):
         self.has_shield = True
-        self.shield_timer = pygame.time.get_ticks() + duration
+        self.shield_timer = self.clock.get_ticks() + duration
         
     def activate_invincible(self, duration=3000):
         self.invincible = True
-        self.invincible_timer = pygame.time.get_ticks() + duration
+        self.invincible_timer = self.clock.get_ticks() + duration
         
     def is_protected(self):
         return self.has_shield or self.invincible
@@ -193,5 +210,8 @@ class Bird(pygame.sprite.Sprite):
             screen.blit(glow_surf, (self.rect.centerx - BIRD_WIDTH // 2 - 15, 
                                      self.rect.centery - BIRD_HEIGHT // 2 - 15))
         
-    def get_mask(self):
-        return pygame.mask.from_surface(self.image)
+    @classmethod
+    def prebuild(cls, skin_id):
+        """Build the rotation table for a skin ahead of its first game"""
+        if skin_id not in cls._rotation_cache:
+            cls(skin_id=skin_id)
@@ -3,15 +3,24 @@ import os
 import random
 import math
 from settings import *
+from utils.clock import system_clock
+from utils.sprite_cache import sprite_cache
+from utils.fonts import get_default_font
+from utils.pool import PooledSprite
+from utils.lifecycle import lifecycle
 
-class Coin(pygame.sprite.Sprite):
+class Coin(PooledSprite):
     """Collectible coin - optimized with cached sprite"""
     
 
     _cached_sprite = None
     
-    def __init__(self, x, y, difficulty="medium"):
+    def __init__(self, x, y, difficulty="medium", clock=None, rng=None):
         super().__init__()
+        self.reset(x, y, difficulty, clock, rng)
+        
+    def reset(self, x, y, difficulty="medium", clock=None, rng=None):
+        self.clock = clock or system_clock
         
         diff_settings = DIFFICULTIES.get(difficulty, DIFFICULTIES["medium"])
         self.scroll_speed = diff_settings["scroll_speed"]
@@ -25,7 +34,7 @@ class Coin(pygame.sprite.Sprite):
         
 
         self.base_y = y
-        self.animation_offset = random.uniform(0, math.pi * 2)
+        self.animation_offset = (rng or random).uniform(0, math.pi * 2)
         self.collected = False
         
 
@@ -75,10 +84,10 @@ class Coin(pygame.sprite.Sprite):
                     self.rect.y += int(dy / dist * 8)
         
 
-        time = pygame.time.get_ticks() / 200 + self.animation_offset
+        time = self.clock.get_ticks() / 200 + self.animation_offset
         self.rect.centery = int(self.base_y + math.sin(time) * 5)
         
-        if self.rect.right < 0:
+        if lifecycle.despawn("coins", self.rect, -self.scroll_speed):
             self.kill()
             
     def attract_to(self, bird):
@@ -92,9 +101,11 @@ class PowerUp(pygame.sprite.Sprite):
 
     _cached_sprites = {}
     
-    def __init__(self, x, y, power_type, difficulty="medium"):
+    def __init__(self, x, y, power_type, difficulty="medium", clock=None):
         super().__init__()
         
+        self.clock = clock or system_clock
+        
         diff_settings = DIFFICULTIES.get(difficulty, DIFFICULTIES["medium"])
         self.scroll_speed = diff_settings["scroll_speed"]
         
@@ -102,7 +113,7 @@ class PowerUp(pygame.sprite.Sprite):
         
 
         if power_type not in PowerUp._cached_sprites:
-            PowerUp._cached_sprites[power_type] = self.create_sprite()
+            PowerUp._cached_sprites[power_type] = sprite_cache.get("powerup", (power_type, POWERUP_SIZE), self.create_sprite)
         
         self.image = PowerUp._cached_sprites[power_type]
         self.rect = self.image.get_rect(center=(x, y))
@@ -144,7 +155,7 @@ class PowerUp(pygame.sprite.Sprite):
             ], 2)
             
 
-            font = pygame.font.Font(None, 18)
+            font = get_default_font(18)
             text = font.render("2x", True, WHITE)
             text_rect = text.get_rect(center=(center, center))
             surf.blit(text, text_rect)
@@ -154,8 +165,8 @@ class PowerUp(pygame.sprite.Sprite):
     def update(self):
         self.rect.x -= self.scroll_speed
         
-        time = pygame.time.get_ticks() / 200
+        time = self.clock.get_ticks() / 200
         self.rect.centery = int(self.base_y + math.sin(time) * 8)
         
-        if self.rect.right < 0:
+        if lifecycle.despawn("powerups", self.rect, -self.scroll_speed):
             self.kill()
@@ -0,0 +1,80 @@
+import pygame
+from settings import *
+from sprites.pipe import PIPE_CAP_HEIGHT, PIPE_BODY_INSET
+
+# Analytic bird/pipe collision
+# Each row of a pipe is one column interval: the body is opaque between
+# its inset borders and the cap spans the full width. The bird side is a
+# RowHull of its current rotation frame: every mask row as a bit set of
+# opaque columns, plus a sparse table of ORs over row ranges. A band of
+# pipe rows then hits the bird exactly when the OR of the bird rows in
+# that band shares a bit with the band's interval, so one test is at most
+# two table lookups and gives the same answer as Mask.overlap.
+
+
+def mask_row_bits(mask):
+    """Per row of mask, an int with bit x set where column x is set"""
+    width, height = mask.get_size()
+    row = pygame.mask.Mask((width, 1), fill=True)
+    rows = []
+    for y in range(height):
+        # within a single row each connected component is one run
+        bits = 0
+        for rect in mask.overlap_mask(row, (0, y)).get_bounding_rects():
+            bits |= (1 << rect.right) - (1 << rect.left)
+        rows.append(bits)
+    return rows
+
+
+class RowHull:
+    """Opaque columns of a mask per row, with constant-time range ORs"""
+
+    __slots__ = ("width", "height", "levels")
+
+    def __init__(self, mask):
+        self.width, self.height = mask.get_size()
+        # levels[k][i] is the OR of rows i .. i + 2**k - 1
+        self.levels = [tuple(mask_row_bits(mask))]
+        span = 1
+        while span * 2 <= self.height:
+            rows = self.levels[-1]
+            self.levels.append(tuple(rows[i] | rows[i + span] for i in range(len(rows) - span)))
+            span *= 2
+
+    def rows(self, first, last):
+        """Bits set in any row of [first, last); the range must be non-empty"""
+        level = (last - first).bit_length() - 1
+        table = self.levels[level]
+        return table[first] | table[last - (1 << level)]
+
+    def columns(self, left, right):
+        """Bit set for columns [left, right) clipped to the mask"""
+        left = max(left, 0)
+        right = min(right, self.width)
+        return (1 << right) - (1 << left) if left < right else 0
+
+
+def bird_hits_pipe(bird, pipe):
+    """True when the bird's opaque pixels overlap the pipe's"""
+    hull = bird.frames.hull(bird.frame_index)
+    bird_x, bird_y = bird.rect.topleft
+    pipe_rect = pipe.rect
+
+    first = max(pipe_rect.top, bird_y)
+    last = min(pipe_rect.bottom, bird_y + hull.height)
+    if first >= last:
+        return False
+
+    # every pipe row covers the body interval, so test all rows against it
+    left = pipe_rect.x - bird_x
+    if hull.rows(first - bird_y, last - bird_y) & hull.columns(left + PIPE_BODY_INSET, left + PIPE_WIDTH - PIPE_BODY_INSET):
+        return True
+
+    # then only the cap rows against the wider cap interval
+    if pipe.is_top:
+        first = max(first, pipe_rect.bottom - PIPE_CAP_HEIGHT)
+    else:
+        last = min(last, pipe_rect.top + PIPE_CAP_HEIGHT)
+    if first >= last:
+        return False
+    return bool(hull.rows(first - bird_y, last - bird_y) & hull.columns(left, left + PIPE_WIDTH))
@@ -1,17 +1,29 @@
 import pygame
-import random
 import math
 from settings import *
+from utils.fonts import render_text, get_default_font
 from sprites.projectile import Bullet
+from sprites.rotation import RotatedFrames
+from utils.sprite_cache import sprite_cache
+from utils.rng import rng_service
+
+rng = rng_service.stream("enemy")
 
 class EnemyBird(pygame.sprite.Sprite):
     """AI-controlled enemy bird for Bird Battle"""
     
+    _frames = None
+    _flash_frames = None
+    
     def __init__(self, difficulty="medium", x=None, y=None):
         super().__init__()
         
         self.difficulty = difficulty
         self.create_sprite()
+        if EnemyBird._frames is None:
+            EnemyBird._frames = RotatedFrames(self.base_image)
+            EnemyBird._flash_frames = RotatedFrames(self.base_image, post_process=self.add_flash)
+        self.frames = EnemyBird._frames
         
 
         self.rect = self.image.get_rect()
@@ -36,6 +48,7 @@ class EnemyBird(pygame.sprite.Sprite):
         
 
         self.angle = 0
+        self.frame_index = self.frames.index(0)
         self.hit_flash = 0
         
     def get_ai_settings(self):
@@ -86,6 +99,13 @@ class EnemyBird(pygame.sprite.Sprite):
         
         self.image = self.base_image.copy()
         
+    @staticmethod
+    def add_flash(image):
+        """Brightened copy of a frame shown while hit"""
+        flash_surf = image.copy()
+        flash_surf.fill((255, 255, 255, 100), special_flags=pygame.BLEND_RGBA_ADD)
+        return flash_surf
+        
     def update(self, player_bird=None, bullets=None):
         if not self.alive:
             return
@@ -125,12 +145,12 @@ class EnemyBird(pygame.sprite.Sprite):
         self.angle += (self.target_angle - self.angle) * 0.2
         
 
-        self.image = pygame.transform.rotate(self.base_image, self.angle)
         if self.hit_flash > 0 and self.hit_flash % 4 < 2:
-
-            flash_surf = self.image.copy()
-            flash_surf.fill((255, 255, 255, 100), special_flags=pygame.BLEND_RGBA_ADD)
-            self.image = flash_surf
+            self.frames = EnemyBird._flash_frames
+        else:
+            self.frames = EnemyBird._frames
+        self.frame_index = self.frames.index(self.angle)
+        self.image = self.frames.images[self.frame_index]
             
         old_center = self.rect.center
         self.rect = self.image.get_rect()
@@ -142,7 +162,7 @@ class EnemyBird(pygame.sprite.Sprite):
             return
             
 
-        if bullets and random.random() < self.ai_settings["dodge_chance"]:
+        if bullets and rng.random() < self.ai_settings["dodge_chance"]:
             for bullet in bullets:
                 if bullet.owner == "player":
 
@@ -156,10 +176,10 @@ class EnemyBird(pygame.sprite.Sprite):
                             return
         
 
-        if random.random() < self.ai_settings["accuracy"]:
-            self.target_y = player_bird.rect.centery + random.randint(-30, 30)
+        if rng.random() < self.ai_settings["accuracy"]:
+            self.target_y = player_bird.rect.centery + rng.randint(-30, 30)
         else:
-            self.target_y = random.randint(100, SCREEN_HEIGHT - GROUND_HEIGHT - 100)
+            self.target_y = rng.randint(100, SCREEN_HEIGHT - GROUND_HEIGHT - 100)
             
     def jump(self):
         if self.alive:
@@ -168,14 +188,14 @@ class EnemyBird(pygame.sprite.Sprite):
     def can_shoot(self):
         now = pygame.time.get_ticks()
         if now - self.last_shot > self.ai_settings["shoot_cooldown"]:
-            if random.random() < self.ai_settings["accuracy"]:
+            if rng.random() < self.ai_settings["accuracy"]:
                 self.last_shot = now
                 return True
         return False
         
     def shoot(self):
         """Create bullet going left"""
-        return Bullet(
+        return Bullet.acquire(
             self.rect.left, 
             self.rect.centery,
             direction=-1,
@@ -193,7 +213,7 @@ class EnemyBird(pygame.sprite.Sprite):
         return False
         
     def get_mask(self):
-        return pygame.mask.from_surface(self.image)
+        return self.frames.masks[self.frame_index]
 
 
 class Boss(pygame.sprite.Sprite):
@@ -232,6 +252,10 @@ class Boss(pygame.sprite.Sprite):
         self.weak_point_glow = 0
         
     def create_sprite(self):
+        """Boss sprite for the current phase, shared through the sprite cache"""
+        self.image = sprite_cache.get("boss", (self.phase,), self.draw_sprite)
+        
+    def draw_sprite(self):
         """Create boss sprite - giant raven"""
         size = 100
         self.image = pygame.Surface((size, size), pygame.SRCALPHA)
@@ -266,6 +290,8 @@ class Boss(pygame.sprite.Sprite):
         if self.phase == 3:
             pygame.draw.circle(self.image, (100, 255, 100), (8, 50), 8)
             
+        return self.image
+            
     def update(self, dt=0):
         if not self.alive:
             return
@@ -294,7 +320,7 @@ class Boss(pygame.sprite.Sprite):
 
             if now - self.state_timer > 2000:
                 self.state = "attacking"
-                self.attack_pattern = random.randint(0, 2)
+                self.attack_pattern = rng.randint(0, 2)
                 self.state_timer = now
                 
         elif self.state == "attacking":
@@ -330,7 +356,7 @@ class Boss(pygame.sprite.Sprite):
 
             if self.attack_pattern == 0:
                 for offset in [-20, 0, 20]:
-                    attacks.append(Bullet(
+                    attacks.append(Bullet.acquire(
                         self.rect.left, self.rect.centery + offset,
                         direction=-1, speed=6, color=(150, 50, 150), owner="boss"
                     ))
@@ -340,7 +366,7 @@ class Boss(pygame.sprite.Sprite):
             if self.attack_pattern == 0:
                 for angle in range(-30, 31, 15):
                     rad = math.radians(180 + angle)
-                    attacks.append(Bullet(
+                    attacks.append(Bullet.acquire(
                         self.rect.left, self.rect.centery,
                         direction=-1, speed=5, color=(255, 150, 50), owner="boss"
                     ))
@@ -348,7 +374,7 @@ class Boss(pygame.sprite.Sprite):
         elif self.phase == 3:
 
             for angle in range(-40, 41, 20):
-                attacks.append(Bullet(
+                attacks.append(Bullet.acquire(
                     self.rect.left, self.rect.centery,
                     direction=-1, speed=7, color=(100, 255, 100), owner="boss"
                 ))
@@ -405,6 +431,6 @@ class Boss(pygame.sprite.Sprite):
             pygame.draw.line(screen, WHITE, (marker_x, y), (marker_x, y + bar_height), 2)
             
 
-        font = pygame.font.Font(None, 24)
-        name = font.render("THE GIANT RAVEN", True, WHITE)
+        font = get_default_font(24)
+        name = render_text(font, "THE GIANT RAVEN", WHITE)
         screen.blit(name, (SCREEN_WIDTH // 2 - name.get_width() // 2, y + bar_height + 5))
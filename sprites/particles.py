@@ -1,48 +1,53 @@
 import pygame
-import random
 import math
 from settings import *
+from utils.fonts import render_text
+from utils.cache import LRUCache
+from utils.rng import rng_service
 
-class Particle:
-    def __init__(self, x, y, color, velocity, lifetime=500, size=5, gravity=0.1):
-        self.x = x
-        self.y = y
-        self.color = color
-        self.vx = velocity[0]
-        self.vy = velocity[1]
-        self.lifetime = lifetime
-        self.max_lifetime = lifetime
-        self.size = size
-        self.gravity = gravity
-        self.alpha = 255
-        
-    def update(self, dt):
-        """Update particle position and lifetime"""
-        self.x += self.vx
-        self.y += self.vy
-        self.vy += self.gravity
-        
+rng = rng_service.stream("effects")
 
-        self.lifetime -= dt
-        
+class ParticleAtlas:
+    """Pre-rendered particle sprites so drawing is a plain blit.
 
-        self.alpha = max(0, int(255 * (self.lifetime / self.max_lifetime)))
+    Circles are keyed by (color, radius, alpha bucket) and petals by
+    (color, size, rotation bucket); both are built lazily and LRU-evicted.
+    """
+    
+    def __init__(self, maxsize=PARTICLE_ATLAS_SIZE):
+        self.circles = LRUCache(maxsize)
+        self.petals = LRUCache(maxsize // 2)
         
-        return self.lifetime > 0
+    def circle(self, color, radius, alpha):
+        """Circle of the given radius, alpha quantized to PARTICLE_ALPHA_LEVELS"""
+        bucket = alpha * PARTICLE_ALPHA_LEVELS // 256
+        key = (color[0], color[1], color[2], radius, bucket)
+        surf = self.circles.get(key)
+        if surf is None:
+            level_alpha = min(255, (bucket + 1) * 256 // PARTICLE_ALPHA_LEVELS)
+            surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(surf, (color[0], color[1], color[2], level_alpha), (radius, radius), radius)
+            self.circles.put(key, surf)
+        return surf
         
-    def draw(self, screen):
-        """Draw the particle"""
-        if self.alpha <= 0:
-            return
-            
-
-        size = max(1, int(self.size * (self.lifetime / self.max_lifetime)))
-        surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+    def petal(self, color, size, rotation):
+        """Rotated petal ellipse, rotation quantized to PETAL_ROTATION_STEP degrees"""
+        bucket = int(rotation) % 360 // PETAL_ROTATION_STEP
+        key = (color, size, bucket)
+        surf = self.petals.get(key)
+        if surf is None:
+            base = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+            pygame.draw.ellipse(base, color, (0, size // 2, size * 2, size))
+            surf = pygame.transform.rotate(base, bucket * PETAL_ROTATION_STEP)
+            self.petals.put(key, surf)
+        return surf
         
-        color_with_alpha = (*self.color[:3], self.alpha)
-        pygame.draw.circle(surf, color_with_alpha, (size, size), size)
-        
-        screen.blit(surf, (int(self.x) - size, int(self.y) - size))
+    def clear(self):
+        self.circles.clear()
+        self.petals.clear()
+
+
+particle_atlas = ParticleAtlas()
 
 
 class ScoreParticle:
@@ -67,11 +72,11 @@ class ScoreParticle:
         if self.alpha <= 0:
             return
             
-        text_surf = self.font.render("+1", True, PRIMARY_COLOR)
+        text_surf = render_text(self.font, "+1", PRIMARY_COLOR)
         text_surf.set_alpha(self.alpha)
         
 
-        shadow_surf = self.font.render("+1", True, TEXT_SHADOW)
+        shadow_surf = render_text(self.font, "+1", TEXT_SHADOW)
         shadow_surf.set_alpha(self.alpha)
         
         screen.blit(shadow_surf, (self.x + 2, self.y + 2))
@@ -79,10 +84,49 @@ class ScoreParticle:
 
 
 class ParticleSystem:
-    def __init__(self):
-        self.particles = []
+    """Particle pool stored as parallel arrays instead of one object per particle.
+
+    Live particles occupy slots [0, count); a dead particle is replaced by the
+    last live one so the pool stays compact without rebuilding any list.
+    The arrays are plain lists and update() still steps one particle at a
+    time: NumPy columns would allow whole-array updates, but the game does
+    not depend on NumPy and this pool does not add it.
+    """
+    
+    def __init__(self, capacity=MAX_PARTICLES):
+        self.capacity = capacity
+        self.count = 0
+        
+        self.xs = [0.0] * capacity
+        self.ys = [0.0] * capacity
+        self.vxs = [0.0] * capacity
+        self.vys = [0.0] * capacity
+        self.lifetimes = [0.0] * capacity
+        self.max_lifetimes = [1.0] * capacity
+        self.sizes = [0] * capacity
+        self.gravities = [0.0] * capacity
+        self.colors = [WHITE] * capacity
+        
         self.score_particles = []
         
+    def spawn(self, x, y, color, velocity, lifetime=500, size=5, gravity=0.1):
+        """Add one particle, dropping it if the pool is full"""
+        i = self.count
+        if i >= self.capacity:
+            return False
+        
+        self.xs[i] = x
+        self.ys[i] = y
+        self.vxs[i] = velocity[0]
+        self.vys[i] = velocity[1]
+        self.lifetimes[i] = lifetime
+        self.max_lifetimes[i] = lifetime
+        self.sizes[i] = size
+        self.gravities[i] = gravity
+        self.colors[i] = color
+        self.count = i + 1
+        return True
+        
     def emit_death(self, x, y):
         """Emit particles when bird dies"""
         colors = [
@@ -93,16 +137,16 @@ class ParticleSystem:
         ]
         
         for _ in range(PARTICLE_COUNT):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(2, 6)
+            angle = rng.uniform(0, 2 * math.pi)
+            speed = rng.uniform(2, 6)
             vx = math.cos(angle) * speed
             vy = math.sin(angle) * speed - 2
             
-            color = random.choice(colors)
-            size = random.randint(3, 8)
-            lifetime = random.randint(300, 600)
+            color = rng.choice(colors)
+            size = rng.randint(3, 8)
+            lifetime = rng.randint(300, 600)
             
-            self.particles.append(Particle(x, y, color, (vx, vy), lifetime, size, 0.15))
+            self.spawn(x, y, color, (vx, vy), lifetime, size, 0.15)
             
     def emit_score(self, x, y):
         """Emit particles when scoring"""
@@ -112,14 +156,14 @@ class ParticleSystem:
         colors = [PRIMARY_COLOR, (255, 255, 200), (255, 215, 0)]
         
         for _ in range(5):
-            angle = random.uniform(-math.pi/2 - 0.5, -math.pi/2 + 0.5)
-            speed = random.uniform(1, 3)
+            angle = rng.uniform(-math.pi/2 - 0.5, -math.pi/2 + 0.5)
+            speed = rng.uniform(1, 3)
             vx = math.cos(angle) * speed
             vy = math.sin(angle) * speed
             
-            color = random.choice(colors)
+            color = rng.choice(colors)
             
-            self.particles.append(Particle(x, y, color, (vx, vy), 400, 4, 0.05))
+            self.spawn(x, y, color, (vx, vy), 400, 4, 0.05)
             
     def emit_new_highscore(self, x, y):
         """Special particles for new high score"""
@@ -131,16 +175,16 @@ class ParticleSystem:
         ]
         
         for _ in range(30):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(3, 8)
+            angle = rng.uniform(0, 2 * math.pi)
+            speed = rng.uniform(3, 8)
             vx = math.cos(angle) * speed
             vy = math.sin(angle) * speed
             
-            color = random.choice(colors)
-            size = random.randint(4, 10)
-            lifetime = random.randint(500, 1000)
+            color = rng.choice(colors)
+            size = rng.randint(4, 10)
+            lifetime = rng.randint(500, 1000)
             
-            self.particles.append(Particle(x, y, color, (vx, vy), lifetime, size, 0.08))
+            self.spawn(x, y, color, (vx, vy), lifetime, size, 0.08)
             
     def emit_firework(self, x, y):
         """Emit firework explosion for Tet"""
@@ -154,8 +198,8 @@ class ParticleSystem:
                  colors = [TET_GOLD, TET_RED, (255, 100, 200)]
              
         for _ in range(50):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(2, 9)
+            angle = rng.uniform(0, 2 * math.pi)
+            speed = rng.uniform(2, 9)
             vx = math.cos(angle) * speed
             vy = math.sin(angle) * speed
             
@@ -163,25 +207,66 @@ class ParticleSystem:
             if not isinstance(colors, list):
                 colors = [colors]
                 
-            color = random.choice(colors)
-            size = random.randint(2, 6)
-            lifetime = random.randint(800, 1500)
+            color = rng.choice(colors)
+            size = rng.randint(2, 6)
+            lifetime = rng.randint(800, 1500)
             
-            self.particles.append(Particle(x, y, color, (vx, vy), lifetime, size, 0.05))
+            self.spawn(x, y, color, (vx, vy), lifetime, size, 0.05)
             
     def update(self, dt):
         """Update all particles"""
-        self.particles = [p for p in self.particles if p.update(dt)]
+        xs, ys = self.xs, self.ys
+        vxs, vys = self.vxs, self.vys
+        lifetimes = self.lifetimes
+        gravities = self.gravities
+        
+        i = 0
+        n = self.count
+        while i < n:
+            lifetimes[i] -= dt
+            if lifetimes[i] <= 0:
+                n -= 1
+                self.move_slot(n, i)
+                continue
+            xs[i] += vxs[i]
+            ys[i] += vys[i]
+            vys[i] += gravities[i]
+            i += 1
+        self.count = n
+        
         self.score_particles = [p for p in self.score_particles if p.update(dt)]
         
+    def move_slot(self, src, dst):
+        """Copy particle src over slot dst"""
+        self.xs[dst] = self.xs[src]
+        self.ys[dst] = self.ys[src]
+        self.vxs[dst] = self.vxs[src]
+        self.vys[dst] = self.vys[src]
+        self.lifetimes[dst] = self.lifetimes[src]
+        self.max_lifetimes[dst] = self.max_lifetimes[src]
+        self.sizes[dst] = self.sizes[src]
+        self.gravities[dst] = self.gravities[src]
+        self.colors[dst] = self.colors[src]
+        
     def draw(self, screen):
         """Draw all particles"""
-        for particle in self.particles:
-            particle.draw(screen)
+        circle = particle_atlas.circle
+        batch = []
+        for i in range(self.count):
+            ratio = self.lifetimes[i] / self.max_lifetimes[i]
+            alpha = int(255 * ratio)
+            if alpha <= 0:
+                continue
+            
+            size = max(1, int(self.sizes[i] * ratio))
+            batch.append((circle(self.colors[i], size, alpha), (int(self.xs[i]) - size, int(self.ys[i]) - size)))
+        if batch:
+            screen.blits(batch, False)
+            
         for particle in self.score_particles:
             particle.draw(screen)
             
     def clear(self):
         """Clear all particles"""
-        self.particles = []
+        self.count = 0
         self.score_particles = []
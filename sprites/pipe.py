@@ -1,8 +1,26 @@
 import pygame
 import os
 from settings import *
+from utils.lifecycle import lifecycle
+
+# Pipe shape, shared with sprites.collision: the body is opaque between
+# the inset borders, the cap spans the full width
+PIPE_CAP_HEIGHT = 28
+PIPE_BODY_INSET = 2
+
+def pipe_gap_range(difficulty):
+    """Pipe gap size and the (min, max) gap centre that spawns can produce"""
+    pipe_gap = DIFFICULTIES[difficulty]["pipe_gap"]
+    min_y = GROUND_HEIGHT + pipe_gap // 2 + 60
+    max_y = SCREEN_HEIGHT - GROUND_HEIGHT - pipe_gap // 2 - 60
+    return pipe_gap, min_y, max_y
+
 
 class Pipe(pygame.sprite.Sprite):
+    """Pipe segment drawn once per (height, is_top) and shared between spawns"""
+    
+    _cached_sprites = {}
+    
     def __init__(self, position, is_top=False, difficulty="medium"):
         super().__init__()
         
@@ -19,9 +37,8 @@ class Pipe(pygame.sprite.Sprite):
             pipe_height = SCREEN_HEIGHT - position[1]
         
         pipe_height = max(pipe_height, 50)
-        
-
-        self.create_sprite(pipe_height)
+        self.height = pipe_height
+        self.image = Pipe.get_sprite(pipe_height, is_top)
         
         self.rect = self.image.get_rect()
         
@@ -30,9 +47,27 @@ class Pipe(pygame.sprite.Sprite):
         else:
             self.rect.topleft = position
             
-    def create_sprite(self, height):
+    @classmethod
+    def get_sprite(cls, height, is_top):
+        """Shared, fully drawn pipe surface of the given height"""
+        key = (height, is_top)
+        sprite = cls._cached_sprites.get(key)
+        if sprite is None:
+            sprite = cls._cached_sprites[key] = cls.create_sprite(height, is_top)
+        return sprite
+    
+    @classmethod
+    def prewarm(cls, difficulty):
+        """Build every pipe surface a spawn can need for difficulty"""
+        pipe_gap, min_y, max_y = pipe_gap_range(difficulty)
+        for gap_y in range(min_y, max_y + 1):
+            cls.get_sprite(max(gap_y - pipe_gap // 2, 50), True)
+            cls.get_sprite(max(SCREEN_HEIGHT - (gap_y + pipe_gap // 2), 50), False)
+    
+    @staticmethod
+    def create_sprite(height, is_top):
         """Create pipe sprite programmatically"""
-        self.image = pygame.Surface((PIPE_WIDTH, height), pygame.SRCALPHA)
+        image = pygame.Surface((PIPE_WIDTH, height), pygame.SRCALPHA)
         
 
         body_color = (46, 204, 113)      # Green
@@ -41,36 +76,34 @@ class Pipe(pygame.sprite.Sprite):
         border_color = (30, 100, 60)     # Border
         
 
-        pygame.draw.rect(self.image, body_color, (4, 0, PIPE_WIDTH - 8, height))
+        pygame.draw.rect(image, body_color, (4, 0, PIPE_WIDTH - 8, height))
         
 
-        pygame.draw.rect(self.image, highlight, (4, 0, 10, height))
+        pygame.draw.rect(image, highlight, (4, 0, 10, height))
         
 
-        pygame.draw.rect(self.image, dark_color, (PIPE_WIDTH - 14, 0, 10, height))
+        pygame.draw.rect(image, dark_color, (PIPE_WIDTH - 14, 0, 10, height))
         
 
-        cap_height = 28
+        cap_height = PIPE_CAP_HEIGHT
         cap_extra = 4
         
-        if self.is_top:
+        if is_top:
             cap_y = height - cap_height
-            pygame.draw.rect(self.image, body_color, (-cap_extra, cap_y, PIPE_WIDTH + cap_extra * 2, cap_height))
-            pygame.draw.rect(self.image, highlight, (-cap_extra, cap_y, PIPE_WIDTH + cap_extra * 2, 4))
-            pygame.draw.rect(self.image, dark_color, (-cap_extra, cap_y + cap_height - 4, PIPE_WIDTH + cap_extra * 2, 4))
-            pygame.draw.rect(self.image, border_color, (-cap_extra, cap_y, PIPE_WIDTH + cap_extra * 2, cap_height), 2)
+            pygame.draw.rect(image, body_color, (-cap_extra, cap_y, PIPE_WIDTH + cap_extra * 2, cap_height))
+            pygame.draw.rect(image, highlight, (-cap_extra, cap_y, PIPE_WIDTH + cap_extra * 2, 4))
+            pygame.draw.rect(image, dark_color, (-cap_extra, cap_y + cap_height - 4, PIPE_WIDTH + cap_extra * 2, 4))
+            pygame.draw.rect(image, border_color, (-cap_extra, cap_y, PIPE_WIDTH + cap_extra * 2, cap_height), 2)
         else:
-            pygame.draw.rect(self.image, body_color, (-cap_extra, 0, PIPE_WIDTH + cap_extra * 2, cap_height))
-            pygame.draw.rect(self.image, highlight, (-cap_extra, 0, PIPE_WIDTH + cap_extra * 2, 4))
-            pygame.draw.rect(self.image, dark_color, (-cap_extra, cap_height - 4, PIPE_WIDTH + cap_extra * 2, 4))
-            pygame.draw.rect(self.image, border_color, (-cap_extra, 0, PIPE_WIDTH + cap_extra * 2, cap_height), 2)
+            pygame.draw.rect(image, body_color, (-cap_extra, 0, PIPE_WIDTH + cap_extra * 2, cap_height))
+            pygame.draw.rect(image, highlight, (-cap_extra, 0, PIPE_WIDTH + cap_extra * 2, 4))
+            pygame.draw.rect(image, dark_color, (-cap_extra, cap_height - 4, PIPE_WIDTH + cap_extra * 2, 4))
+            pygame.draw.rect(image, border_color, (-cap_extra, 0, PIPE_WIDTH + cap_extra * 2, cap_height), 2)
         
-        pygame.draw.rect(self.image, border_color, (2, 0, PIPE_WIDTH - 4, height), 2)
+        pygame.draw.rect(image, border_color, (PIPE_BODY_INSET, 0, PIPE_WIDTH - PIPE_BODY_INSET * 2, height), 2)
+        return image
             
     def update(self):
         self.rect.x -= self.scroll_speed
-        if self.rect.right < 0:
+        if lifecycle.despawn("pipes", self.rect, -self.scroll_speed):
             self.kill()
-            
-    def get_mask(self):
-        return pygame.mask.from_surface(self.image)
@@ -1,31 +1,63 @@
 import pygame
 import math
 from settings import *
+from utils.sprite_cache import sprite_cache
+from utils.cache import LRUCache
+from utils.pool import PooledSprite
+from utils.lifecycle import lifecycle
 
-class Bullet(pygame.sprite.Sprite):
+# Every projectile variant is drawn once per process and shared: fixed
+# looks go through sprite_cache like the other generated sprites, while
+# the laser's per-frame warning pulse (one frame per alpha value) stays
+# in memory only
+LASER_FRAME_CACHE_SIZE = 128
+_laser_frames = LRUCache(LASER_FRAME_CACHE_SIZE)
+
+
+def laser_warning_frame(width, alpha):
+    """Translucent warning stripe shown before a laser fires"""
+    key = (width, alpha)
+    surf = _laser_frames.get(key)
+    if surf is None:
+        surf = pygame.Surface((width, 4), pygame.SRCALPHA)
+        pygame.draw.rect(surf, (255, 50, 50, alpha), (0, 0, width, 4))
+        _laser_frames.put(key, surf)
+    return surf
+
+
+class Bullet(PooledSprite):
     """Projectile for combat modes"""
     
     def __init__(self, x, y, direction=1, speed=8, color=(255, 255, 100), owner="player"):
         super().__init__()
         
+        self.rect = pygame.Rect(0, 0, 12, 6)
+        self.color = None
+        self.reset(x, y, direction, speed, color, owner)
+        
+    def reset(self, x, y, direction=1, speed=8, color=(255, 255, 100), owner="player"):
         self.direction = direction
         self.speed = speed
         self.owner = owner
+        self.vy = 0
         
-
-        self.image = pygame.Surface((12, 6), pygame.SRCALPHA)
+        # A recycled bullet only looks its surface up again when its colour changes
+        if color != self.color:
+            self.color = color
+            self.image = sprite_cache.get("bullet", (color,), self.draw_sprite)
         
-
-        pygame.draw.ellipse(self.image, color, (0, 0, 12, 6))
-        pygame.draw.ellipse(self.image, (255, 255, 255), (2, 1, 4, 3))
+        self.rect.center = (x, y)
         
-        self.rect = self.image.get_rect(center=(x, y))
+    def draw_sprite(self):
+        image = pygame.Surface((12, 6), pygame.SRCALPHA)
+        pygame.draw.ellipse(image, self.color, (0, 0, 12, 6))
+        pygame.draw.ellipse(image, (255, 255, 255), (2, 1, 4, 3))
+        return image
         
     def update(self):
         self.rect.x += self.speed * self.direction
         
-
-        if self.rect.right < 0 or self.rect.left > SCREEN_WIDTH:
+        if lifecycle.despawn("bullets", self.rect, self.direction):
             self.kill()
 
 
@@ -42,16 +74,14 @@ class Laser(pygame.sprite.Sprite):
         self.is_warning = True
         
 
-        self.image = pygame.Surface((width, 4), pygame.SRCALPHA)
-        pygame.draw.rect(self.image, (255, 50, 50, 100), (0, 0, width, 4))
+        self.y = y
+        self.width = width
+        self.image = laser_warning_frame(width, 100)
         
         self.rect = self.image.get_rect()
         self.rect.y = y
         self.rect.x = 0
         
-        self.y = y
-        self.width = width
-        
     def update(self):
         now = pygame.time.get_ticks()
         elapsed = now - self.start_time
@@ -59,39 +89,52 @@ class Laser(pygame.sprite.Sprite):
         if elapsed < self.warning_time:
 
             alpha = 100 + int(math.sin(elapsed / 50) * 50)
-            self.image.fill((0, 0, 0, 0))
-            pygame.draw.rect(self.image, (255, 50, 50, alpha), (0, 0, self.width, 4))
+            self.image = laser_warning_frame(self.width, alpha)
             
         elif elapsed < self.warning_time + self.active_time:
 
             if not self.is_active:
                 self.is_active = True
                 self.is_warning = False
-                self.image = pygame.Surface((self.width, 20), pygame.SRCALPHA)
-                pygame.draw.rect(self.image, (255, 100, 100), (0, 0, self.width, 20))
-                pygame.draw.rect(self.image, (255, 255, 200), (0, 8, self.width, 4))
+                self.image = sprite_cache.get("laser_beam", (self.width,), self.draw_beam)
                 self.rect = self.image.get_rect()
                 self.rect.y = self.y - 8
                 self.rect.x = 0
         else:
             self.kill()
+            
+    def draw_beam(self):
+        image = pygame.Surface((self.width, 20), pygame.SRCALPHA)
+        pygame.draw.rect(image, (255, 100, 100), (0, 0, self.width, 20))
+        pygame.draw.rect(image, (255, 255, 200), (0, 8, self.width, 4))
+        return image
 
 
-class FallingObstacle(pygame.sprite.Sprite):
+class FallingObstacle(PooledSprite):
     """Falling obstacle for Dodge Master"""
     
     def __init__(self, x, obstacle_type="rock", speed=4):
         super().__init__()
         
-        self.obstacle_type = obstacle_type
+        self.obstacle_type = None
+        self.reset(x, obstacle_type, speed)
+        
+    def reset(self, x, obstacle_type="rock", speed=4):
         self.speed = speed
-        self.create_sprite()
+        self.horizontal = False
+        self.hspeed = 0
+        if obstacle_type != self.obstacle_type:
+            self.obstacle_type = obstacle_type
+            self.create_sprite()
         
         self.rect = self.image.get_rect()
         self.rect.centerx = x
         self.rect.bottom = 0
         
     def create_sprite(self):
+        self.image = sprite_cache.get("falling_obstacle", (self.obstacle_type,), self.draw_sprite)
+        
+    def draw_sprite(self):
         if self.obstacle_type == "rock":
             size = 35
             self.image = pygame.Surface((size, size), pygame.SRCALPHA)
@@ -123,23 +166,33 @@ class FallingObstacle(pygame.sprite.Sprite):
             pygame.draw.line(self.image, (100, 80, 50), (size//2, 5), (size//2, 0), 3)
             pygame.draw.circle(self.image, (255, 150, 50), (size//2, 0), 4)
             
+        return self.image
+            
     def update(self):
         self.rect.y += self.speed
         
-        if self.rect.top > SCREEN_HEIGHT:
+        if lifecycle.despawn("obstacles", self.rect, 0, self.speed):
             self.kill()
 
 
-class BombFragment(pygame.sprite.Sprite):
+class BombFragment(PooledSprite):
     """Fragment from exploded bomb"""
     
     def __init__(self, x, y, angle, speed=6):
         super().__init__()
         
-        self.image = pygame.Surface((8, 8), pygame.SRCALPHA)
-        pygame.draw.circle(self.image, (80, 80, 85), (4, 4), 4)
+        self.image = sprite_cache.get("bomb_fragment", (), self.draw_sprite)
+        self.rect = self.image.get_rect()
+        self.reset(x, y, angle, speed)
+        
+    @staticmethod
+    def draw_sprite():
+        image = pygame.Surface((8, 8), pygame.SRCALPHA)
+        pygame.draw.circle(image, (80, 80, 85), (4, 4), 4)
+        return image
         
-        self.rect = self.image.get_rect(center=(x, y))
+    def reset(self, x, y, angle, speed=6):
+        self.rect.center = (x, y)
         
         self.vx = math.cos(math.radians(angle)) * speed
         self.vy = math.sin(math.radians(angle)) * speed
@@ -151,7 +204,9 @@ class BombFragment(pygame.sprite.Sprite):
         self.vy += 0.2
         
         self.lifetime -= 1
-        if self.lifetime <= 0 or self.rect.top > SCREEN_HEIGHT:
+        # gravity brings fragments thrown over the top back down, so only
+        # the bottom and the side they fly towards count as leaving
+        if self.lifetime <= 0 or lifecycle.despawn("fragments", self.rect, self.vx, 1):
             self.kill()
 
 
@@ -182,6 +237,10 @@ class ColorGate(pygame.sprite.Sprite):
         self.rect.centery = SCREEN_HEIGHT // 2
         
     def create_sprite(self):
+        params = (self.base_color, self.gate_height, self.is_highlighted, self.is_correct)
+        self.image = sprite_cache.get("color_gate", params, self.draw_sprite)
+        
+    def draw_sprite(self):
         width = 60
         self.image = pygame.Surface((width, self.gate_height), pygame.SRCALPHA)
         
@@ -205,6 +264,8 @@ class ColorGate(pygame.sprite.Sprite):
             pygame.draw.line(self.image, (255, 100, 100), (width//2 - 8, 12), (width//2 + 8, 28), 3)
             pygame.draw.line(self.image, (255, 100, 100), (width//2 + 8, 12), (width//2 - 8, 28), 3)
             
+        return self.image
+            
     def highlight(self, on=True):
         self.is_highlighted = on
         self.create_sprite()
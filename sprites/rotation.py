@@ -0,0 +1,43 @@
+import pygame
+from sprites.collision import RowHull
+
+# Birds tilt between these angles, see Bird.update
+MIN_TILT = -90
+MAX_TILT = 25
+
+
+class RotatedFrames:
+    """Rotations of a base image precomputed at whole-degree steps, with masks"""
+
+    def __init__(self, base_image, min_angle=MIN_TILT, max_angle=MAX_TILT, post_process=None):
+        self.min_angle = min_angle
+        self.max_angle = max_angle
+        self.images = []
+        self.masks = []
+        self.hulls = []
+
+        for angle in range(min_angle, max_angle + 1):
+            image = pygame.transform.rotate(base_image, angle)
+            if post_process:
+                image = post_process(image)
+            self.images.append(image)
+            self.masks.append(pygame.mask.from_surface(image))
+            self.hulls.append(None)
+
+    def index(self, angle):
+        """Frame index of the nearest whole degree, clamped to the table"""
+        angle = max(self.min_angle, min(self.max_angle, int(round(angle))))
+        return angle - self.min_angle
+
+    def image(self, angle):
+        return self.images[self.index(angle)]
+
+    def mask(self, angle):
+        return self.masks[self.index(angle)]
+
+    def hull(self, index):
+        """Collision hull of frame index, built from its mask on first use"""
+        hull = self.hulls[index]
+        if hull is None:
+            hull = self.hulls[index] = RowHull(self.masks[index])
+        return hull
@@ -0,0 +1,277 @@
+"""Play every game mode headless with scripted input and report frame times.
+
+    python -m tools.benchmark
+    python -m tools.benchmark --modes classic boss_rush --frames 300
+    python -m tools.benchmark --update-baseline
+    python -m tools.benchmark --unpaced --alloc-frames 0 --json bench.json
+
+Each mode is started on a fixed seed and driven through the real
+handle_events/update/draw loop by posting key events, the way a player
+would. Frames are paced to FPS by default because the mini-games schedule
+spawns and phases on wall-clock ticks; only the work inside a frame is
+timed. A second, shorter pass under tracemalloc measures how much each
+frame allocates. Results are compared against a baseline file and the exit
+status is 1 when p90 frame time or per-frame allocations regress beyond
+the tolerance.
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BASELINE = os.path.join(ROOT, "benchmark_baseline.json")
+DEFAULT_FRAMES = 600
+DEFAULT_ALLOC_FRAMES = 180
+WARMUP_FRAMES = 30
+DEFAULT_TOLERANCE = 0.25
+# Allocation noise floor; small modes fluctuate by a few KB per frame
+ALLOC_SLACK_KB = 32
+SEED = 1234
+
+# mode name -> (Game.game_mode, state while playing)
+MODES = {
+    "classic": ("classic", "playing"),
+    "zen": ("zen", "playing"),
+    "time_attack": ("time_attack", "playing"),
+    "bird_battle": ("bird_battle", "minigame_battle"),
+    "dodge_master": ("dodge_master", "minigame_dodge"),
+    "memory_flight": ("memory_flight", "minigame_memory"),
+    "boss_rush": ("boss_rush", "minigame_boss"),
+    "treasure_hunt": ("treasure_hunt", "minigame_treasure"),
+    "lixi_hunt": ("lixi_hunt", "minigame_lixi"),
+}
+
+
+def key_events(pygame, key, down=True, up=True):
+    events = []
+    if down:
+        events.append(pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode="", scancode=0))
+    if up:
+        events.append(pygame.event.Event(pygame.KEYUP, key=key, mod=0, unicode="", scancode=0))
+    return events
+
+
+def input_script(pygame, mode, seed):
+    """script(game, frame) -> events to post before that frame"""
+    if MODES[mode][1] == "playing":
+        from tools.tournament import gap_policy
+        policy = gap_policy(seed)
+
+        def script(game, frame):
+            if game.sim and not game.get_ready and policy(game.sim):
+                return key_events(pygame, pygame.K_SPACE)
+            return []
+
+    elif mode in ("bird_battle", "boss_rush"):
+        def script(game, frame):
+            events = key_events(pygame, pygame.K_SPACE) if frame % 18 == 0 else []
+            if frame % 8 == 4:
+                events += key_events(pygame, pygame.K_x)
+            if mode == "bird_battle" and frame % 90 == 45:
+                events += key_events(pygame, pygame.K_c)
+            return events
+
+    elif mode == "dodge_master":
+        def script(game, frame):
+            # hold one direction for 45 frames, then switch
+            if frame % 45:
+                return []
+            left = frame // 45 % 2 == 0
+            return (key_events(pygame, pygame.K_RIGHT if left else pygame.K_LEFT, down=False)
+                    + key_events(pygame, pygame.K_LEFT if left else pygame.K_RIGHT, up=False)
+                    + (key_events(pygame, pygame.K_SPACE) if frame % 450 == 0 else []))
+
+    elif mode == "treasure_hunt":
+        arrows = (pygame.K_RIGHT, pygame.K_DOWN, pygame.K_RIGHT, pygame.K_UP, pygame.K_LEFT)
+
+        def script(game, frame):
+            if frame % 12:
+                return []
+            events = key_events(pygame, arrows[frame // 12 % len(arrows)])
+            if frame % 240 == 0:
+                events += key_events(pygame, pygame.K_SPACE)
+            return events
+
+    elif mode == "lixi_hunt":
+        def script(game, frame):
+            if game.lixi_hunt.is_over and frame % 30 == 0:
+                return [pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(0, 0))]
+            return key_events(pygame, pygame.K_SPACE) if frame % 16 == 0 else []
+
+    else:
+        def script(game, frame):
+            return key_events(pygame, pygame.K_SPACE) if frame % 20 == 0 else []
+
+    return script
+
+
+def start_mode(game, mode, seed):
+    game.game_mode = MODES[mode][0]
+    game.new_game(seed)
+    game.get_ready = False
+
+
+def play(game, main, mode, frames, seed, paced=True, trace_alloc=False):
+    """Play frames of mode; returns per-frame ms, allocated KB and restart count"""
+    pygame = main.pygame
+    state = MODES[mode][1]
+    script = input_script(pygame, mode, seed)
+    times, allocs = [], []
+    restarts = 0
+    start_mode(game, mode, seed)
+
+    for frame in range(WARMUP_FRAMES + frames):
+        if game.state != state:
+            restarts += 1
+            start_mode(game, mode, seed + restarts)
+        for event in script(game, frame):
+            pygame.event.post(event)
+
+        game.dt = game.clock.tick(main.FPS) if paced else 1000 / main.FPS
+        if trace_alloc:
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        game.handle_events()
+        game.update()
+        game.draw()
+        elapsed = time.perf_counter() - start
+
+        if frame < WARMUP_FRAMES:
+            continue
+        times.append(elapsed * 1000)
+        if trace_alloc:
+            allocs.append((tracemalloc.get_traced_memory()[1] - before) / 1024)
+    return times, allocs, restarts
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+def frame_stats(times):
+    ordered = sorted(times)
+    return {
+        "mean": sum(ordered) / len(ordered) if ordered else 0.0,
+        "p50": percentile(ordered, 0.5),
+        "p90": percentile(ordered, 0.9),
+        "p99": percentile(ordered, 0.99),
+        "max": ordered[-1] if ordered else 0.0,
+    }
+
+
+def run_benchmark(modes, frames, alloc_frames, paced=True, seed=SEED):
+    """Build one Game and benchmark each mode; returns {mode: results}"""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    # saves, coins and replays written by the runs go to a scratch directory
+    os.environ["FLAPPY_DATA_DIR"] = tempfile.mkdtemp(prefix="flappy-bench-")
+    sys.path.insert(0, ROOT)
+    import main
+
+    game = main.Game()
+    results = {}
+    for mode in modes:
+        times, _, restarts = play(game, main, mode, frames, seed, paced)
+        result = {"frames": len(times), "restarts": restarts}
+        result.update(frame_stats(times))
+        if alloc_frames:
+            tracemalloc.start()
+            _, allocs, _ = play(game, main, mode, alloc_frames, seed, paced, trace_alloc=True)
+            tracemalloc.stop()
+            allocs.sort()
+            result["alloc_kb_p50"] = percentile(allocs, 0.5)
+            result["alloc_kb_max"] = allocs[-1] if allocs else 0.0
+        results[mode] = result
+        print(f"  {mode:<14} p90 {result['p90']:6.2f}ms", file=sys.stderr)
+    return results
+
+
+def compare(results, baseline, tolerance=DEFAULT_TOLERANCE):
+    """(mode, metric, value, baseline value) for every regression"""
+    regressions = []
+    for mode, result in results.items():
+        base = baseline.get(mode)
+        if not base:
+            continue
+        if result["p90"] > base["p90"] * (1 + tolerance):
+            regressions.append((mode, "p90", result["p90"], base["p90"]))
+        if "alloc_kb_p50" in result and "alloc_kb_p50" in base:
+            limit = base["alloc_kb_p50"] * (1 + tolerance) + ALLOC_SLACK_KB
+            if result["alloc_kb_p50"] > limit:
+                regressions.append((mode, "alloc_kb_p50", result["alloc_kb_p50"], base["alloc_kb_p50"]))
+    return regressions
+
+
+def load_baseline(path):
+    try:
+        with open(path) as f:
+            return json.load(f).get("modes", {})
+    except (OSError, ValueError):
+        return {}
+
+
+def save_baseline(path, results, args):
+    with open(path, "w") as f:
+        json.dump({"python": sys.version.split()[0], "platform": sys.platform,
+                   "frames": args.frames, "paced": not args.unpaced, "modes": results}, f, indent=2)
+
+
+def print_report(results, baseline, regressions):
+    flagged = {(mode, metric) for mode, metric, _, _ in regressions}
+    print(f"{'mode':<14} {'mean':>7} {'p50':>7} {'p90':>7} {'p99':>7} {'max':>7} {'base p90':>9} {'KB/frame':>9}")
+    for mode, r in results.items():
+        base = baseline.get(mode, {}).get("p90")
+        base = f"{base:>9.2f}" if base is not None else f"{'-':>9}"
+        alloc = f"{r['alloc_kb_p50']:>9.1f}" if "alloc_kb_p50" in r else f"{'-':>9}"
+        flag = "  SLOWER" if (mode, "p90") in flagged else ""
+        flag += "  MORE ALLOC" if (mode, "alloc_kb_p50") in flagged else ""
+        print(f"{mode:<14} {r['mean']:>7.2f} {r['p50']:>7.2f} {r['p90']:>7.2f} {r['p99']:>7.2f} "
+              f"{r['max']:>7.2f} {base} {alloc}{flag}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Per-mode frame time and allocation benchmark")
+    parser.add_argument("--modes", nargs="+", choices=sorted(MODES), default=list(MODES))
+    parser.add_argument("--frames", type=int, default=DEFAULT_FRAMES, help="timed frames per mode")
+    parser.add_argument("--alloc-frames", type=int, default=DEFAULT_ALLOC_FRAMES,
+                        help="frames per mode under tracemalloc, 0 to skip")
+    parser.add_argument("--unpaced", action="store_true", help="run frames back to back instead of at FPS")
+    parser.add_argument("--seed", type=int, default=SEED)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline JSON to compare against")
+    parser.add_argument("--update-baseline", action="store_true", help="write this run as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="allowed relative slowdown before failing, e.g. 0.25")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args(argv)
+
+    results = run_benchmark(args.modes, args.frames, args.alloc_frames, not args.unpaced, args.seed)
+    baseline = load_baseline(args.baseline)
+    regressions = [] if args.update_baseline else compare(results, baseline, args.tolerance)
+    print_report(results, baseline, regressions)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"modes": results, "regressions": regressions}, f, indent=2)
+    if args.update_baseline:
+        save_baseline(args.baseline, results, args)
+        print(f"\nbaseline written to {args.baseline}")
+        return 0
+    if not baseline:
+        print(f"\nno baseline at {args.baseline}; run with --update-baseline to create one")
+    if regressions:
+        print(f"\nregressed: {', '.join(f'{mode} {metric}' for mode, metric, _, _ in regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
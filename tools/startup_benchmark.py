@@ -0,0 +1,139 @@
+"""Measure start-up time to the first menu frame and check it against budgets.
+
+    python -m tools.startup_benchmark
+    python -m tools.startup_benchmark --runs 10 --cold
+    python -m tools.startup_benchmark --budget first_frame=400 --json startup.json
+
+Each run starts a fresh interpreter with the dummy SDL drivers, builds the
+Game, plays its first frame and reads back the startup trace. Budgets apply
+to the median of a trace mark (imports, first_frame) or phase total
+(init_ui, background, ...). The exit status is 1 when any budget is
+exceeded, so the script can gate a pygbag build.
+"""
+import os
+import sys
+import json
+import argparse
+import tempfile
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Milliseconds on a desktop CPython; the web build is several times slower
+# but regresses in the same places
+DEFAULT_BUDGETS = {
+    "first_frame": 600,
+    "imports": 450,
+    "pygame.init": 150,
+    "background": 40,
+    "init_ui": 40,
+    "init_minigames": 10,
+}
+
+
+def run_child(output):
+    """Child process: start the game, draw one frame and write the trace"""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    sys.path.insert(0, ROOT)
+    import main
+
+    main.startup_trace.enable(output)
+    game = main.Game()
+    game.dt = game.clock.tick(main.FPS)
+    game.handle_events()
+    game.update()
+    game.draw()
+    game.finish_startup_trace()
+
+
+def run_once(cold=False):
+    """Start one child interpreter; returns {metric: ms}"""
+    with tempfile.TemporaryDirectory() as tmp:
+        output = os.path.join(tmp, "trace.json")
+        env = dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT="1")
+        if cold:
+            env["FLAPPY_CACHE_DIR"] = os.path.join(tmp, "cache")
+        subprocess.run([sys.executable, "-m", "tools.startup_benchmark", "--child", output],
+                       cwd=ROOT, env=env, check=True, stdout=subprocess.DEVNULL)
+        with open(output) as f:
+            report = json.load(f)
+    metrics = dict(report["totals"])
+    metrics.update(report["marks"])
+    return metrics
+
+
+def median(values):
+    values = sorted(values)
+    middle = len(values) // 2
+    return values[middle] if len(values) % 2 else (values[middle - 1] + values[middle]) / 2
+
+
+def summarize(runs):
+    names = sorted({name for run in runs for name in run})
+    return {
+        name: {
+            "median": median([run.get(name, 0.0) for run in runs]),
+            "max": max(run.get(name, 0.0) for run in runs),
+        }
+        for name in names
+    }
+
+
+def check_budgets(summary, budgets):
+    """Names whose median is over budget"""
+    return [name for name, limit in budgets.items() if name in summary and summary[name]["median"] > limit]
+
+
+def parse_budgets(pairs):
+    budgets = dict(DEFAULT_BUDGETS)
+    for pair in pairs:
+        name, _, value = pair.partition("=")
+        if not value:
+            raise ValueError(f"expected name=ms, got {pair!r}")
+        budgets[name] = float(value)
+    return budgets
+
+
+def print_report(summary, budgets, failures):
+    print(f"{'metric':<24} {'median':>9} {'max':>9} {'budget':>9}")
+    for name, stats in sorted(summary.items(), key=lambda item: -item[1]["median"]):
+        budget = budgets.get(name)
+        limit = f"{budget:>9.0f}" if budget is not None else f"{'-':>9}"
+        flag = "  OVER" if name in failures else ""
+        print(f"{name:<24} {stats['median']:>9.1f} {stats['max']:>9.1f} {limit}{flag}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time-to-first-frame benchmark with budgets")
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters to start")
+    parser.add_argument("--cold", action="store_true", help="start every run with an empty asset cache")
+    parser.add_argument("--budget", action="append", default=[], metavar="NAME=MS",
+                        help="override or add a budget, e.g. first_frame=400")
+    parser.add_argument("--json", help="also write the summary to this file")
+    parser.add_argument("--child", metavar="TRACE", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        run_child(args.child)
+        return 0
+
+    budgets = parse_budgets(args.budget)
+    runs = [run_once(args.cold) for _ in range(args.runs)]
+    summary = summarize(runs)
+    failures = check_budgets(summary, budgets)
+    print_report(summary, budgets, failures)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"runs": args.runs, "cold": args.cold, "budgets": budgets,
+                       "summary": summary, "over_budget": failures}, f, indent=2)
+
+    if failures:
+        print(f"\nover budget: {', '.join(failures)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
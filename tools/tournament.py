@@ -0,0 +1,239 @@
+"""Play many seeded classic games with a scripted policy and report statistics.
+
+    python -m tools.tournament --games 500 --policy gap
+    python -m tools.tournament --difficulty hard --set pipe_gap=130 --workers 8
+    python -m tools.tournament --policy mybots:cautious --json results.json
+
+A policy is a callable policy(sim) -> bool, asked once per tick whether the
+bird should jump. Built-in policies are listed in POLICIES; any other value
+is imported as "module:function", where function(seed) returns the policy.
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import importlib
+import multiprocessing
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from settings import DIFFICULTIES, FPS, SCREEN_HEIGHT
+from managers.simulation import ClassicSimulation
+
+SURVIVAL_SECONDS = (5, 10, 20, 30, 60, 120, 300)
+DEFAULT_MAX_SECONDS = 300
+
+
+def idle_policy(seed):
+    """Never jump"""
+    return lambda sim: False
+
+
+def random_policy(seed, jump_chance=0.06):
+    """Jump at random with a fixed chance per tick"""
+    rng = random.Random(seed)
+    return lambda sim: rng.random() < jump_chance
+
+
+def gap_policy(seed, margin=75):
+    """Aim a little above the bottom pipe of the next gap"""
+    def policy(sim):
+        bird = sim.bird
+        target = SCREEN_HEIGHT // 2
+        ahead = [p for p in sim.pipes if not p.is_top and p.rect.right > bird.rect.left]
+        if ahead:
+            target = min(ahead, key=lambda p: p.rect.x).rect.top - margin
+        return bird.rect.centery > target + 10 and bird.velocity > -1
+    return policy
+
+
+POLICIES = {
+    "idle": idle_policy,
+    "random": random_policy,
+    "gap": gap_policy,
+}
+
+
+def load_policy(spec, seed):
+    """Build the policy for one game from a name or "module:function" spec"""
+    if spec in POLICIES:
+        return POLICIES[spec](seed)
+    module_name, _, attr = spec.partition(":")
+    if not attr:
+        raise ValueError(f"unknown policy {spec!r}, expected one of {sorted(POLICIES)} or module:function")
+    return getattr(importlib.import_module(module_name), attr)(seed)
+
+
+def play_game(job):
+    """Worker: play one game and return (difficulty, seed, score, ticks, died)"""
+    difficulty, seed, policy_spec, max_ticks, overrides = job
+    # sprites read DIFFICULTIES directly, so patch it for this game only;
+    # with workers=1 this runs in the caller's process
+    settings = DIFFICULTIES[difficulty]
+    saved = dict(settings)
+    settings.update(overrides)
+    try:
+        sim = ClassicSimulation(difficulty, "default", "classic", seed=seed)
+        sim.run(load_policy(policy_spec, seed), max_ticks=max_ticks)
+    finally:
+        settings.clear()
+        settings.update(saved)
+    return difficulty, seed, sim.score, sim.tick, sim.is_over
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def survival_points(max_ticks):
+    """Survival checkpoints that fit inside the per-game tick cap"""
+    return [s for s in SURVIVAL_SECONDS if max_ticks is None or s * FPS <= max_ticks]
+
+
+def summarize(results, max_ticks=None):
+    """Score distribution and survival curve for one difficulty"""
+    scores = sorted(r[2] for r in results)
+    ticks = [r[3] for r in results]
+    count = len(results)
+    return {
+        "games": count,
+        "deaths": sum(1 for r in results if r[4]),
+        "mean": sum(scores) / count,
+        "min": scores[0],
+        "p25": percentile(scores, 0.25),
+        "median": percentile(scores, 0.5),
+        "p75": percentile(scores, 0.75),
+        "p90": percentile(scores, 0.9),
+        "max": scores[-1],
+        "survival": {
+            str(seconds): sum(1 for t in ticks if t >= seconds * FPS) / count
+            for seconds in survival_points(max_ticks)
+        },
+    }
+
+
+def setting_types():
+    """Type of each difficulty setting: float if any difficulty uses a float, else int"""
+    types = {}
+    for settings in DIFFICULTIES.values():
+        for key, value in settings.items():
+            if types.get(key) is not float:
+                types[key] = type(value)
+    return types
+
+
+def check_overrides(overrides):
+    """Overrides checked against DIFFICULTIES and converted to each setting's type"""
+    types = setting_types()
+    checked = {}
+    for key, value in overrides.items():
+        if key not in types:
+            raise ValueError(f"unknown setting {key!r}, expected one of {sorted(types)}")
+        try:
+            number = float(value)
+        except ValueError:
+            raise ValueError(f"{key} needs a number, got {value!r}") from None
+        if types[key] is int:
+            if not number.is_integer():
+                raise ValueError(f"{key} is a whole number, got {value!r}")
+            number = int(number)
+        checked[key] = number
+    return checked
+
+
+def parse_overrides(pairs):
+    overrides = {}
+    for pair in pairs:
+        key, _, value = pair.partition("=")
+        if not value:
+            raise ValueError(f"expected key=value, got {pair!r}")
+        overrides[key] = value
+    return check_overrides(overrides)
+
+
+def run_tournament(games, difficulties, policy, seed=0, max_ticks=None, workers=None, overrides=None):
+    """Play games per difficulty across a process pool; returns (summary, elapsed)"""
+    overrides = check_overrides(overrides or {})
+    jobs = [
+        (difficulty, seed + i, policy, max_ticks, overrides)
+        for difficulty in difficulties
+        for i in range(games)
+    ]
+
+    start = time.perf_counter()
+    if workers == 1:
+        results = [play_game(job) for job in jobs]
+    else:
+        with multiprocessing.Pool(workers) as pool:
+            chunksize = max(1, len(jobs) // ((workers or os.cpu_count() or 1) * 4))
+            results = list(pool.imap_unordered(play_game, jobs, chunksize))
+    elapsed = time.perf_counter() - start
+
+    summary = {}
+    for difficulty in difficulties:
+        summary[difficulty] = summarize([r for r in results if r[0] == difficulty], max_ticks)
+    return summary, elapsed
+
+
+def print_report(summary, elapsed, total_games):
+    print(f"{total_games} games in {elapsed:.2f}s ({total_games / elapsed:.1f} games/sec)")
+    print()
+    print(f"{'difficulty':<10} {'mean':>7} {'min':>5} {'p25':>5} {'med':>5} {'p75':>5} {'p90':>5} {'max':>5}")
+    for difficulty, stats in summary.items():
+        print(f"{difficulty:<10} {stats['mean']:>7.1f} {stats['min']:>5} {stats['p25']:>5} "
+              f"{stats['median']:>5} {stats['p75']:>5} {stats['p90']:>5} {stats['max']:>5}")
+    print()
+    print("survival (share of birds alive after N seconds)")
+    points = list(next(iter(summary.values()))["survival"])
+    print(f"{'difficulty':<10} " + " ".join(f"{s:>5}s" for s in points))
+    for difficulty, stats in summary.items():
+        print(f"{difficulty:<10} " + " ".join(f"{stats['survival'][s]:>6.0%}" for s in points))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Batch classic-mode games for a scripted policy")
+    parser.add_argument("--games", type=int, default=200, help="games per difficulty")
+    parser.add_argument("--difficulty", action="append", choices=sorted(DIFFICULTIES),
+                        help="difficulty to play, repeatable (default: all)")
+    parser.add_argument("--policy", default="gap", help=f"one of {sorted(POLICIES)} or module:function")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game")
+    parser.add_argument("--max-seconds", type=float, default=DEFAULT_MAX_SECONDS,
+                        help="stop a game after this much simulated time")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--set", action="append", default=[], metavar="KEY=VALUE",
+                        help="override a difficulty setting, e.g. pipe_gap=140")
+    parser.add_argument("--json", help="also write the summary to this file")
+    args = parser.parse_args(argv)
+
+    difficulties = args.difficulty or list(DIFFICULTIES)
+    max_ticks = int(args.max_seconds * FPS)
+    try:
+        overrides = parse_overrides(args.set)
+    except ValueError as e:
+        parser.error(str(e))
+    load_policy(args.policy, args.seed)
+
+    summary, elapsed = run_tournament(args.games, difficulties, args.policy, args.seed,
+                                      max_ticks, args.workers, overrides)
+    print_report(summary, elapsed, args.games * len(difficulties))
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({
+                "policy": args.policy,
+                "seed": args.seed,
+                "max_ticks": max_ticks,
+                "overrides": overrides,
+                "games_per_sec": args.games * len(difficulties) / elapsed,
+                "difficulties": summary,
+            }, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,8 @@
 import pygame
 import os
 from settings import *
+from utils.fonts import render_text
+from utils.sprite_cache import sprite_cache
 
 class Button:
     def __init__(self, x, y, width, height, text, color=PRIMARY_COLOR, hover_color=None, text_color=WHITE):
@@ -56,11 +58,11 @@ class Button:
         pygame.draw.rect(screen, highlight_color, highlight_rect, border_radius=4)
         
 
-        text_surf = self.font.render(self.text, True, self.text_color)
+        text_surf = render_text(self.font, self.text, self.text_color)
         text_rect = text_surf.get_rect(center=scaled_rect.center)
         
 
-        shadow_surf = self.font.render(self.text, True, TEXT_SHADOW)
+        shadow_surf = render_text(self.font, self.text, TEXT_SHADOW)
         screen.blit(shadow_surf, (text_rect.x + 2, text_rect.y + 2))
         screen.blit(text_surf, text_rect)
         
@@ -114,9 +116,13 @@ class MedalDisplay:
                     img = pygame.image.load(path).convert_alpha()
                     self.images[medal] = pygame.transform.scale(img, (self.size, self.size))
                 except pygame.error:
-                    self.images[medal] = self.create_fallback(medal)
+                    self.images[medal] = self.get_fallback(medal)
             else:
-                self.images[medal] = self.create_fallback(medal)
+                self.images[medal] = self.get_fallback(medal)
+        
+    def get_fallback(self, medal_type):
+        """Fallback medal, drawn once per type and size"""
+        return sprite_cache.get("medal", (medal_type, self.size), lambda: self.create_fallback(medal_type))
         
     def create_fallback(self, medal_type):
         """Create fallback medal graphics"""
@@ -178,8 +184,8 @@ class ScoreDisplay:
         text = str(self.score)
         
 
-        shadow_surf = self.font.render(text, True, TEXT_SHADOW)
-        text_surf = self.font.render(text, True, WHITE)
+        shadow_surf = render_text(self.font, text, TEXT_SHADOW)
+        text_surf = render_text(self.font, text, WHITE)
         
         if center:
             shadow_rect = shadow_surf.get_rect(center=(self.x + 2, self.y + 2))
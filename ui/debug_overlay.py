@@ -0,0 +1,64 @@
+import pygame
+from settings import *
+from ui.overlays import get_overlay
+from utils.fonts import get_default_font
+
+# Frame profiler overlay, toggled with F3
+# Its numbers change every frame, so text is rendered directly instead of
+# through render_text; going through the shared text cache would churn it
+# and skew the hit rates shown here
+
+SECTIONS = [
+    "events",
+    "update",
+    "update.sprites",
+    "update.spawn_pipe",
+    "update.check_collisions",
+    "update.check_score",
+    "update.particles",
+    "draw",
+    "flip",
+]
+COUNTS = ["particles", "fireworks", "pipes", "coins", "powerups", "sprites", "culled"]
+HIT_RATES = ["text_hits", "overlay_hits", "atlas_hits", "sprite_hits", "font_hits"]
+
+FRAME_BUDGET = 1000 / FPS
+LINE_HEIGHT = 16
+PANEL_WIDTH = 230
+BAR_WIDTH = 60
+
+
+def profile_lines(averages):
+    """(text, ms or None) rows for the overlay"""
+    total = averages.get("total", 0.0)
+    rows = [(f"frame {total:5.2f}ms  max {1000 / total if total else 0:.0f} fps", total)]
+    for name in SECTIONS:
+        if name in averages:
+            label = "  " + name.split(".", 1)[1] if "." in name else name
+            rows.append((f"{label:<18}{averages[name]:6.2f}ms", averages[name]))
+    counts = [f"{name} {averages[name]:.0f}" for name in COUNTS if name in averages]
+    for start in range(0, len(counts), 3):
+        rows.append(("  ".join(counts[start:start + 3]), None))
+    rates = [f"{name[:-5]} {averages[name]:.0%}" for name in HIT_RATES if name in averages]
+    for start in range(0, len(rates), 3):
+        rows.append(("hit " + "  ".join(rates[start:start + 3]), None))
+    return rows
+
+
+def draw_frame_profile(screen, profiler):
+    """Averaged section times, counters and cache hit rates in the top-left corner"""
+    averages = profiler.averages()
+    if not averages:
+        return
+    rows = profile_lines(averages)
+    font = get_default_font(18)
+    height = len(rows) * LINE_HEIGHT + 8
+    screen.blit(get_overlay(BLACK, 170, (PANEL_WIDTH, height)), (0, 0))
+
+    for i, (text, ms) in enumerate(rows):
+        y = 4 + i * LINE_HEIGHT
+        screen.blit(font.render(text, True, WHITE), (6, y))
+        if ms is not None:
+            width = min(BAR_WIDTH, int(BAR_WIDTH * ms / FRAME_BUDGET))
+            color = (100, 220, 100) if ms < FRAME_BUDGET * 0.5 else (240, 200, 60) if ms < FRAME_BUDGET else (240, 80, 80)
+            pygame.draw.rect(screen, color, (PANEL_WIDTH - BAR_WIDTH - 6, y + 4, max(1, width), 7))
@@ -0,0 +1,44 @@
+import pygame
+
+# Dirty-rectangle bookkeeping for static screens
+# A static screen describes itself as a scene signature plus a list of
+# (name, rect, signature) regions. When the scene changes the whole screen
+# is repainted; otherwise only regions whose signature changed are, and a
+# frame where nothing changed is skipped entirely.
+
+
+class DirtyRectTracker:
+    """Works out which parts of a static screen changed since the last frame"""
+
+    def __init__(self):
+        self.key = None
+        self.scene = None
+        self.regions = {}
+
+    def invalidate(self):
+        """Force the next collect() to ask for a full repaint"""
+        self.key = None
+
+    def collect(self, key, scene, regions):
+        """Return None for a full repaint, else the list of rects to repaint"""
+        current = {name: (pygame.Rect(rect), signature) for name, rect, signature in regions}
+
+        if key != self.key or scene != self.scene:
+            self.key = key
+            self.scene = scene
+            self.regions = current
+            return None
+
+        dirty = []
+        for name, region in current.items():
+            previous = self.regions.get(name)
+            if previous != region:
+                dirty.append(region[0])
+                if previous and previous[0] != region[0]:
+                    dirty.append(previous[0])
+        for name, previous in self.regions.items():
+            if name not in current:
+                dirty.append(previous[0])
+
+        self.regions = current
+        return dirty
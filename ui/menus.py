@@ -2,18 +2,8 @@ import pygame
 import math
 import random
 from settings import *
-
-def get_vn_font(size):
-    """Get a system font that supports Vietnamese characters"""
-    try:
-
-        for font_name in ['segoeui', 'arial', 'tahoma', 'dejavusans']:
-            font = pygame.font.SysFont(font_name, size)
-            if font:
-                return font
-    except:
-        pass
-    return pygame.font.Font(None, size)
+from utils.fonts import render_text
+from ui.overlays import draw_overlay, draw_panel
 
 class MainMenu:
     def __init__(self, screen, high_score=0, coins=0):
@@ -120,9 +110,7 @@ class MainMenu:
         ground.draw(self.screen)
         
 
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 80 if TET_MODE else 50))
-        self.screen.blit(overlay, (0, 0))
+        draw_overlay(self.screen, BLACK, 80 if TET_MODE else 50)
         
 
         if TET_MODE:
@@ -135,7 +123,7 @@ class MainMenu:
         if TET_MODE:
             pygame.draw.rect(self.screen, TET_GOLD, coin_bg, 2, border_radius=8)
         coin_text = f"🪙 {self.coins}"
-        coin_surf = self.coin_font.render(coin_text, True, COIN_COLOR)
+        coin_surf = render_text(self.coin_font, coin_text, COIN_COLOR)
         self.screen.blit(coin_surf, (SCREEN_WIDTH - 100, 18))
         
 
@@ -144,8 +132,8 @@ class MainMenu:
         
 
         title_text = "FLAPPY BIRD" if not TET_MODE else "FLAPPY TẾT"
-        title_surf = self.title_font.render(title_text, True, WHITE)
-        title_shadow = self.title_font.render(title_text, True, TEXT_SHADOW)
+        title_surf = render_text(self.title_font, title_text, WHITE)
+        title_shadow = render_text(self.title_font, title_text, TEXT_SHADOW)
         
         title_rect = title_surf.get_rect(center=(SCREEN_WIDTH // 2, 100 + self.title_offset))
         shadow_rect = title_shadow.get_rect(center=(SCREEN_WIDTH // 2 + 3, 103 + self.title_offset))
@@ -158,7 +146,7 @@ class MainMenu:
             subtitle = f"🧧 Tết 2026 Edition v{VERSION} 🧧"
         else:
             subtitle = "Ultimate Edition v2.0"
-        subtitle_surf = self.subtitle_font.render(subtitle, True, PRIMARY_COLOR)
+        subtitle_surf = render_text(self.subtitle_font, subtitle, PRIMARY_COLOR)
         subtitle_rect = subtitle_surf.get_rect(center=(SCREEN_WIDTH // 2, 150))
         self.screen.blit(subtitle_surf, subtitle_rect)
         
@@ -174,13 +162,13 @@ class MainMenu:
 
         if self.high_score > 0:
             hs_text = f"Kỷ lục: {self.high_score}" if TET_MODE else f"Best: {self.high_score}"
-            hs_surf = self.subtitle_font.render(hs_text, True, WHITE)
+            hs_surf = render_text(self.subtitle_font, hs_text, WHITE)
             hs_rect = hs_surf.get_rect(center=(SCREEN_WIDTH // 2, 500))
             self.screen.blit(hs_surf, hs_rect)
             
 
         inst_text = "Nhấn SPACE hoặc Click để chơi" if TET_MODE else "Press SPACE or Click to Play"
-        inst_surf = get_vn_font(22).render(inst_text, True, (180, 180, 180))
+        inst_surf = render_text(get_vn_font(22), inst_text, (180, 180, 180))
         inst_rect = inst_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 30))
         self.screen.blit(inst_surf, inst_rect)
     
@@ -194,7 +182,7 @@ class MainMenu:
         pygame.draw.rect(self.screen, TET_GOLD, banner_rect, 2, border_radius=8)
         
 
-        text_surf = self.greeting_font.render(greeting, True, TET_GOLD)
+        text_surf = render_text(self.greeting_font, greeting, TET_GOLD)
         text_rect = text_surf.get_rect(center=banner_rect.center)
         self.screen.blit(text_surf, text_rect)
     
@@ -312,15 +300,18 @@ class SettingsMenu:
         self.hard_button.update(mouse_pos)
         self.back_button.update(mouse_pos)
         
+    def dirty_regions(self):
+        """Scene signature and hover regions for dirty-rect drawing"""
+        buttons = [("easy", self.easy_button), ("medium", self.medium_button), ("hard", self.hard_button), ("back", self.back_button)]
+        return self.current_difficulty, [(name, btn.dirty_rect(), btn.hovered) for name, btn in buttons]
+        
     def draw(self, background, ground):
         # Draw background
         background.draw(self.screen)
         ground.draw(self.screen)
         
 
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150 if TET_MODE else 100))
-        self.screen.blit(overlay, (0, 0))
+        draw_overlay(self.screen, BLACK, 150 if TET_MODE else 100)
         
 
         panel = Panel(50, 100, SCREEN_WIDTH - 100, 380, tet_style=TET_MODE)
@@ -328,13 +319,13 @@ class SettingsMenu:
         
 
         title_text = "CÀI ĐẶT" if TET_MODE else "SETTINGS"
-        title_surf = self.title_font.render(title_text, True, WHITE)
+        title_surf = render_text(self.title_font, title_text, WHITE)
         title_rect = title_surf.get_rect(center=(SCREEN_WIDTH // 2, 150))
         self.screen.blit(title_surf, title_rect)
         
 
         diff_text = "Độ khó:" if TET_MODE else "Difficulty:"
-        diff_label = self.label_font.render(diff_text, True, WHITE)
+        diff_label = render_text(self.label_font, diff_text, WHITE)
         self.screen.blit(diff_label, (80, 210))
         
 
@@ -359,7 +350,7 @@ class SettingsMenu:
                 "hard": "Fast speed, small gaps"
             }
         desc = descriptions.get(self.current_difficulty, "")
-        desc_surf = get_vn_font(24).render(desc, True, (200, 200, 200))
+        desc_surf = render_text(get_vn_font(24), desc, (200, 200, 200))
         desc_rect = desc_surf.get_rect(center=(SCREEN_WIDTH // 2, 320))
         self.screen.blit(desc_surf, desc_rect)
         
@@ -487,12 +478,22 @@ class GameOverScreen:
             p['life'] -= 0.015
             if p['life'] <= 0:
                 self.celebration_particles.remove(p)
+                
+    def is_animating(self):
+        """True while celebration particles or the medal pulse change every frame"""
+        return bool(self.celebration_particles) or bool(self.medal_type)
+        
+    def dirty_regions(self):
+        """Scene signature and hover regions for dirty-rect drawing"""
+        scene = (int(self.panel_y), self.score, self.high_score, self.medal_type)
+        return scene, [
+            ("retry", self.retry_button.dirty_rect(), self.retry_button.hovered),
+            ("menu", self.menu_button.dirty_rect(), self.menu_button.hovered),
+        ]
         
     def draw(self):
 
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180 if TET_MODE else 150))
-        self.screen.blit(overlay, (0, 0))
+        draw_overlay(self.screen, BLACK, 180 if TET_MODE else 150)
         
 
         for p in self.celebration_particles:
@@ -503,21 +504,14 @@ class GameOverScreen:
         panel_rect = pygame.Rect(30, int(self.panel_y), SCREEN_WIDTH - 60, 380)
         
 
-        shadow_rect = panel_rect.copy()
-        shadow_rect.x += 5
-        shadow_rect.y += 5
-        pygame.draw.rect(self.screen, (0, 0, 0, 100), shadow_rect, border_radius=15)
-        
-
         panel_color = PANEL_COLOR if TET_MODE else (222, 184, 135)
         border_color = TET_GOLD if TET_MODE else PANEL_DARK
-        pygame.draw.rect(self.screen, panel_color, panel_rect, border_radius=15)
-        pygame.draw.rect(self.screen, border_color, panel_rect, 4, border_radius=15)
+        draw_panel(self.screen, panel_rect, panel_color, border_color, 4, 15, shadow_offset=5)
         
 
         title_text = "KẾT THÚC" if TET_MODE else "GAME OVER"
         title_color = TET_GOLD if TET_MODE else ACCENT_COLOR
-        title_surf = self.title_font.render(title_text, True, title_color)
+        title_surf = render_text(self.title_font, title_text, title_color)
         title_rect = title_surf.get_rect(center=(SCREEN_WIDTH // 2, int(self.panel_y) + 35))
         self.screen.blit(title_surf, title_rect)
         
@@ -526,30 +520,30 @@ class GameOverScreen:
         
 
         score_label_text = "Điểm" if TET_MODE else "Score"
-        score_label = self.label_font.render(score_label_text, True, TEXT_SHADOW if not TET_MODE else (200, 180, 150))
+        score_label = render_text(self.label_font, score_label_text, TEXT_SHADOW if not TET_MODE else (200, 180, 150))
         self.screen.blit(score_label, (60, score_y))
-        score_val = self.score_font.render(str(self.score), True, WHITE)
+        score_val = render_text(self.score_font, str(self.score), WHITE)
         self.screen.blit(score_val, (60, score_y + 22))
         
 
         best_label_text = "Kỷ lục" if TET_MODE else "Best"
-        best_label = self.label_font.render(best_label_text, True, TEXT_SHADOW if not TET_MODE else (200, 180, 150))
+        best_label = render_text(self.label_font, best_label_text, TEXT_SHADOW if not TET_MODE else (200, 180, 150))
         self.screen.blit(best_label, (60, score_y + 60))
-        best_val = self.score_font.render(str(self.high_score), True, WHITE)
+        best_val = render_text(self.score_font, str(self.high_score), WHITE)
         self.screen.blit(best_val, (60, score_y + 82))
         
 
         earnings_y = score_y + 120
         if self.coins_earned > 0:
-            coin_label = self.label_font.render("Xu", True, TEXT_SHADOW if not TET_MODE else (200, 180, 150))
+            coin_label = render_text(self.label_font, "Xu", TEXT_SHADOW if not TET_MODE else (200, 180, 150))
             self.screen.blit(coin_label, (60, earnings_y))
-            coin_val = self.score_font.render(f"+{self.coins_earned}", True, COIN_COLOR)
+            coin_val = render_text(self.score_font, f"+{self.coins_earned}", COIN_COLOR)
             self.screen.blit(coin_val, (60, earnings_y + 22))
         
         if TET_MODE and self.lixi_earned > 0:
-            lixi_label = self.label_font.render("Lì Xì 🧧", True, (200, 180, 150))
+            lixi_label = render_text(self.label_font, "Lì Xì 🧧", (200, 180, 150))
             self.screen.blit(lixi_label, (150, earnings_y))
-            lixi_val = self.score_font.render(f"+{self.lixi_earned}", True, TET_RED)
+            lixi_val = render_text(self.score_font, f"+{self.lixi_earned}", TET_RED)
             self.screen.blit(lixi_val, (150, earnings_y + 22))
         
 
@@ -559,7 +553,7 @@ class GameOverScreen:
             self.medal_display.draw(self.screen)
             
             # Medal label
-            medal_label = self.label_font.render(self.medal_type.upper(), True, PRIMARY_COLOR)
+            medal_label = render_text(self.label_font, self.medal_type.upper(), PRIMARY_COLOR)
             medal_rect = medal_label.get_rect(center=(SCREEN_WIDTH - 78, int(self.panel_y) + 160))
             self.screen.blit(medal_label, medal_rect)
         
@@ -569,7 +563,7 @@ class GameOverScreen:
                 new_text = "🎊 KỶ LỤC MỚI! 🎊"
             else:
                 new_text = "🎉 NEW BEST! 🎉"
-            new_surf = self.label_font.render(new_text, True, PRIMARY_COLOR)
+            new_surf = render_text(self.label_font, new_text, PRIMARY_COLOR)
             new_rect = new_surf.get_rect(center=(SCREEN_WIDTH // 2, int(self.panel_y) + 260))
             self.screen.blit(new_surf, new_rect)
         
@@ -644,18 +638,20 @@ class PauseScreen:
         self.menu_button.update(mouse_pos)
         self.pulse = (self.pulse + 0.1) % (3.14159 * 2)
         
+    def dirty_regions(self):
+        """Scene signature and hover regions for dirty-rect drawing"""
+        buttons = [("resume", self.resume_button), ("restart", self.restart_button), ("menu", self.menu_button)]
+        return None, [(name, btn.dirty_rect(), btn.hovered) for name, btn in buttons]
+        
     def draw(self):
 
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 220 if TET_MODE else 200))
-        self.screen.blit(overlay, (0, 0))
+        draw_overlay(self.screen, BLACK, 220 if TET_MODE else 200)
         
 
         panel_rect = pygame.Rect(40, 130, SCREEN_WIDTH - 80, 320)
         panel_color = PANEL_COLOR if TET_MODE else (35, 40, 50)
         border_color = TET_GOLD if TET_MODE else (60, 65, 80)
-        pygame.draw.rect(self.screen, panel_color, panel_rect, border_radius=20)
-        pygame.draw.rect(self.screen, border_color, panel_rect, 3, border_radius=20)
+        draw_panel(self.screen, panel_rect, panel_color, border_color, 3, 20)
         
 
         pulse_alpha = int(100 + 50 * math.sin(self.pulse))
@@ -665,12 +661,12 @@ class PauseScreen:
         
 
         title_text = "TẠM DỪNG" if TET_MODE else "PAUSED"
-        title_surf = self.title_font.render(title_text, True, WHITE)
+        title_surf = render_text(self.title_font, title_text, WHITE)
         title_rect = title_surf.get_rect(center=(SCREEN_WIDTH // 2, 155))
         
 
         shadow_color = PANEL_DARK if TET_MODE else (30, 30, 40)
-        shadow = self.title_font.render(title_text, True, shadow_color)
+        shadow = render_text(self.title_font, title_text, shadow_color)
         self.screen.blit(shadow, (title_rect.x + 2, title_rect.y + 2))
         self.screen.blit(title_surf, title_rect)
         
@@ -700,11 +696,11 @@ class PauseScreen:
             pygame.draw.rect(self.screen, key_bg, key_rect, border_radius=4)
             pygame.draw.rect(self.screen, (80, 85, 95), key_rect, 1, border_radius=4)
             
-            key_text = self.label_font.render(key, True, (180, 180, 190))
+            key_text = render_text(self.label_font, key, (180, 180, 190))
             self.screen.blit(key_text, (key_rect.centerx - key_text.get_width() // 2, 
                                         key_rect.centery - key_text.get_height() // 2))
             
-            action_text = self.label_font.render(action, True, (140, 140, 150))
+            action_text = render_text(self.label_font, action, (140, 140, 150))
             self.screen.blit(action_text, (130, hint_y + 3))
             
             hint_y += 28
@@ -741,6 +737,10 @@ class Button:
     def update(self, mouse_pos):
         self.hovered = self.rect.collidepoint(mouse_pos)
         
+    def dirty_rect(self):
+        """Area covering the button, its shadow and a selection outline"""
+        return self.rect.inflate(16, 16)
+        
     def draw(self, screen):
 
         shadow_rect = self.rect.copy()
@@ -759,7 +759,7 @@ class Button:
         pygame.draw.rect(screen, border_color, self.rect, 2, border_radius=BUTTON_RADIUS)
         
 
-        text_surf = self.font.render(self.text, True, self.text_color)
+        text_surf = render_text(self.font, self.text, self.text_color)
         text_rect = text_surf.get_rect(center=self.rect.center)
         screen.blit(text_surf, text_rect)
         
@@ -775,19 +775,10 @@ class Panel:
         self.tet_style = tet_style
         
     def draw(self, screen):
-
-        shadow_rect = self.rect.copy()
-        shadow_rect.x += 5
-        shadow_rect.y += 5
-        pygame.draw.rect(screen, (0, 0, 0, 100), shadow_rect, border_radius=15)
-        
-
         if self.tet_style:
-            pygame.draw.rect(screen, PANEL_COLOR, self.rect, border_radius=15)
-            pygame.draw.rect(screen, TET_GOLD, self.rect, 3, border_radius=15)
+            draw_panel(screen, self.rect, PANEL_COLOR, TET_GOLD, 3, 15, shadow_offset=5)
         else:
-            pygame.draw.rect(screen, (222, 184, 135), self.rect, border_radius=15)
-            pygame.draw.rect(screen, (139, 90, 43), self.rect, 3, border_radius=15)
+            draw_panel(screen, self.rect, (222, 184, 135), (139, 90, 43), 3, 15, shadow_offset=5)
 
 
 class MedalDisplay:
@@ -837,7 +828,7 @@ class ScoreDisplay:
         self.score = 0
         
     def draw(self, screen):
-        text = self.font.render(str(self.score), True, WHITE)
-        shadow = self.font.render(str(self.score), True, (50, 50, 50))
+        text = render_text(self.font, str(self.score), WHITE)
+        shadow = render_text(self.font, str(self.score), (50, 50, 50))
         screen.blit(shadow, (self.x + 2, self.y + 2))
         screen.blit(text, (self.x, self.y))
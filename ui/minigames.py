@@ -2,6 +2,12 @@ import pygame
 import math
 import random
 from settings import *
+from utils.fonts import render_text
+from ui.overlays import draw_overlay, draw_panel
+from utils.rng import rng_service
+from utils.lifecycle import lifecycle
+
+rng = rng_service.stream("lixi_hunt")
 
 class MiniGameMenu:
     """Enhanced game mode selection menu with Tet theme"""
@@ -209,7 +215,7 @@ class MiniGameMenu:
         pygame.draw.line(self.screen, line_color, (0, 55), (SCREEN_WIDTH, 55), 2)
         
         title = "CHẾ ĐỘ CHƠI" if TET_MODE else "GAME MODES"
-        title_surf = self.title_font.render(title, True, WHITE)
+        title_surf = render_text(self.title_font, title, WHITE)
         self.screen.blit(title_surf, (SCREEN_WIDTH // 2 - title_surf.get_width() // 2, 12))
         
         # Back button with hover
@@ -223,7 +229,7 @@ class MiniGameMenu:
         pygame.draw.rect(self.screen, border_color, self.back_rect, 2, border_radius=8)
         
         back_text_str = "← VỀ" if TET_MODE else "← BACK"
-        back_text = self.small_font.render(back_text_str, True, WHITE)
+        back_text = render_text(self.small_font, back_text_str, WHITE)
         self.screen.blit(back_text, (self.back_rect.centerx - back_text.get_width() // 2,
                                       self.back_rect.centery - back_text.get_height() // 2))
         
@@ -297,11 +303,11 @@ class MiniGameMenu:
         name_color = WHITE if is_hovered else (220, 220, 225)
         if is_tet_exclusive:
             name_color = TET_GOLD
-        name = self.label_font.render(mode["name"], True, name_color)
+        name = render_text(self.label_font, mode["name"], name_color)
         self.screen.blit(name, (text_x, rect.y + 10))
         
         # Description
-        desc = self.small_font.render(mode["desc"], True, (160, 165, 180))
+        desc = render_text(self.small_font, mode["desc"], (160, 165, 180))
         self.screen.blit(desc, (text_x, rect.y + 35))
         
         # Difficulty badge
@@ -320,7 +326,7 @@ class MiniGameMenu:
                 "Very Hard": (255, 80, 80)
             }
         diff_color = diff_colors.get(mode["difficulty"], (150, 150, 150))
-        diff_text = self.desc_font.render(mode["difficulty"], True, diff_color)
+        diff_text = render_text(self.desc_font, mode["difficulty"], diff_color)
         diff_rect = pygame.Rect(rect.right - diff_text.get_width() - 20, rect.y + 12, 
                                 diff_text.get_width() + 10, 20)
         pygame.draw.rect(self.screen, (*diff_color, 30), diff_rect, border_radius=4)
@@ -328,13 +334,13 @@ class MiniGameMenu:
         
         # Tet exclusive badge
         if is_tet_exclusive:
-            tet_badge = self.desc_font.render("TẾT 2026", True, TET_GOLD)
+            tet_badge = render_text(self.desc_font, "TẾT 2026", TET_GOLD)
             self.screen.blit(tet_badge, (rect.right - tet_badge.get_width() - 15, rect.bottom - 18))
         
         # Play hint when hovered
         if is_hovered:
             play_text_str = "Nhấn để chơi →" if TET_MODE else "Click to play →"
-            play_text = self.desc_font.render(play_text_str, True, mode["icon_color"])
+            play_text = render_text(self.desc_font, play_text_str, mode["icon_color"])
             self.screen.blit(play_text, (rect.right - play_text.get_width() - 15, rect.bottom - 20))
         
     def draw_mode_icon(self, mode_id, center, is_hovered):
@@ -411,9 +417,7 @@ class MiniGameMenu:
             
     def draw_confirmation(self):
         # Overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 200 if TET_MODE else 180))
-        self.screen.blit(overlay, (0, 0))
+        draw_overlay(self.screen, BLACK, 200 if TET_MODE else 180)
         
         # Dialog box with Tet styling
         dialog_width = 320
@@ -425,27 +429,25 @@ class MiniGameMenu:
         )
         
         dialog_bg = PANEL_COLOR if TET_MODE else (45, 50, 62)
-        pygame.draw.rect(self.screen, dialog_bg, dialog_rect, border_radius=16)
-        
         border_color = TET_GOLD if TET_MODE else self.confirm_mode["icon_color"]
-        pygame.draw.rect(self.screen, border_color, dialog_rect, 3, border_radius=16)
+        draw_panel(self.screen, dialog_rect, dialog_bg, border_color, 3, 16)
         
         # Title
-        title = self.label_font.render(self.confirm_mode["name"], True, WHITE)
+        title = render_text(self.label_font, self.confirm_mode["name"], WHITE)
         self.screen.blit(title, (dialog_rect.centerx - title.get_width() // 2, dialog_rect.y + 20))
         
         # Details
-        details = self.small_font.render(self.confirm_mode["details"], True, (180, 180, 190))
+        details = render_text(self.small_font, self.confirm_mode["details"], (180, 180, 190))
         self.screen.blit(details, (dialog_rect.centerx - details.get_width() // 2, dialog_rect.y + 55))
         
         # Difficulty
         diff_label = "Độ khó:" if TET_MODE else "Difficulty:"
-        diff_text = self.small_font.render(f"{diff_label} {self.confirm_mode['difficulty']}", True, (150, 155, 170))
+        diff_text = render_text(self.small_font, f"{diff_label} {self.confirm_mode['difficulty']}", (150, 155, 170))
         self.screen.blit(diff_text, (dialog_rect.centerx - diff_text.get_width() // 2, dialog_rect.y + 85))
         
         # Tet exclusive note
         if self.confirm_mode.get("tet_exclusive"):
-            tet_note = self.small_font.render("🧧 Chế độ đặc biệt Tết 2026! 🧧", True, TET_GOLD)
+            tet_note = render_text(self.small_font, "🧧 Chế độ đặc biệt Tết 2026! 🧧", TET_GOLD)
             self.screen.blit(tet_note, (dialog_rect.centerx - tet_note.get_width() // 2, dialog_rect.y + 110))
         
         # Buttons
@@ -459,7 +461,7 @@ class MiniGameMenu:
             pygame.draw.rect(self.screen, TET_GOLD, self.play_btn, 2, border_radius=10)
         
         play_text_str = "CHƠI" if TET_MODE else "PLAY"
-        play_text = self.label_font.render(play_text_str, True, WHITE)
+        play_text = render_text(self.label_font, play_text_str, WHITE)
         self.screen.blit(play_text, (self.play_btn.centerx - play_text.get_width() // 2,
                                       self.play_btn.centery - play_text.get_height() // 2))
         
@@ -469,7 +471,7 @@ class MiniGameMenu:
         pygame.draw.rect(self.screen, cancel_color, self.cancel_btn, border_radius=10)
         
         cancel_text_str = "HỦY" if TET_MODE else "CANCEL"
-        cancel_text = self.label_font.render(cancel_text_str, True, WHITE)
+        cancel_text = render_text(self.label_font, cancel_text_str, WHITE)
         self.screen.blit(cancel_text, (self.cancel_btn.centerx - cancel_text.get_width() // 2,
                                         self.cancel_btn.centery - cancel_text.get_height() // 2))
         
@@ -579,12 +581,12 @@ class LiXiHuntMode:
         
     def spawn_lixi(self):
         """Spawn a new li xi envelope"""
-        x = random.randint(50, SCREEN_WIDTH - 50)
+        x = rng.randint(50, SCREEN_WIDTH - 50)
         y = -40
-        value = random.choice(LIXI_VALUES)
+        value = rng.choice(LIXI_VALUES)
         
         # Rare golden li xi
-        is_golden = random.random() < 0.1
+        is_golden = rng.random() < 0.1
         if is_golden:
             value *= 2
         
@@ -592,8 +594,8 @@ class LiXiHuntMode:
             'x': x,
             'y': y,
             'value': value,
-            'vy': random.uniform(2, 4),
-            'swing': random.uniform(0, math.pi * 2),
+            'vy': rng.uniform(2, 4),
+            'swing': rng.uniform(0, math.pi * 2),
             'golden': is_golden,
             'collected': False
         })
@@ -631,8 +633,8 @@ class LiXiHuntMode:
                 # Spawn celebration particles
                 self.spawn_collect_effect(lixi['x'], lixi['y'], lixi['value'], lixi['golden'])
                 
-            # Remove if off screen
-            if lixi['y'] > SCREEN_HEIGHT or lixi['collected']:
+            # Remove if off screen, below or to either side
+            if lixi['collected'] or lifecycle.despawn("lixi", lixi_rect, 0, lixi['vy']):
                 self.lixis.remove(lixi)
         
         # Update particles
@@ -661,11 +663,11 @@ class LiXiHuntMode:
             self.particles.append({
                 'x': x,
                 'y': y,
-                'vx': random.uniform(-4, 4),
-                'vy': random.uniform(-6, -2),
+                'vx': rng.uniform(-4, 4),
+                'vy': rng.uniform(-6, -2),
                 'life': 1.0,
                 'color': color,
-                'size': random.randint(4, 8)
+                'size': rng.randint(4, 8)
             })
         
         # Floating message
@@ -694,7 +696,7 @@ class LiXiHuntMode:
             pygame.draw.circle(self.screen, WHITE, (x, y), 6)
         
         # Value text
-        value_text = self.small_font.render(str(lixi['value']), True, WHITE)
+        value_text = render_text(self.small_font, str(lixi['value']), WHITE)
         self.screen.blit(value_text, (x - value_text.get_width() // 2, y + 12))
         
     def draw(self):
@@ -713,7 +715,7 @@ class LiXiHuntMode:
         # Draw floating messages
         for m in self.messages:
             alpha = int(255 * m['life'])
-            text = self.font.render(m['text'], True, m['color'])
+            text = render_text(self.font, m['text'], m['color'])
             self.screen.blit(text, (int(m['x']) - text.get_width() // 2, int(m['y'])))
         
         # Draw HUD
@@ -730,6 +732,7 @@ class LiXiHuntMode:
         seconds = self.remaining_time // 1000
         ms = (self.remaining_time % 1000) // 10
         timer_color = ACCENT_COLOR if seconds <= 10 else TET_GOLD
+        # centiseconds change every frame, so bypass the shared text cache
         timer_text = self.font.render(f"{seconds:02d}:{ms:02d}", True, timer_color)
         self.screen.blit(timer_text, (timer_rect.centerx - timer_text.get_width() // 2,
                                        timer_rect.centery - timer_text.get_height() // 2))
@@ -739,7 +742,7 @@ class LiXiHuntMode:
         pygame.draw.rect(self.screen, (0, 0, 0, 180), lixi_rect, border_radius=8)
         pygame.draw.rect(self.screen, TET_RED, lixi_rect, 2, border_radius=8)
         
-        lixi_text = self.small_font.render(f"🧧 x{self.lixi_collected}", True, WHITE)
+        lixi_text = render_text(self.small_font, f"🧧 x{self.lixi_collected}", WHITE)
         self.screen.blit(lixi_text, (20, 18))
         
         # Total value
@@ -747,11 +750,11 @@ class LiXiHuntMode:
         pygame.draw.rect(self.screen, (0, 0, 0, 180), value_rect, border_radius=8)
         pygame.draw.rect(self.screen, TET_GOLD, value_rect, 2, border_radius=8)
         
-        value_text = self.small_font.render(f"💰 {self.total_value}", True, TET_GOLD)
+        value_text = render_text(self.small_font, f"💰 {self.total_value}", TET_GOLD)
         self.screen.blit(value_text, (SCREEN_WIDTH - 120, 18))
         
         # Mode label
-        mode_text = self.small_font.render("🧧 SĂN LÌ XÌ", True, TET_RED)
+        mode_text = render_text(self.small_font, "🧧 SĂN LÌ XÌ", TET_RED)
         self.screen.blit(mode_text, (SCREEN_WIDTH // 2 - mode_text.get_width() // 2, 55))
         
     def get_results(self):
@@ -768,7 +771,7 @@ class TimeAttackMode:
     
     def __init__(self, screen, difficulty="medium"):
         self.screen = screen
-        self.time_limit = 60000
+        self.time_limit = TIME_ATTACK_LIMIT
         self.start_time = 0
         self.remaining_time = self.time_limit
         self.is_active = False
@@ -806,6 +809,7 @@ class TimeAttackMode:
             pygame.draw.rect(self.screen, TET_GOLD, rect, 2, border_radius=10)
         
         color = ACCENT_COLOR if s <= 10 else (TET_GOLD if TET_MODE else WHITE)
+        # centiseconds change every frame, so bypass the shared text cache
         text = self.font.render(f"{s:02d}:{ms:02d}", True, color)
         self.screen.blit(text, (rect.centerx - text.get_width() // 2, rect.centery - text.get_height() // 2))
 
@@ -834,14 +838,14 @@ class ZenMode:
         
     def draw_hud(self):
         dist_text = f"Khoảng cách: {int(self.distance)}m" if TET_MODE else f"Distance: {int(self.distance)}m"
-        dist = self.font.render(dist_text, True, WHITE)
+        dist = render_text(self.font, dist_text, WHITE)
         self.screen.blit(dist, (20, 20))
         
-        coins = self.font.render(f"Xu: {self.coins_collected}" if TET_MODE else f"Coins: {self.coins_collected}", True, COIN_COLOR)
+        coins = render_text(self.font, f"Xu: {self.coins_collected}" if TET_MODE else f"Coins: {self.coins_collected}", COIN_COLOR)
         self.screen.blit(coins, (SCREEN_WIDTH - 120, 20))
         
         zen_text = "CHẾ ĐỘ THIỀN" if TET_MODE else "ZEN MODE"
-        zen = self.font.render(zen_text, True, (150, 200, 255))
+        zen = render_text(self.font, zen_text, (150, 200, 255))
         self.screen.blit(zen, (SCREEN_WIDTH // 2 - zen.get_width() // 2, 20))
 
 
@@ -853,8 +857,7 @@ class DailyChallenge:
         self.font = get_vn_font(24)
         import datetime
         today = datetime.date.today()
-        random.seed(today.toordinal())
-        target = random.randint(10, 25)
+        target = random.Random(today.toordinal()).randint(10, 25)
         
         if TET_MODE:
             self.active_challenge = {"type": "score", "target": target, "current": 0, 
@@ -887,5 +890,5 @@ class DailyChallenge:
         bar_color = TET_RED if TET_MODE else PRIMARY_COLOR
         pygame.draw.rect(self.screen, bar_color, (rect.x + 5, rect.y + 28, pw, 6), border_radius=3)
         
-        desc = self.font.render(self.active_challenge["desc"], True, WHITE)
+        desc = render_text(self.font, self.active_challenge["desc"], WHITE)
         self.screen.blit(desc, (rect.x + 10, rect.y + 6))
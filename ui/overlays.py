@@ -0,0 +1,57 @@
+import pygame
+from settings import *
+from utils.cache import LRUCache
+
+# Shared overlay and panel surfaces
+# Menus and dialogs dim the screen and draw the same panel chrome every
+# frame; these are built once per look and reused as plain blits
+
+_surface_cache = LRUCache(32)
+
+
+def get_overlay(color, alpha, size=(SCREEN_WIDTH, SCREEN_HEIGHT), radius=0):
+    """Translucent fill surface keyed by (size, color, alpha, radius)"""
+    key = ("overlay", tuple(size), tuple(color[:3]), alpha, radius)
+    surf = _surface_cache.get(key)
+    if surf is None:
+        surf = pygame.Surface(size, pygame.SRCALPHA)
+        if radius:
+            pygame.draw.rect(surf, (*color[:3], alpha), surf.get_rect(), border_radius=radius)
+        else:
+            surf.fill((*color[:3], alpha))
+        _surface_cache.put(key, surf)
+    return surf
+
+
+def get_panel(size, color, border_color=None, border_width=3, radius=0, shadow_offset=0):
+    """Panel fill, border and drop shadow composited into one surface.
+
+    The panel's top-left corner sits at (0, 0); the shadow extends the
+    surface by shadow_offset to the right and bottom.
+    """
+    key = ("panel", tuple(size), tuple(color[:3]), border_color and tuple(border_color[:3]), border_width, radius, shadow_offset)
+    surf = _surface_cache.get(key)
+    if surf is None:
+        width, height = size
+        surf = pygame.Surface((width + shadow_offset, height + shadow_offset), pygame.SRCALPHA)
+        rect = pygame.Rect(0, 0, width, height)
+        if shadow_offset:
+            pygame.draw.rect(surf, BLACK, rect.move(shadow_offset, shadow_offset), border_radius=radius)
+        pygame.draw.rect(surf, color, rect, border_radius=radius)
+        if border_color:
+            pygame.draw.rect(surf, border_color, rect, border_width, border_radius=radius)
+        _surface_cache.put(key, surf)
+    return surf
+
+
+def draw_overlay(screen, color, alpha):
+    """Dim the whole screen"""
+    screen.blit(get_overlay(color, alpha, screen.get_size()), (0, 0))
+
+
+def draw_panel(screen, rect, color, border_color=None, border_width=3, radius=0, shadow_offset=0):
+    screen.blit(get_panel(rect.size, color, border_color, border_width, radius, shadow_offset), rect.topleft)
+
+
+def overlay_cache_stats():
+    return _surface_cache.stats()
@@ -0,0 +1,59 @@
+# Layered render queue
+# Draw code queues sprites on numbered layers instead of blitting them one
+# by one; flush() then submits each layer, lowest first, with a single
+# Surface.blits call. Sprites wholly outside the target's clip rect (the
+# screen, or the dirty region while dirty rects are on) are culled as they
+# are queued. Sprites are assumed to have rects the size of their images.
+
+LAYER_WORLD = 10
+LAYER_PICKUPS = 20
+LAYER_PROJECTILES = 30
+LAYER_ACTORS = 40
+
+
+class RenderQueue:
+    """(image, position) pairs per layer, blitted one layer per call"""
+
+    def __init__(self, surface):
+        self.surface = surface
+        self.layers = {}
+        self.order = []
+        self.queued = 0
+        self.culled = 0
+
+    def layer(self, layer):
+        items = self.layers.get(layer)
+        if items is None:
+            items = self.layers[layer] = []
+            self.order = sorted(self.layers)
+        return items
+
+    def add(self, image, dest, layer=LAYER_WORLD):
+        self.layer(layer).append((image, dest))
+
+    def add_sprites(self, sprites, layer=LAYER_WORLD, offset=None):
+        """Queue each sprite's image at its rect, shifted by offset, unless it is off-view"""
+        items = self.layer(layer)
+        view = self.surface.get_clip()
+        visible = view.colliderect
+        if offset:
+            dx, dy = offset
+            view.move_ip(-dx, -dy)
+            queued = [(s.image, (s.rect.x + dx, s.rect.y + dy)) for s in sprites if visible(s.rect)]
+        else:
+            queued = [(s.image, s.rect) for s in sprites if visible(s.rect)]
+        items += queued
+        self.queued += len(queued)
+        self.culled += len(sprites) - len(queued)
+
+    def flush(self):
+        """Blit every queued layer, lowest first, and empty the queue"""
+        blits = self.surface.blits
+        for layer in self.order:
+            items = self.layers[layer]
+            if items:
+                blits(items, doreturn=False)
+                items.clear()
+
+    def stats(self):
+        return {"queued": self.queued, "culled": self.culled}
@@ -1,6 +1,10 @@
 import pygame
 import os
 from settings import *
+from utils.fonts import render_text
+from sprites.bird import Bird
+from utils.sprite_cache import sprite_cache
+from utils.profiler import startup_trace
 
 class ShopMenu:
     """Enhanced skin shop menu with Tet theme and new skins"""
@@ -39,8 +43,10 @@ class ShopMenu:
         
     def preload_skins(self):
         """Pre-generate all skin preview images"""
-        for skin_id in SKINS.keys():
-            ShopMenu._skin_cache[skin_id] = self.create_skin_preview(skin_id)
+        with startup_trace.phase("preload_skins"):
+            for skin_id in SKINS.keys():
+                ShopMenu._skin_cache[skin_id] = sprite_cache.get(
+                    "skin_preview", (skin_id, TET_MODE), lambda: self.create_skin_preview(skin_id))
             
     def create_skin_preview(self, skin_id):
         """Create a skin preview programmatically"""
@@ -152,6 +158,12 @@ class ShopMenu:
     def update(self, mouse_pos):
         pass
         
+    def dirty_regions(self):
+        """Scene signature for dirty-rect drawing; the shop has no hover states"""
+        scene = (self.scroll_offset, self.selected_skin, self.game_data.coins, self.game_data.current_skin,
+                 len(self.game_data.unlocked_skins))
+        return scene, []
+        
     def draw(self, background, ground):
 
         bg_color = (50, 25, 35) if TET_MODE else (40, 44, 52)
@@ -166,13 +178,13 @@ class ShopMenu:
         
 
         title_text = "CỬA HÀNG SKIN" if TET_MODE else "SKIN SHOP"
-        title = self.title_font.render(title_text, True, WHITE)
+        title = render_text(self.title_font, title_text, WHITE)
         self.screen.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, 12))
         
 
         coin_label = "Xu:" if TET_MODE else "Coins:"
         coin_text = f"{coin_label} {self.game_data.coins}"
-        coin_surf = self.label_font.render(coin_text, True, COIN_COLOR)
+        coin_surf = render_text(self.label_font, coin_text, COIN_COLOR)
         self.screen.blit(coin_surf, (SCREEN_WIDTH - 110, 22))
         
 
@@ -182,7 +194,7 @@ class ShopMenu:
             pygame.draw.rect(self.screen, TET_GOLD, self.back_button_rect, 2, border_radius=8)
         
         back_text_str = "VỀ" if TET_MODE else "BACK"
-        back_text = self.small_font.render(back_text_str, True, WHITE)
+        back_text = render_text(self.small_font, back_text_str, WHITE)
         self.screen.blit(back_text, (self.back_button_rect.centerx - back_text.get_width() // 2,
                                      self.back_button_rect.centery - back_text.get_height() // 2))
         
@@ -203,7 +215,7 @@ class ShopMenu:
         pygame.draw.rect(self.screen, TET_RED, banner_rect, border_radius=4)
         
         banner_text = "🧧 Skin Tết 2026 - Giảm giá đặc biệt! 🧧"
-        text = self.small_font.render(banner_text, True, TET_GOLD)
+        text = render_text(self.small_font, banner_text, TET_GOLD)
         self.screen.blit(text, (SCREEN_WIDTH // 2 - text.get_width() // 2, 70))
             
     def draw_skin_cards(self):
@@ -262,7 +274,7 @@ class ShopMenu:
                 self.screen.blit(preview, preview_rect)
             
 
-            name = self.small_font.render(skin_info["name"], True, WHITE)
+            name = render_text(self.small_font, skin_info["name"], WHITE)
             self.screen.blit(name, (rect.centerx - name.get_width() // 2, rect.y + 70))
             
 
@@ -276,7 +288,7 @@ class ShopMenu:
                 status_text = f"{skin_info['price']}"
                 status_color = COIN_COLOR
                 
-            status = self.small_font.render(status_text, True, status_color)
+            status = render_text(self.small_font, status_text, status_color)
             self.screen.blit(status, (rect.centerx - status.get_width() // 2, rect.y + 92))
                 
     def draw_selected_panel(self):
@@ -297,7 +309,7 @@ class ShopMenu:
         pygame.draw.rect(self.screen, border_color, (0, SCREEN_HEIGHT - 120, SCREEN_WIDTH, 3))
         
 
-        desc = self.label_font.render(skin_info["description"], True, WHITE)
+        desc = render_text(self.label_font, skin_info["description"], WHITE)
         self.screen.blit(desc, (20, SCREEN_HEIGHT - 110))
         
 
@@ -305,12 +317,12 @@ class ShopMenu:
             ability_name = skin_info['ability'].replace('_', ' ').title()
             ability_label = "Kỹ năng:" if TET_MODE else "Ability:"
             ability_text = f"{ability_label} {ability_name}"
-            ability = self.small_font.render(ability_text, True, PRIMARY_COLOR)
+            ability = render_text(self.small_font, ability_text, PRIMARY_COLOR)
             self.screen.blit(ability, (20, SCREEN_HEIGHT - 85))
         
 
         if is_tet_exclusive:
-            tet_note = self.small_font.render("🧧 Skin độc quyền Tết 2026!", True, TET_GOLD)
+            tet_note = render_text(self.small_font, "🧧 Skin độc quyền Tết 2026!", TET_GOLD)
             self.screen.blit(tet_note, (20, SCREEN_HEIGHT - 65))
         
 
@@ -328,7 +340,7 @@ class ShopMenu:
             if TET_MODE:
                 pygame.draw.rect(self.screen, TET_GOLD, self.action_button_rect, 2, border_radius=8)
             
-            text = self.label_font.render(btn_text, True, WHITE)
+            text = render_text(self.label_font, btn_text, WHITE)
             self.screen.blit(text, (self.action_button_rect.centerx - text.get_width() // 2,
                                     self.action_button_rect.centery - text.get_height() // 2))
             
@@ -346,6 +358,7 @@ class ShopMenu:
                 
                 if rect.collidepoint(pos):
                     self.selected_skin = card["id"]
+                    Bird.prebuild(self.selected_skin)
                     return None
             
 
@@ -0,0 +1,30 @@
+import pygame
+
+# Time sources for game logic
+# Sprites ask their clock for ticks instead of calling pygame.time.get_ticks()
+# directly, so the same code can run in real time or in fixed simulation steps
+
+
+class SystemClock:
+    """Real-time clock backed by pygame.time.get_ticks"""
+
+    def get_ticks(self):
+        return pygame.time.get_ticks()
+
+
+class FixedStepClock:
+    """Deterministic clock that only moves when advanced"""
+
+    def __init__(self, start=0):
+        self.ticks = start
+
+    def get_ticks(self):
+        return int(self.ticks)
+
+    def advance(self, ms):
+        """Move the clock forward by ms milliseconds"""
+        self.ticks += ms
+        return self.get_ticks()
+
+
+system_clock = SystemClock()
@@ -0,0 +1,91 @@
+import os
+import json
+import pygame
+
+# On-disk cache for generated assets
+# Procedural textures are saved as PNGs under .cache/ so later launches can
+# load them instead of drawing them again. This module does not import
+# settings so that settings-level helpers can use it too. Cache failures
+# (read-only or in-memory filesystems, corrupt files) fall back to
+# building the asset. FLAPPY_CACHE_DIR points the cache elsewhere.
+
+CACHE_DIR = os.environ.get("FLAPPY_CACHE_DIR") or os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache")
+DISK_CACHE_ENABLED = True
+
+
+def cache_path(name, extension=".png"):
+    return os.path.join(CACHE_DIR, name + extension)
+
+
+def surface_key(name, theme, size, version=1):
+    """File name for a texture keyed by theme and size"""
+    width, height = size
+    return f"{name}-{theme}-{width}x{height}-v{version}"
+
+
+def load_surface(name):
+    """Cached surface converted for the display, or None"""
+    if not DISK_CACHE_ENABLED:
+        return None
+    path = cache_path(name)
+    if not os.path.exists(path):
+        return None
+    try:
+        surf = pygame.image.load(path)
+    except (pygame.error, OSError):
+        return None
+    if pygame.display.get_surface() is not None:
+        surf = surf.convert_alpha() if surf.get_flags() & pygame.SRCALPHA else surf.convert()
+    return surf
+
+
+def save_surface(name, surf):
+    """Write a surface to the cache, ignoring filesystem errors"""
+    if not DISK_CACHE_ENABLED:
+        return
+    path = cache_path(name)
+    temp_path = f"{path}.{os.getpid()}.tmp.png"
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        pygame.image.save(surf, temp_path)
+        os.replace(temp_path, path)
+    except (pygame.error, OSError):
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def cached_surface(name, factory):
+    """Load a surface from the cache or build it with factory() and store it"""
+    surf = load_surface(name)
+    if surf is None:
+        surf = factory()
+        save_surface(name, surf)
+    return surf
+
+
+def load_json(name):
+    """Cached JSON document, or None"""
+    if not DISK_CACHE_ENABLED:
+        return None
+    try:
+        with open(cache_path(name, ".json"), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_json(name, data):
+    """Write a JSON document to the cache, ignoring filesystem errors"""
+    if not DISK_CACHE_ENABLED:
+        return
+    path = cache_path(name, ".json")
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(temp_path, path)
+    except OSError:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
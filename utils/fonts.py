@@ -1,51 +1,202 @@
 import pygame
 import os
+import sys
+from utils.cache import LRUCache
+from utils.profiler import startup_trace
+from utils.disk_cache import load_json, save_json
 
 # Font helper for Vietnamese Unicode support
 # Pygame's default font doesn't support Vietnamese characters
 # We need to use system fonts that support Unicode
 
-_font_cache = {}
+# List of fallback fonts that support Vietnamese
+VIETNAMESE_FONTS = [
+    "segoeuiemoji",  # Windows - has emoji + unicode
+    "segoeui",       # Windows Segoe UI
+    "arial",         # Common fallback
+    "arialunicode",  # Arial Unicode MS
+    "tahoma",        # Tahoma
+    "msyh",          # Microsoft YaHei
+    "noto",          # Noto Sans (if installed)
+    "dejavusans",    # DejaVu Sans
+]
 
-def get_vietnamese_font(size):
-    """Get a font that supports Vietnamese characters"""
-    if size in _font_cache:
-        return _font_cache[size]
-    
-    # List of fallback fonts that support Vietnamese
-    vietnamese_fonts = [
-        "segoeuiemoji",  # Windows - has emoji + unicode
-        "segoeui",       # Windows Segoe UI
-        "arial",         # Common fallback
-        "arialunicode",  # Arial Unicode MS
-        "tahoma",        # Tahoma
-        "msyh",          # Microsoft YaHei
-        "noto",          # Noto Sans (if installed)
-        "dejavusans",    # DejaVu Sans
-        None             # Pygame default as last resort
-    ]
-    
-    font = None
-    for font_name in vietnamese_fonts:
+# Resolved font index
+# Scanning system fonts is slow on Linux with many fonts installed, so the
+# chosen font file and its Vietnamese glyph coverage are kept in the disk
+# cache and later launches open that file directly
+FONT_INDEX_NAME = "font_index"
+FONT_INDEX_VERSION = 1
+VIETNAMESE_SAMPLE = (
+    "ăâđêôơưĂÂĐÊÔƠƯ"
+    "áàảãạấầẩẫậắằẳẵặéèẻẽẹếềểễệíìỉĩị"
+    "óòỏõọốồổỗộớờởỡợúùủũụứừửữựýỳỷỹỵ"
+)
+_font_index = None
+
+# Rendered text surfaces keyed by (font, text, color, antialias)
+# Static labels render once; changing strings such as the score only
+# re-render when their text changes
+TEXT_CACHE_SIZE = 512
+_text_cache = LRUCache(TEXT_CACHE_SIZE)
+
+def glyph_coverage(font, sample=VIETNAMESE_SAMPLE):
+    """Share of sample characters the font draws with a real glyph"""
+    missing = pygame.image.tobytes(font.render("\ue000", True, (255, 255, 255)), "RGBA")
+    covered = 0
+    for char in sample:
+        if pygame.image.tobytes(font.render(char, True, (255, 255, 255)), "RGBA") != missing:
+            covered += 1
+    return covered / len(sample)
+
+
+def scan_vietnamese_font():
+    """Search installed fonts for the best Vietnamese coverage"""
+    best = {"name": None, "path": None, "coverage": glyph_coverage(pygame.font.Font(None, 16))}
+    for font_name in VIETNAMESE_FONTS:
+        path = pygame.font.match_font(font_name)
+        if not path:
+            continue
         try:
-            if font_name:
-                font = pygame.font.SysFont(font_name, size)
-                # Test if font can render Vietnamese
-                test_surf = font.render("Xin Chào", True, (255, 255, 255))
-                if test_surf.get_width() > 10:
-                    _font_cache[size] = font
-                    return font
-            else:
-                font = pygame.font.Font(None, size)
-                _font_cache[size] = font
-                return font
-        except:
+            coverage = glyph_coverage(pygame.font.Font(path, 16))
+        except (pygame.error, OSError):
             continue
-    
-    # Fallback to default
-    font = pygame.font.Font(None, size)
-    _font_cache[size] = font
-    return font
+        if coverage > best["coverage"]:
+            best = {"name": font_name, "path": path, "coverage": coverage}
+        if coverage >= 1.0:
+            break
+    return best
+
+
+def is_valid_font_index(index):
+    return (
+        isinstance(index, dict)
+        and index.get("version") == FONT_INDEX_VERSION
+        and index.get("platform") == sys.platform
+        and index.get("candidates") == VIETNAMESE_FONTS
+        and (index.get("path") is None or os.path.exists(index["path"]))
+    )
+
+
+def resolve_vietnamese_font():
+    """Index entry of the Vietnamese font, scanning only when none is stored"""
+    global _font_index
+    if _font_index is None:
+        index = load_json(FONT_INDEX_NAME)
+        if not is_valid_font_index(index):
+            with startup_trace.phase("font scan"):
+                index = scan_vietnamese_font()
+            index.update(version=FONT_INDEX_VERSION, platform=sys.platform, candidates=VIETNAMESE_FONTS)
+            save_json(FONT_INDEX_NAME, index)
+        _font_index = index
+    return _font_index
+
+
+def font_file_size(path):
+    """Bytes of the font file behind a Font; None means pygame's bundled font"""
+    if path is None:
+        path = os.path.join(os.path.dirname(pygame.__file__), pygame.font.get_default_font())
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+class FontManager:
+    """The one cache of Font objects, keyed by font file and size"""
+
+    def __init__(self):
+        self.fonts = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, size, vietnamese=True):
+        """Font of the given size; vietnamese=False gives pygame's default face"""
+        path = resolve_vietnamese_font()["path"] if vietnamese else None
+        key = (path, size)
+        font = self.fonts.get(key)
+        if font is None:
+            self.misses += 1
+            with startup_trace.phase(f"font {size}"):
+                font = self.load(path, size)
+            self.fonts[key] = font
+        else:
+            self.hits += 1
+        return font
+
+    @staticmethod
+    def load(path, size):
+        try:
+            return pygame.font.Font(path, size)
+        except (pygame.error, OSError):
+            return pygame.font.Font(None, size)
+
+    def metrics(self, size, vietnamese=True):
+        """Vertical metrics of a cached font"""
+        font = self.get(size, vietnamese)
+        return {
+            "height": font.get_height(),
+            "linesize": font.get_linesize(),
+            "ascent": font.get_ascent(),
+            "descent": font.get_descent(),
+        }
+
+    def coverage(self):
+        """Vietnamese glyph coverage of the resolved font, 0..1"""
+        return resolve_vietnamese_font()["coverage"]
+
+    def memory_usage(self):
+        """Approximate bytes held by loaded fonts; each Font keeps its own copy of the face"""
+        return sum(font_file_size(path) for path, size in self.fonts)
+
+    def clear(self):
+        self.fonts.clear()
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "size": len(self.fonts),
+            "faces": len({path for path, size in self.fonts}),
+            "bytes": self.memory_usage(),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
+font_manager = FontManager()
+
+
+def get_vietnamese_font(size):
+    """Get a font that supports Vietnamese characters"""
+    return font_manager.get(size)
+
+
+# settings re-exports this name to every module
+get_vn_font = get_vietnamese_font
+
+
+def get_default_font(size):
+    """pygame's bundled font, shared like every other font"""
+    return font_manager.get(size, vietnamese=False)
+
+
+def render_text(font, text, color, antialias=True):
+    """Render text through the shared surface cache.
+
+    The returned surface is shared; callers may set its alpha before a blit
+    but must not draw onto it.
+    """
+    key = (font, text, color, antialias)
+    surf = _text_cache.get(key)
+    if surf is None:
+        surf = _text_cache.put(key, font.render(text, antialias, color))
+    return surf
+
+
+def text_cache_stats():
+    """Hit/miss counters of the text surface cache"""
+    return _text_cache.stats()
 
 
 def get_font(size, bold=False):
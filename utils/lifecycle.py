@@ -0,0 +1,64 @@
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT, VIEWPORT_MARGIN
+
+# Viewport lifecycle
+# Scrolling, falling and flying entities despawn once their bounds are
+# wholly past the screen, grown by VIEWPORT_MARGIN, on a side they are
+# heading towards. Entities spawned off-screen and moving in (pipes at the
+# right edge, obstacles above the top) are therefore never culled early.
+# Every despawn is counted per kind for the frame profiler.
+
+
+class Lifecycle:
+    """Viewport bounds test with per-kind despawn counters"""
+
+    def __init__(self, width=SCREEN_WIDTH, height=SCREEN_HEIGHT, margin=VIEWPORT_MARGIN):
+        self.width = width
+        self.height = height
+        self.culled = {}
+        self.set_margin(margin)
+
+    def set_margin(self, margin):
+        self.margin = margin
+        self.left, self.top = -margin, -margin
+        self.right, self.bottom = self.width + margin, self.height + margin
+
+    def outside(self, rect, dx=0, dy=0):
+        """True when rect is wholly past the viewport on a side it moves towards.
+
+        A zero dx or dy tests both sides of that axis.
+        """
+        if dx <= 0 and rect.right < self.left:
+            return True
+        if dx >= 0 and rect.left > self.right:
+            return True
+        if dy <= 0 and rect.bottom < self.top:
+            return True
+        return dy >= 0 and rect.top > self.bottom
+
+    def despawn(self, kind, rect, dx=0, dy=0):
+        """outside(), counting the entity under kind when it is"""
+        if self.outside(rect, dx, dy):
+            self.record(kind)
+            return True
+        return False
+
+    def despawn_all(self, kind, group):
+        """Empty a sprite group, e.g. leftover bullets once a round ends"""
+        if group:
+            self.record(kind, len(group))
+            group.empty()
+
+    def record(self, kind, count=1):
+        self.culled[kind] = self.culled.get(kind, 0) + count
+
+    def total(self):
+        return sum(self.culled.values())
+
+    def stats(self):
+        return dict(self.culled)
+
+    def reset(self):
+        self.culled.clear()
+
+
+lifecycle = Lifecycle()
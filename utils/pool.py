@@ -0,0 +1,74 @@
+import pygame
+
+# Sprite pooling
+# Short-lived sprites (bullets, falling obstacles, fragments, coins) are
+# handed back to a per-class free list when they leave their last group,
+# whether through kill(), Group.remove() or Group.empty(), and reused by
+# the next acquire() instead of constructing a new sprite and surface.
+# A pooled class puts all per-spawn state in reset(), which __init__ calls
+# and acquire() repeats on a recycled sprite.
+
+POOL_LIMIT = 256
+
+
+class SpritePool:
+    """Free list of released sprites of one class"""
+
+    def __init__(self, cls, limit=POOL_LIMIT):
+        self.cls = cls
+        self.limit = limit
+        self.free = []
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, *args, **kwargs):
+        """A recycled sprite reset with args, or a new one when none is free"""
+        if self.free:
+            sprite = self.free.pop()
+            sprite.reset(*args, **kwargs)
+            self.reused += 1
+        else:
+            sprite = self.cls(*args, **kwargs)
+            self.created += 1
+        return sprite
+
+    def release(self, sprite):
+        if len(self.free) < self.limit:
+            self.free.append(sprite)
+
+    def clear(self):
+        self.free.clear()
+
+    def stats(self):
+        return {"free": len(self.free), "created": self.created, "reused": self.reused}
+
+
+class PooledSprite(pygame.sprite.Sprite):
+    """Sprite that returns to its class's pool when it leaves its last group.
+
+    Callers must not keep using a sprite after killing it past the current
+    frame, since a later acquire() may hand it out again.
+    """
+
+    pool = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if not callable(getattr(cls, "reset", None)):
+            raise TypeError(f"{cls.__name__} must define reset() to be pooled")
+        cls.pool = SpritePool(cls)
+
+    @classmethod
+    def acquire(cls, *args, **kwargs):
+        return cls.pool.acquire(*args, **kwargs)
+
+    def kill(self):
+        # Sprite.kill clears its groups without calling remove_internal
+        if self.alive():
+            super().kill()
+            self.pool.release(self)
+
+    def remove_internal(self, group):
+        super().remove_internal(group)
+        if not self.alive():
+            self.pool.release(self)
@@ -0,0 +1,223 @@
+import os
+import sys
+import csv
+import json
+import time
+from collections import deque
+from contextlib import contextmanager
+
+# Startup tracing
+# Phases of start-up are always timed (a handful of perf_counter calls);
+# the report is only written when tracing is enabled with the
+# FLAPPY_STARTUP_TRACE environment variable or the --profile-startup flag.
+# Times are milliseconds since this module was imported, which main.py
+# does before anything else.
+
+STARTUP_TRACE_ENV = "FLAPPY_STARTUP_TRACE"
+DEFAULT_TRACE_FILE = "startup_trace.json"
+
+
+class StartupTrace:
+    """Nested wall-clock timings of start-up phases"""
+
+    def __init__(self, output=None):
+        self.origin = time.perf_counter()
+        self.output = output
+        self.phases = []
+        self.marks = {}
+        self.depth = 0
+        self.finished = False
+
+    @property
+    def enabled(self):
+        return self.output is not None
+
+    def enable(self, output=DEFAULT_TRACE_FILE):
+        self.output = output
+
+    def now(self):
+        return (time.perf_counter() - self.origin) * 1000
+
+    @contextmanager
+    def phase(self, name):
+        """Time the body of a with block as one phase"""
+        if self.finished:
+            yield
+            return
+        entry = {"name": name, "depth": self.depth, "start_ms": self.now(), "ms": 0.0}
+        self.phases.append(entry)
+        self.depth += 1
+        try:
+            yield
+        finally:
+            self.depth -= 1
+            entry["ms"] = self.now() - entry["start_ms"]
+
+    def mark(self, name):
+        """Record a point in time, e.g. the first presented frame"""
+        if not self.finished and name not in self.marks:
+            self.marks[name] = self.now()
+
+    def totals(self):
+        """Summed time per phase name"""
+        totals = {}
+        for entry in self.phases:
+            totals[entry["name"]] = totals.get(entry["name"], 0.0) + entry["ms"]
+        return totals
+
+    def report(self):
+        return {
+            "python": sys.version.split()[0],
+            "platform": sys.platform,
+            "marks": self.marks,
+            "totals": self.totals(),
+            "phases": self.phases,
+        }
+
+    def finish(self):
+        """Stop recording and write the report if tracing is enabled"""
+        if self.finished:
+            return None
+        self.finished = True
+        if not self.enabled:
+            return None
+        report = self.report()
+        try:
+            with open(self.output, "w") as f:
+                json.dump(report, f, indent=2)
+        except OSError as e:
+            print(f"startup trace not written: {e}")
+        return report
+
+
+def format_report(report):
+    lines = [f"{'phase':<32} {'start':>9} {'ms':>9}"]
+    for entry in report["phases"]:
+        name = "  " * entry["depth"] + entry["name"]
+        lines.append(f"{name:<32} {entry['start_ms']:>9.1f} {entry['ms']:>9.1f}")
+    for name, at in report["marks"].items():
+        lines.append(f"{'@ ' + name:<32} {at:>9.1f}")
+    return "\n".join(lines)
+
+
+startup_trace = StartupTrace(os.environ.get(STARTUP_TRACE_ENV) or None)
+if startup_trace.output == "1":
+    startup_trace.enable()
+
+
+# Frame profiling
+# Each frame is split into named sections (events, update, draw, flip and
+# finer "update.*" timers inside the simulation) plus counters such as
+# particle counts and cache hit rates. Sections are reusable objects that
+# do nothing while the profiler is off, so they can stay in hot paths.
+
+FRAME_HISTORY = 3600
+
+
+class ProfileSection:
+    """Context manager adding its elapsed time to the current frame"""
+
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        if self.profiler.enabled:
+            self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        if self.profiler.enabled and self.start:
+            self.profiler.add(self.name, (time.perf_counter() - self.start) * 1000)
+            self.start = 0.0
+        return False
+
+
+class FrameProfiler:
+    """Per-frame section timings and counters, kept for the last few thousand frames"""
+
+    def __init__(self, history=FRAME_HISTORY):
+        self.visible = False
+        self.recording = False
+        self.frames = deque(maxlen=history)
+        self.sections = {}
+        self.current = {}
+        self.frame = 0
+        self.frame_start = 0.0
+
+    @property
+    def enabled(self):
+        return self.visible or self.recording
+
+    def toggle(self):
+        self.visible = not self.visible
+        return self.visible
+
+    def section(self, name):
+        section = self.sections.get(name)
+        if section is None:
+            section = self.sections[name] = ProfileSection(self, name)
+        return section
+
+    def add(self, name, ms):
+        self.current[name] = self.current.get(name, 0.0) + ms
+
+    def lap(self, name, start):
+        """Charge the time since start to name; returns the new start"""
+        now = time.perf_counter()
+        self.add(name, (now - start) * 1000)
+        return now
+
+    def begin_frame(self):
+        self.current = {}
+        self.frame_start = time.perf_counter()
+
+    def end_frame(self, counters=None):
+        """Store the finished frame with its counters"""
+        if not self.enabled:
+            return
+        record = {"frame": self.frame, "total": (time.perf_counter() - self.frame_start) * 1000}
+        record.update(self.current)
+        if counters:
+            record.update(counters)
+        self.frames.append(record)
+        self.frame += 1
+
+    def averages(self, count=60):
+        """Mean of every numeric field over the last count frames"""
+        recent = list(self.frames)[-count:]
+        sums = {}
+        for record in recent:
+            for name, value in record.items():
+                if name != "frame":
+                    sums[name] = sums.get(name, 0.0) + value
+        return {name: value / len(recent) for name, value in sums.items()}
+
+    def columns(self):
+        names = []
+        for record in self.frames:
+            for name in record:
+                if name not in names:
+                    names.append(name)
+        return names
+
+    def export(self, path):
+        """Write the frame history as CSV, or JSON when path ends in .json"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if path.endswith(".json"):
+            with open(path, "w") as f:
+                json.dump(list(self.frames), f)
+        else:
+            with open(path, "w", newline="") as f:
+                writer = csv.DictWriter(f, fieldnames=self.columns(), restval="")
+                writer.writeheader()
+                writer.writerows(self.frames)
+        return path
+
+
+frame_profiler = FrameProfiler()
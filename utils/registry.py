@@ -0,0 +1,63 @@
+import importlib
+import time
+
+# Lazily built game objects
+# Menus and modes are registered as "module:Class" plus constructor
+# arguments and only imported and constructed when first used, so the
+# main menu can draw its first frame sooner. Anything still unbuilt can be
+# prewarmed one object at a time while the player idles in a menu.
+
+
+class LazyRegistry:
+    """Named objects imported and built on first use"""
+
+    def __init__(self):
+        self.factories = {}
+        self.instances = {}
+        self.build_times = {}
+
+    def register(self, name, target, *args, **kwargs):
+        """Register target ("module:Class") to be built with args on first use"""
+        self.factories[name] = (target, args, kwargs)
+
+    def build(self, name):
+        target, args, kwargs = self.factories[name]
+        module_name, _, class_name = target.partition(":")
+        start = time.perf_counter()
+        cls = getattr(importlib.import_module(module_name), class_name)
+        instance = self.instances[name] = cls(*args, **kwargs)
+        self.build_times[name] = (time.perf_counter() - start) * 1000
+        return instance
+
+    def get(self, name):
+        instance = self.instances.get(name)
+        if instance is None:
+            instance = self.build(name)
+        return instance
+
+    def is_built(self, name):
+        return name in self.instances
+
+    def pending(self):
+        """Registered names not built yet, in registration order"""
+        return [name for name in self.factories if name not in self.instances]
+
+    def prewarm_step(self):
+        """Build the next pending object; returns its name or None when done"""
+        for name in self.factories:
+            if name not in self.instances:
+                self.build(name)
+                return name
+        return None
+
+
+class LazyAttribute:
+    """Class attribute that reads its value from the owner's registry"""
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        return obj.registry.get(self.name)
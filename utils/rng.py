@@ -0,0 +1,39 @@
+import random
+
+# Seeded random streams
+# Each subsystem draws from its own named stream derived from one run seed,
+# so a run can be reproduced from its seed and cosmetic effects never shift
+# the numbers gameplay sees
+
+
+def new_seed():
+    """Fresh 32-bit run seed from the OS entropy source"""
+    return random.SystemRandom().getrandbits(32)
+
+
+class RNGService:
+    """Per-subsystem random streams seeded from one run seed"""
+
+    def __init__(self, seed=None):
+        self.streams = {}
+        self.reseed(seed)
+
+    def reseed(self, seed=None):
+        """Start a new run; existing streams are reseeded in place"""
+        self.seed = new_seed() if seed is None else seed
+        for name, stream in self.streams.items():
+            stream.seed(self.stream_seed(name))
+        return self.seed
+
+    def stream_seed(self, name):
+        return f"{self.seed}:{name}"
+
+    def stream(self, name):
+        """random.Random for a subsystem, created on first use"""
+        stream = self.streams.get(name)
+        if stream is None:
+            stream = self.streams[name] = random.Random(self.stream_seed(name))
+        return stream
+
+
+rng_service = RNGService()
@@ -0,0 +1,118 @@
+import hashlib
+import pygame
+from utils.disk_cache import load_surface, save_surface, load_json, save_json
+from utils.profiler import startup_trace
+
+# Persistent cache for procedurally drawn sprites
+# Each sprite is addressed by a hash of its generator name, parameters and
+# SPRITE_CACHE_VERSION. All sprites are packed into one atlas PNG with a
+# JSON index next to it, so a warm start does a single image load instead
+# of redrawing every sprite from primitives.
+
+# Bump when any generator's drawing code changes
+SPRITE_CACHE_VERSION = 1
+ATLAS_NAME = "sprite_atlas"
+ATLAS_WIDTH = 512
+ATLAS_PADDING = 1
+
+
+def sprite_key(generator, params=()):
+    """Content address for one generated sprite"""
+    text = repr((generator, tuple(params), SPRITE_CACHE_VERSION))
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:16]
+
+
+def pack_shelves(sizes, width=ATLAS_WIDTH, padding=ATLAS_PADDING):
+    """Shelf-pack (key, (w, h)) pairs; returns ({key: (x, y)}, atlas height)"""
+    positions = {}
+    x = y = shelf_height = 0
+    for key, (w, h) in sorted(sizes, key=lambda item: -item[1][1]):
+        if x and x + w > width:
+            x = 0
+            y += shelf_height + padding
+            shelf_height = 0
+        positions[key] = (x, y)
+        x += w + padding
+        shelf_height = max(shelf_height, h)
+    return positions, y + shelf_height
+
+
+class SpriteCache:
+    """Generated sprites shared across instances and launches"""
+
+    def __init__(self, name=ATLAS_NAME):
+        self.name = name
+        self.sprites = {}
+        self.loaded = False
+        self.dirty = False
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, generator, params, factory):
+        """Sprite for generator(params), drawn by factory() on a cache miss.
+
+        The returned surface is shared; callers must copy it before drawing
+        on it.
+        """
+        if not self.loaded:
+            self.load()
+        key = sprite_key(generator, params)
+        surf = self.sprites.get(key)
+        if surf is None:
+            self.misses += 1
+            surf = self.sprites[key] = factory()
+            self.dirty = True
+        else:
+            self.hits += 1
+        return surf
+
+    def load(self):
+        """Unpack the atlas written by a previous launch"""
+        self.loaded = True
+        with startup_trace.phase("sprite_atlas"):
+            self.unpack()
+
+    def unpack(self):
+        index = load_json(self.name)
+        if not index or index.get("version") != SPRITE_CACHE_VERSION:
+            return
+        atlas = load_surface(self.name)
+        if atlas is None:
+            return
+        bounds = atlas.get_rect()
+        for key, rect in index.get("sprites", {}).items():
+            rect = pygame.Rect(rect)
+            if key not in self.sprites and bounds.contains(rect):
+                self.sprites[key] = atlas.subsurface(rect).copy()
+
+    def save(self):
+        """Write every known sprite into one atlas if anything new was drawn"""
+        if not self.dirty or not self.sprites:
+            return
+        sizes = [(key, surf.get_size()) for key, surf in self.sprites.items()]
+        positions, height = pack_shelves(sizes)
+        atlas = pygame.Surface((ATLAS_WIDTH, max(1, height)), pygame.SRCALPHA)
+        index = {}
+        for key, surf in self.sprites.items():
+            x, y = positions[key]
+            # MAX onto the cleared atlas copies RGBA exactly instead of blending
+            atlas.blit(surf, (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+            index[key] = [x, y, *surf.get_size()]
+        save_surface(self.name, atlas)
+        save_json(self.name, {"version": SPRITE_CACHE_VERSION, "sprites": index})
+        self.dirty = False
+
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self):
+        return {
+            "size": len(self.sprites),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate(),
+        }
+
+
+sprite_cache = SpriteCache()